@@ -1,18 +1,66 @@
 from fastapi import UploadFile
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy import or_, func, cast, String
+from pydantic import BaseModel
+from sqlalchemy import or_, func, cast, String, update, select
 from sqlalchemy.orm import Session, joinedload, selectinload
 
 from app.exceptions import *
 from app.schemas.account import *
-from app.enums.all import AccountRole
+from app.enums.all import AccountRole, AccountStatusOutcome
 from app.models.all import *
-from app.models.account import DEFAULT_SYSAD_EMAIL
+from app.models.account import DEFAULT_SYSAD_EMAIL, ROLE_PROFILE_RELATIONSHIPS
 from app.crud.school import get_school_by_id, get_schools
-from app.utils.model import paginate, to_pymodels
-from app.utils.password import hash_password, generate_password
+from app.crud.stored_file import acquire_stored_files
+from app.utils.model import paginate, to_pymodels, get_load_options
+from app.utils.password import hash_password, hash_password_async, generate_password
+from app.utils.principal import invalidate_principal
+from app.utils.totals import invalidate_totals
+from app.utils.search import plan_search, refresh_search_document
 from app.utils.storage import Upload, UploadManager, DestFolder
 
+COMPANY_LOGO_MIMES = {"image/png", "image/jpg", "image/jpeg"}
+COMPANY_DOCUMENT_MIMES = {"application/pdf"}
+
+# a company's signup files, the folder each one goes to and the types it takes
+COMPANY_SIGNUP_FILES = {
+    "logo_file": (DestFolder.LOGO, COMPANY_LOGO_MIMES),
+    "sec_file": (DestFolder.SEC, COMPANY_DOCUMENT_MIMES),
+    "profile_file": (DestFolder.PROFILE, COMPANY_DOCUMENT_MIMES),
+    "business_permit_file": (DestFolder.BUSINESS_PERMIT, COMPANY_DOCUMENT_MIMES),
+    "list_of_vacancies_file": (DestFolder.LIST_OF_VACANCIES, COMPANY_DOCUMENT_MIMES),
+    "cert_from_dole_file": (DestFolder.CERT_FROM_DOLE, COMPANY_DOCUMENT_MIMES),
+    "cert_of_no_pending_case_file": (DestFolder.CERT_OF_NO_PENDING_CASE, COMPANY_DOCUMENT_MIMES),
+    "reg_dti_cda_file": (DestFolder.REG_DTI_CDA, COMPANY_DOCUMENT_MIMES),
+    "reg_of_est_file": (DestFolder.REG_OF_EST, COMPANY_DOCUMENT_MIMES),
+    "reg_philjobnet_file": (DestFolder.REG_PHILJOBNET, COMPANY_DOCUMENT_MIMES),
+}
+
+# eager loads for the profile of each role (and what its output schema nests) on single account lookups
+ROLE_PROFILE_LOADERS = {
+    AccountRole.SYSTEM_ADMINISTRATOR: selectinload(Account.system_admin_profile),
+    AccountRole.DEAN: selectinload(Account.dean_profile).joinedload(DeanProfile.school),
+    AccountRole.PESO_STAFF: selectinload(Account.peso_staff_profile),
+    AccountRole.COMPANY: selectinload(Account.company_profile),
+    AccountRole.ALUMNI: selectinload(Account.alumni_profile).joinedload(AlumniProfile.course),
+}
+
+def get_profile_loader(role: AccountRole | None):
+    if role is None:
+        return joinedload(Account.system_admin_profile)
+
+    return ROLE_PROFILE_LOADERS[role]
+
+def get_account_load_options(role: AccountRole, pymodel) -> tuple:
+    """Loader options derived from the output model, so serializing a page never triggers a query."""
+
+    return get_load_options(
+        Account,
+        pymodel,
+        aliases=(("profile", getattr(Account, ROLE_PROFILE_RELATIONSHIPS[role])),),
+        include=(Account.created_at,)
+    )
+
 def get_account_by_id(
     db: Session,
     id: int,
@@ -21,7 +69,7 @@ def get_account_by_id(
     allow_none: bool=False,
     as_pymodel: bool=False
 ) -> Account | SystemAdminAccountOut:
-    query = db.query(Account).options(joinedload(Account.system_admin_profile)).filter(Account.id == id)
+    query = db.query(Account).options(get_profile_loader(role)).filter(Account.id == id)
 
     if role:
         query = query.filter(Account.role == role)
@@ -44,9 +92,14 @@ def get_account_by_email(
     *,
     role: AccountRole | None=None,
     allow_none: bool=False,
-    as_pymodel: bool=False
+    as_pymodel: bool=False,
+    use_primary: bool=False
 ) -> Account | SystemAdminAccountOut:
-    query = db.query(Account).options(joinedload(Account.system_admin_profile)).filter(Account.email == email)
+    query = db.query(Account).options(get_profile_loader(role)).filter(Account.email == email)
+
+    if use_primary:
+        # never from a lagging replica, e.g. a disable the replica hasn't seen yet
+        query = query.execution_options(use_primary=True)
 
     if role:
         query = query.filter(Account.role == role)
@@ -71,6 +124,8 @@ def get_system_admin_accounts(
     search: str | None=None,
     page: int=1,
     size: int=20,
+    cursor: str | None=None,
+    explain: bool=False,
     as_pymodels: bool=False
 ) -> list[Account] | dict:
     if not user.can_read_system_admins:
@@ -78,7 +133,7 @@ def get_system_admin_accounts(
 
     query = (
         db.query(Account)
-        .options(selectinload(Account.system_admin_profile))
+        .options(*get_account_load_options(AccountRole.SYSTEM_ADMINISTRATOR, SystemAdminAccountOut))
         .filter(
             Account.role == AccountRole.SYSTEM_ADMINISTRATOR,
             Account.email != DEFAULT_SYSAD_EMAIL
@@ -88,26 +143,29 @@ def get_system_admin_accounts(
     if is_disabled is not None:
         query = query.filter(Account.is_disabled == is_disabled)
     
-    if search:
-        query = (
-            query.distinct(Account.id)
-            .join(SystemAdminProfile, SystemAdminProfile.account_id == Account.id)
-            .filter(or_(
-                Account.email.ilike(f"%{search}%"),
-                SystemAdminProfile.first_name.ilike(f"%{search}%"),
-                func.coalesce(SystemAdminProfile.middle_name, "").ilike(f"%{search}%"),
-                SystemAdminProfile.last_name.ilike(f"%{search}%"),
-            ))
-        )
+    search_plan = plan_search(db, AccountRole.SYSTEM_ADMINISTRATOR, search)
+    query = search_plan.apply(query)
     
-    total, accounts = paginate(query, page=page, size=size, distinct_col=Account.id)
+    total, accounts, page_info = paginate(
+        query,
+        page=page,
+        size=size,
+        distinct_col=Account.id,
+        order_cols=(Account.created_at, Account.id),
+        cursor=cursor,
+        count_key=("accounts", AccountRole.SYSTEM_ADMINISTRATOR, is_disabled, search_plan.cache_key()),
+        estimate=not search,
+        rank=search_plan.rank
+    )
     
     if as_pymodels:
         return {
-            "page": page,
+            "page": None if cursor else page,
             "size": size,
             "total": total,
-            "items": to_pymodels(accounts, SystemAdminAccountOut)
+            **page_info,
+            "items": to_pymodels(accounts, SystemAdminAccountOut),
+            **({"search_plan": search_plan.explain()} if explain else {})
         }
         
     return accounts
@@ -120,6 +178,8 @@ def get_dean_accounts(
     search: str | None=None,
     page: int=1,
     size: int=20,
+    cursor: str | None=None,
+    explain: bool=False,
     as_pymodels: bool=False
 ) -> list[Account] | dict:
     if not user.can_read_deans:
@@ -127,35 +187,36 @@ def get_dean_accounts(
 
     query = (
         db.query(Account)
-        .options(selectinload(Account.dean_profile))
+        .options(*get_account_load_options(AccountRole.DEAN, DeanAccountOut))
         .filter(Account.role == AccountRole.DEAN)
     )
 
     if is_disabled is not None:
         query = query.filter(Account.is_disabled == is_disabled)
     
-    if search:
-        query = (
-            query.distinct(Account.id)
-            .join(DeanProfile, DeanProfile.account_id == Account.id)
-            .join(School, School.id == DeanProfile.school_id)
-            .filter(or_(
-                Account.email.ilike(f"%{search}%"),
-                School.name.ilike(f"%{search}%"),
-                DeanProfile.first_name.ilike(f"%{search}%"),
-                func.coalesce(DeanProfile.middle_name, "").ilike(f"%{search}%"),
-                DeanProfile.last_name.ilike(f"%{search}%"),
-            ))
-        )
+    search_plan = plan_search(db, AccountRole.DEAN, search)
+    query = search_plan.apply(query)
     
-    total, accounts = paginate(query, page=page, size=size, distinct_col=Account.id)
+    total, accounts, page_info = paginate(
+        query,
+        page=page,
+        size=size,
+        distinct_col=Account.id,
+        order_cols=(Account.created_at, Account.id),
+        cursor=cursor,
+        count_key=("accounts", AccountRole.DEAN, is_disabled, search_plan.cache_key()),
+        estimate=not search,
+        rank=search_plan.rank
+    )
     
     if as_pymodels:
         return {
-            "page": page,
+            "page": None if cursor else page,
             "size": size,
             "total": total,
-            "items": to_pymodels(accounts, DeanAccountOut)
+            **page_info,
+            "items": to_pymodels(accounts, DeanAccountOut),
+            **({"search_plan": search_plan.explain()} if explain else {})
         }
 
     return accounts
@@ -168,6 +229,8 @@ def get_peso_staff_accounts(
     search: str | None=None,
     page: int=1,
     size: int=20,
+    cursor: str | None=None,
+    explain: bool=False,
     as_pymodels: bool=False
 ) -> list[Account] | dict:
     if not user.can_read_peso_staffs:
@@ -175,33 +238,36 @@ def get_peso_staff_accounts(
 
     query = (
         db.query(Account)
-        .options(selectinload(Account.peso_staff_profile))
+        .options(*get_account_load_options(AccountRole.PESO_STAFF, PesoStaffAccountOut))
         .filter(Account.role == AccountRole.PESO_STAFF)
     )
     
     if is_disabled is not None:
         query = query.filter(Account.is_disabled == is_disabled)
     
-    if search:
-        query = (
-            query.distinct(Account.id)
-            .join(PesoStaffProfile, PesoStaffProfile.account_id == Account.id)
-            .filter(or_(
-                Account.email.ilike(f"%{search}%"),
-                PesoStaffProfile.first_name.ilike(f"%{search}%"),
-                func.coalesce(PesoStaffProfile.middle_name, "").ilike(f"%{search}%"),
-                PesoStaffProfile.last_name.ilike(f"%{search}%"),
-            ))
-        )
+    search_plan = plan_search(db, AccountRole.PESO_STAFF, search)
+    query = search_plan.apply(query)
     
-    total, accounts = paginate(query, page=page, size=size, distinct_col=Account.id)
+    total, accounts, page_info = paginate(
+        query,
+        page=page,
+        size=size,
+        distinct_col=Account.id,
+        order_cols=(Account.created_at, Account.id),
+        cursor=cursor,
+        count_key=("accounts", AccountRole.PESO_STAFF, is_disabled, search_plan.cache_key()),
+        estimate=not search,
+        rank=search_plan.rank
+    )
     
     if as_pymodels:
         return {
-            "page": page,
+            "page": None if cursor else page,
             "size": size,
             "total": total,
-            "items": to_pymodels(accounts, PesoStaffAccountOut)
+            **page_info,
+            "items": to_pymodels(accounts, PesoStaffAccountOut),
+            **({"search_plan": search_plan.explain()} if explain else {})
         }
         
     return accounts
@@ -214,6 +280,8 @@ def get_company_accounts(
     search: str | None=None,
     page: int=1,
     size: int=20,
+    cursor: str | None=None,
+    explain: bool=False,
     as_pymodels: bool=False
 ) -> list[Account] | dict:
     if not user.can_read_companies:
@@ -221,33 +289,36 @@ def get_company_accounts(
 
     query = (
         db.query(Account)
-        .options(selectinload(Account.company_profile))
+        .options(*get_account_load_options(AccountRole.COMPANY, CompanyAccountOut))
         .filter(Account.role == AccountRole.COMPANY)
     )
     
     if is_disabled is not None:
         query = query.filter(Account.is_disabled == is_disabled)
     
-    if search:
-        query = (
-            query.distinct(Account.id)
-            .join(CompanyProfile, CompanyProfile.account_id == Account.id)
-            .filter(or_(
-                CompanyProfile.name.ilike(f"%{search}%"),
-                cast(CompanyProfile.sysad_approval_status, String).ilike(f"%{search}%"),
-                cast(CompanyProfile.peso_staff_approval_status, String).ilike(f"%{search}%"),
-                Account.email.ilike(f"%{search}%"),
-            ))
-        )
+    search_plan = plan_search(db, AccountRole.COMPANY, search)
+    query = search_plan.apply(query)
     
-    total, accounts = paginate(query, page=page, size=size, distinct_col=Account.id)
+    total, accounts, page_info = paginate(
+        query,
+        page=page,
+        size=size,
+        distinct_col=Account.id,
+        order_cols=(Account.created_at, Account.id),
+        cursor=cursor,
+        count_key=("accounts", AccountRole.COMPANY, is_disabled, search_plan.cache_key()),
+        estimate=not search,
+        rank=search_plan.rank
+    )
     
     if as_pymodels:
         return {
-            "page": page,
+            "page": None if cursor else page,
             "size": size,
             "total": total,
-            "items": to_pymodels(accounts, CompanyAccountOut)
+            **page_info,
+            "items": to_pymodels(accounts, CompanyAccountOut),
+            **({"search_plan": search_plan.explain()} if explain else {})
         }
 
     return accounts
@@ -260,6 +331,8 @@ def get_alumni_accounts(
     is_disabled: bool | None=None,
     page: int=1,
     size: int=20,
+    cursor: str | None=None,
+    explain: bool=False,
     as_pymodels: bool=False
 ) -> list[Account] | dict:
     if not user.can_read_alumni:
@@ -267,72 +340,110 @@ def get_alumni_accounts(
 
     query = (
         db.query(Account)
-        .options(selectinload(Account.alumni_profile))
+        .options(*get_account_load_options(AccountRole.ALUMNI, AlumniAccountOut))
         .filter(Account.role == AccountRole.ALUMNI)
     )
 
     if is_disabled is not None:
         query = query.filter(Account.is_disabled == is_disabled)
     
-    if search:
-        query = (
-            query.distinct(Account.id)
-            .join(AlumniProfile, AlumniProfile.account_id == Account.id)
-            .join(Course, Course.id == AlumniProfile.course_id)
-            .filter(or_(
-                Course.name.ilike(f"%{search}%"),
-                Account.email.ilike(f"%{search}%"),
-                AlumniProfile.first_name.ilike(f"%{search}%"),
-                func.coalesce(AlumniProfile.middle_name, "").ilike(f"%{search}%"),
-                AlumniProfile.last_name.ilike(f"%{search}%"),
-                AlumniProfile.address.ilike(f"%{search}%"),
-                AlumniProfile.phone_number.ilike(f"%{search}%"),
-                cast(AlumniProfile.year_graduated, String).ilike(f"%{search}%"),
-                cast(AlumniProfile.employment_status, String).ilike(f"%{search}%"),
-                cast(AlumniProfile.dean_approval_status, String).ilike(f"%{search}%"),
-            ))
-        )
+    search_plan = plan_search(db, AccountRole.ALUMNI, search)
+    query = search_plan.apply(query)
     
-    total, accounts = paginate(query, page=page, size=size, distinct_col=Account.id)
+    total, accounts, page_info = paginate(
+        query,
+        page=page,
+        size=size,
+        distinct_col=Account.id,
+        order_cols=(Account.created_at, Account.id),
+        cursor=cursor,
+        count_key=("accounts", AccountRole.ALUMNI, is_disabled, search_plan.cache_key()),
+        estimate=not search,
+        rank=search_plan.rank
+    )
     
     if as_pymodels:
         return {
-            "page": page,
+            "page": None if cursor else page,
             "size": size,
             "total": total,
-            "items": to_pymodels(accounts, AlumniAccountOut)
+            **page_info,
+            "items": to_pymodels(accounts, AlumniAccountOut),
+            **({"search_plan": search_plan.explain()} if explain else {})
         }
     
     return accounts
 
+def set_account_disabled_by_id(
+    db: Session,
+    id: int,
+    *,
+    role: AccountRole,
+    is_disabled: bool,
+    pymodel=None
+) -> BaseModel | None:
+    """
+    Flips is_disabled with one conditional UPDATE. The reason a row wasn't updated (not found,
+    default system admin or already in that state) is only looked up when it wasn't. The account
+    and its profile are only loaded when a pymodel is given for the response body.
+    """
+
+    result = db.execute(
+        update(Account)
+        .where(
+            Account.id == id,
+            Account.role == role,
+            Account.is_disabled == (not is_disabled),
+            Account.email != DEFAULT_SYSAD_EMAIL
+        )
+        .values(is_disabled=is_disabled)
+        .execution_options(synchronize_session=False)
+    )
+
+    if result.rowcount == 0:
+        db_account = db.query(Account.email).filter(Account.id == id, Account.role == role).first()
+
+        if not db_account:
+            raise ACCOUNT_NOT_FOUND_EXCEPTION
+
+        # block request if the target account is the default system admin's account
+        if db_account.email == DEFAULT_SYSAD_EMAIL:
+            raise UNAUTHORIZED_ACCESS_EXCEPTION
+
+        raise ACCOUNT_ALREADY_DISABLED_EXCEPTION if is_disabled else ACCOUNT_ALREADY_ENABLED_EXCEPTION
+
+    db.commit()
+    invalidate_principal(id)
+    invalidate_totals("accounts", role)
+
+    if pymodel is None:
+        return None
+
+    db_account = (
+        db.query(Account)
+        .options(*get_account_load_options(role, pymodel))
+        .filter(Account.id == id)
+        .first()
+    )
+    return pymodel.model_validate(db_account)
+
 def disable_system_admin_account_by_id(
     db: Session,
     id: int,
     user: Account,
     *,
     as_pymodel: bool=False
-) -> Account | SystemAdminAccountOut:
+) -> SystemAdminAccountOut | None:
     if not user.can_enable_or_disable_system_admins:
         raise UNAUTHORIZED_ACCESS_EXCEPTION
     
-    # get account or block request if account is not found
-    db_account = get_account_by_id(db=db, id=id, role=AccountRole.SYSTEM_ADMINISTRATOR, allow_none=False)
-
-    # block request if the target account is the default system admin's account
-    if db_account.is_default_system_admin:
-        raise UNAUTHORIZED_ACCESS_EXCEPTION
-
-    if db_account.is_disabled:
-        raise ACCOUNT_ALREADY_DISABLED_EXCEPTION
-    
-    db_account.is_disabled = True
-    db.commit()
-    db.refresh(db_account, attribute_names=["system_admin_profile"])
-
-    if as_pymodel:
-        return SystemAdminAccountOut.model_validate(db_account)
-    
-    return db_account
+    return set_account_disabled_by_id(
+        db=db,
+        id=id,
+        role=AccountRole.SYSTEM_ADMINISTRATOR,
+        is_disabled=True,
+        pymodel=SystemAdminAccountOut if as_pymodel else None
+    )
 
 def disable_dean_account_by_id(
     db: Session,
@@ -340,28 +451,17 @@ def disable_dean_account_by_id(
     user: Account,
     *,
     as_pymodel: bool=False
-) -> Account | DeanAccountOut:
+) -> DeanAccountOut | None:
     if not user.can_enable_or_disable_deans:
         raise UNAUTHORIZED_ACCESS_EXCEPTION
     
-    # get account or block request if account is not found
-    db_account = get_account_by_id(db=db, id=id, role=AccountRole.DEAN, allow_none=False)
-
-    # block request if the target account is the default system admin's account
-    if db_account.is_default_system_admin:
-        raise UNAUTHORIZED_ACCESS_EXCEPTION
-
-    if db_account.is_disabled:
-        raise ACCOUNT_ALREADY_DISABLED_EXCEPTION
-    
-    db_account.is_disabled = True
-    db.commit()
-    db.refresh(db_account, attribute_names=["dean_profile"])
-
-    if as_pymodel:
-        return DeanAccountOut.model_validate(db_account)
-    
-    return db_account
+    return set_account_disabled_by_id(
+        db=db,
+        id=id,
+        role=AccountRole.DEAN,
+        is_disabled=True,
+        pymodel=DeanAccountOut if as_pymodel else None
+    )
 
 def disable_peso_staff_account_by_id(
     db: Session,
@@ -369,28 +469,17 @@ def disable_peso_staff_account_by_id(
     user: Account,
     *,
     as_pymodel: bool=False
-) -> Account | PesoStaffAccountOut:
+) -> PesoStaffAccountOut | None:
     if not user.can_enable_or_disable_peso_staffs:
         raise UNAUTHORIZED_ACCESS_EXCEPTION
     
-    # get account or block request if account is not found
-    db_account = get_account_by_id(db=db, id=id, role=AccountRole.PESO_STAFF, allow_none=False)
-
-    # block request if the target account is the default system admin's account
-    if db_account.is_default_system_admin:
-        raise UNAUTHORIZED_ACCESS_EXCEPTION
-
-    if db_account.is_disabled:
-        raise ACCOUNT_ALREADY_DISABLED_EXCEPTION
-    
-    db_account.is_disabled = True
-    db.commit()
-    db.refresh(db_account, attribute_names=["peso_staff_profile"])
-
-    if as_pymodel:
-        return PesoStaffAccountOut.model_validate(db_account)
-    
-    return db_account
+    return set_account_disabled_by_id(
+        db=db,
+        id=id,
+        role=AccountRole.PESO_STAFF,
+        is_disabled=True,
+        pymodel=PesoStaffAccountOut if as_pymodel else None
+    )
 
 def disable_company_account_by_id(
     db: Session,
@@ -398,28 +487,17 @@ def disable_company_account_by_id(
     user: Account,
     *,
     as_pymodel: bool=False
-) -> Account | CompanyAccountOut:
+) -> CompanyAccountOut | None:
     if not user.can_enable_or_disable_companies:
         raise UNAUTHORIZED_ACCESS_EXCEPTION
     
-    # get account or block request if account is not found
-    db_account = get_account_by_id(db=db, id=id, role=AccountRole.COMPANY, allow_none=False)
-
-    # block request if the target account is the default system admin's account
-    if db_account.is_default_system_admin:
-        raise UNAUTHORIZED_ACCESS_EXCEPTION
-
-    if db_account.is_disabled:
-        raise ACCOUNT_ALREADY_DISABLED_EXCEPTION
-    
-    db_account.is_disabled = True
-    db.commit()
-    db.refresh(db_account, attribute_names=["company_profile"])
-
-    if as_pymodel:
-        return CompanyAccountOut.model_validate(db_account)
-    
-    return db_account
+    return set_account_disabled_by_id(
+        db=db,
+        id=id,
+        role=AccountRole.COMPANY,
+        is_disabled=True,
+        pymodel=CompanyAccountOut if as_pymodel else None
+    )
 
 def disable_alumni_account_by_id(
     db: Session,
@@ -427,28 +505,17 @@ def disable_alumni_account_by_id(
     user: Account,
     *,
     as_pymodel: bool=False
-) -> Account | AlumniAccountOut:
+) -> AlumniAccountOut | None:
     if not user.can_enable_or_disable_alumni:
         raise UNAUTHORIZED_ACCESS_EXCEPTION
     
-    # get account or block request if account is not found
-    db_account = get_account_by_id(db=db, id=id, role=AccountRole.ALUMNI, allow_none=False)
-
-    # block request if the target account is the default system admin's account
-    if db_account.is_default_system_admin:
-        raise UNAUTHORIZED_ACCESS_EXCEPTION
-
-    if db_account.is_disabled:
-        raise ACCOUNT_ALREADY_DISABLED_EXCEPTION
-    
-    db_account.is_disabled = True
-    db.commit()
-    db.refresh(db_account, attribute_names=["alumni_profile"])
-
-    if as_pymodel:
-        return AlumniAccountOut.model_validate(db_account)
-    
-    return db_account
+    return set_account_disabled_by_id(
+        db=db,
+        id=id,
+        role=AccountRole.ALUMNI,
+        is_disabled=True,
+        pymodel=AlumniAccountOut if as_pymodel else None
+    )
 
 def enable_system_admin_account_by_id(
     db: Session,
@@ -456,28 +523,17 @@ def enable_system_admin_account_by_id(
     user: Account,
     *,
     as_pymodel: bool=False
-) -> Account | SystemAdminAccountOut:
+) -> SystemAdminAccountOut | None:
     if not user.can_enable_or_disable_system_admins:
         raise UNAUTHORIZED_ACCESS_EXCEPTION
     
-    # get account or block request if account is not found
-    db_account = get_account_by_id(db=db, id=id, role=AccountRole.SYSTEM_ADMINISTRATOR, allow_none=False)
-
-    # block request if the target account is the default system admin's account
-    if db_account.is_default_system_admin:
-        raise UNAUTHORIZED_ACCESS_EXCEPTION
-
-    if not db_account.is_disabled:
-        raise ACCOUNT_ALREADY_ENABLED_EXCEPTION
-    
-    db_account.is_disabled = False
-    db.commit()
-    db.refresh(db_account, attribute_names=["system_admin_profile"])
-
-    if as_pymodel:
-        return SystemAdminAccountOut.model_validate(db_account)
-    
-    return db_account
+    return set_account_disabled_by_id(
+        db=db,
+        id=id,
+        role=AccountRole.SYSTEM_ADMINISTRATOR,
+        is_disabled=False,
+        pymodel=SystemAdminAccountOut if as_pymodel else None
+    )
 
 def enable_dean_account_by_id(
     db: Session,
@@ -485,121 +541,222 @@ def enable_dean_account_by_id(
     user: Account,
     *,
     as_pymodel: bool=False
-) -> Account | DeanAccountOut:
+) -> DeanAccountOut | None:
     if not user.can_enable_or_disable_deans:
         raise UNAUTHORIZED_ACCESS_EXCEPTION
     
-    # get account or block request if account is not found
-    db_account = get_account_by_id(db=db, id=id, role=AccountRole.DEAN, allow_none=False)
+    return set_account_disabled_by_id(
+        db=db,
+        id=id,
+        role=AccountRole.DEAN,
+        is_disabled=False,
+        pymodel=DeanAccountOut if as_pymodel else None
+    )
 
-    # block request if the target account is the default system admin's account
-    if db_account.is_default_system_admin:
+def enable_peso_staff_account_by_id(
+    db: Session,
+    id: int,
+    user: Account,
+    *,
+    as_pymodel: bool=False
+) -> PesoStaffAccountOut | None:
+    if not user.can_enable_or_disable_peso_staffs:
         raise UNAUTHORIZED_ACCESS_EXCEPTION
-
-    if not db_account.is_disabled:
-        raise ACCOUNT_ALREADY_ENABLED_EXCEPTION
     
-    db_account.is_disabled = False
-    db.commit()
-    db.refresh(db_account, attribute_names=["dean_profile"])
+    return set_account_disabled_by_id(
+        db=db,
+        id=id,
+        role=AccountRole.PESO_STAFF,
+        is_disabled=False,
+        pymodel=PesoStaffAccountOut if as_pymodel else None
+    )
 
-    if as_pymodel:
-        return DeanAccountOut.model_validate(db_account)
+def enable_company_account_by_id(
+    db: Session,
+    id: int,
+    user: Account,
+    *,
+    as_pymodel: bool=False
+) -> CompanyAccountOut | None:
+    if not user.can_enable_or_disable_companies:
+        raise UNAUTHORIZED_ACCESS_EXCEPTION
     
-    return db_account
+    return set_account_disabled_by_id(
+        db=db,
+        id=id,
+        role=AccountRole.COMPANY,
+        is_disabled=False,
+        pymodel=CompanyAccountOut if as_pymodel else None
+    )
 
-def enable_peso_staff_account_by_id(
+def enable_alumni_account_by_id(
     db: Session,
     id: int,
     user: Account,
     *,
     as_pymodel: bool=False
-) -> Account | PesoStaffAccountOut:
-    if not user.can_enable_or_disable_peso_staffs:
+) -> AlumniAccountOut | None:
+    if not user.can_enable_or_disable_alumni:
         raise UNAUTHORIZED_ACCESS_EXCEPTION
     
-    # get account or block request if account is not found
-    db_account = get_account_by_id(db=db, id=id, role=AccountRole.PESO_STAFF, allow_none=False)
+    return set_account_disabled_by_id(
+        db=db,
+        id=id,
+        role=AccountRole.ALUMNI,
+        is_disabled=False,
+        pymodel=AlumniAccountOut if as_pymodel else None
+    )
 
-    # block request if the target account is the default system admin's account
-    if db_account.is_default_system_admin:
-        raise UNAUTHORIZED_ACCESS_EXCEPTION
+def set_accounts_disabled(
+    db: Session,
+    *,
+    role: AccountRole,
+    is_disabled: bool,
+    ids: list[int] | None=None,
+    filters: tuple=()
+) -> dict:
+    """
+    Bulk version of set_account_disabled_by_id: targets the given ids and/or filters, locks the
+    matched rows, then flips every eligible one with a single UPDATE in the same transaction.
+    Returns how many were updated and the outcome of every requested (or matched) account.
+    """
+
+    if ids is None and not filters:
+        raise ACCOUNTS_BULK_TARGET_REQUIRED_EXCEPTION
+
+    conditions = [Account.role == role, *filters]
+
+    if ids is not None:
+        ids = list(dict.fromkeys(ids))
+        conditions.append(Account.id.in_(ids))
+
+    # locked so the outcomes reported are exactly what the UPDATE changes
+    rows = (
+        db.query(Account.id, Account.email, Account.is_disabled)
+        .filter(*conditions)
+        .order_by(Account.id)
+        .with_for_update()
+        .all()
+    )
+    outcomes = {}
+
+    for row in rows:
+        if row.email == DEFAULT_SYSAD_EMAIL:
+            outcomes[row.id] = AccountStatusOutcome.UNAUTHORIZED
+        elif row.is_disabled == is_disabled:
+            outcomes[row.id] = AccountStatusOutcome.ALREADY_DISABLED if is_disabled else AccountStatusOutcome.ALREADY_ENABLED
+        else:
+            outcomes[row.id] = AccountStatusOutcome.UPDATED
+
+    targets = [id for id, outcome in outcomes.items() if outcome == AccountStatusOutcome.UPDATED]
+
+    if targets:
+        db.execute(
+            update(Account)
+            .where(Account.id.in_(targets), Account.is_disabled == (not is_disabled))
+            .values(is_disabled=is_disabled)
+            .execution_options(synchronize_session=False)
+        )
 
-    if not db_account.is_disabled:
-        raise ACCOUNT_ALREADY_ENABLED_EXCEPTION
-    
-    db_account.is_disabled = False
     db.commit()
-    db.refresh(db_account, attribute_names=["peso_staff_profile"])
 
-    if as_pymodel:
-        return PesoStaffAccountOut.model_validate(db_account)
-    
-    return db_account
+    if targets:
+        invalidate_principal(*targets)
+        invalidate_totals("accounts", role)
 
-def enable_company_account_by_id(
+    return {
+        "updated": len(targets),
+        "outcomes": [
+            {"id": id, "outcome": outcomes.get(id, AccountStatusOutcome.NOT_FOUND)}
+            for id in (ids if ids is not None else outcomes)
+        ],
+    }
+
+def set_system_admin_accounts_disabled(
     db: Session,
-    id: int,
+    payload: AccountBulkStatusIn,
     user: Account,
     *,
-    as_pymodel: bool=False
-) -> Account | CompanyAccountOut:
-    if not user.can_enable_or_disable_companies:
+    is_disabled: bool
+) -> dict:
+    if not user.can_enable_or_disable_system_admins:
         raise UNAUTHORIZED_ACCESS_EXCEPTION
     
-    # get account or block request if account is not found
-    db_account = get_account_by_id(db=db, id=id, role=AccountRole.COMPANY, allow_none=False)
+    return set_accounts_disabled(db=db, role=AccountRole.SYSTEM_ADMINISTRATOR, is_disabled=is_disabled, ids=payload.ids)
 
-    # block request if the target account is the default system admin's account
-    if db_account.is_default_system_admin:
+def set_dean_accounts_disabled(
+    db: Session,
+    payload: DeanBulkStatusIn,
+    user: Account,
+    *,
+    is_disabled: bool
+) -> dict:
+    if not user.can_enable_or_disable_deans:
         raise UNAUTHORIZED_ACCESS_EXCEPTION
-
-    if not db_account.is_disabled:
-        raise ACCOUNT_ALREADY_ENABLED_EXCEPTION
     
-    db_account.is_disabled = False
-    db.commit()
-    db.refresh(db_account, attribute_names=["company_profile"])
+    filters = ()
 
-    if as_pymodel:
-        return CompanyAccountOut.model_validate(db_account)
+    if payload.school_id is not None:
+        filters = (Account.id.in_(select(DeanProfile.account_id).where(DeanProfile.school_id == payload.school_id)),)
     
-    return db_account
+    return set_accounts_disabled(db=db, role=AccountRole.DEAN, is_disabled=is_disabled, ids=payload.ids, filters=filters)
 
-def enable_alumni_account_by_id(
+def set_peso_staff_accounts_disabled(
     db: Session,
-    id: int,
+    payload: AccountBulkStatusIn,
     user: Account,
     *,
-    as_pymodel: bool=False
-) -> Account | AlumniAccountOut:
-    if not user.can_enable_or_disable_alumni:
+    is_disabled: bool
+) -> dict:
+    if not user.can_enable_or_disable_peso_staffs:
         raise UNAUTHORIZED_ACCESS_EXCEPTION
     
-    # get account or block request if account is not found
-    db_account = get_account_by_id(db=db, id=id, role=AccountRole.ALUMNI, allow_none=False)
+    return set_accounts_disabled(db=db, role=AccountRole.PESO_STAFF, is_disabled=is_disabled, ids=payload.ids)
 
-    # block request if the target account is the default system admin's account
-    if db_account.is_default_system_admin:
+def set_company_accounts_disabled(
+    db: Session,
+    payload: AccountBulkStatusIn,
+    user: Account,
+    *,
+    is_disabled: bool
+) -> dict:
+    if not user.can_enable_or_disable_companies:
         raise UNAUTHORIZED_ACCESS_EXCEPTION
+    
+    return set_accounts_disabled(db=db, role=AccountRole.COMPANY, is_disabled=is_disabled, ids=payload.ids)
 
-    if not db_account.is_disabled:
-        raise ACCOUNT_ALREADY_ENABLED_EXCEPTION
+def set_alumni_accounts_disabled(
+    db: Session,
+    payload: AlumniBulkStatusIn,
+    user: Account,
+    *,
+    is_disabled: bool
+) -> dict:
+    if not user.can_enable_or_disable_alumni:
+        raise UNAUTHORIZED_ACCESS_EXCEPTION
     
-    db_account.is_disabled = False
-    db.commit()
-    db.refresh(db_account, attribute_names=["alumni_profile"])
+    profile_filters = []
 
-    if as_pymodel:
-        return AlumniAccountOut.model_validate(db_account)
+    if payload.course_id is not None:
+        profile_filters.append(AlumniProfile.course_id == payload.course_id)
+
+    if payload.year_graduated is not None:
+        profile_filters.append(AlumniProfile.year_graduated == payload.year_graduated)
+
+    filters = ()
+
+    if profile_filters:
+        filters = (Account.id.in_(select(AlumniProfile.account_id).where(*profile_filters)),)
     
-    return db_account
+    return set_accounts_disabled(db=db, role=AccountRole.ALUMNI, is_disabled=is_disabled, ids=payload.ids, filters=filters)
 
 def create_system_admin_account(
     db: Session,
     payload: SystemAdminAccountIn,
     user: Account,
     *,
+    new_account_password: str | None=None,
+    password_hash: str | None=None,
     as_pymodel: bool=False
 ) -> Account | SystemAdminAccountOut:
     if not user.can_create_system_admins:
@@ -610,14 +767,14 @@ def create_system_admin_account(
     if db_account:
         raise ACCOUNT_ALREADY_EXISTS_EXCEPTION
 
-    new_account_password = generate_password()
+    new_account_password = new_account_password or generate_password()
     print(f"[DEBUG] New System Admin Password: {new_account_password}")
     
     try:
         new_account = Account(
             role=AccountRole.SYSTEM_ADMINISTRATOR,
             email=payload.email,
-            password=hash_password(new_account_password)
+            password=password_hash or hash_password(new_account_password)
         )
         db.add(new_account)
         db.flush()
@@ -629,7 +786,10 @@ def create_system_admin_account(
             last_name=payload.last_name,
         )
         db.add(new_profile)
+        db.flush()
+        refresh_search_document(new_account)
         db.commit()
+        invalidate_totals("accounts", AccountRole.SYSTEM_ADMINISTRATOR)
         db.refresh(new_account, attribute_names=["system_admin_profile"])
         db.refresh(new_profile)
 
@@ -645,6 +805,8 @@ def create_dean_account(
     payload: DeanAccountIn,
     user: Account,
     *,
+    new_account_password: str | None=None,
+    password_hash: str | None=None,
     as_pymodel: bool=False
 ) -> Account | DeanAccountOut:
     if not user.can_create_deans:
@@ -656,14 +818,19 @@ def create_dean_account(
     # block request if school is not found
     get_school_by_id(db=db, id=payload.school_id, allow_none=False)
 
-    new_account_password = generate_password()
+    db_account = get_account_by_email(db, email=payload.email, allow_none=True)
+
+    if db_account:
+        raise ACCOUNT_ALREADY_EXISTS_EXCEPTION
+
+    new_account_password = new_account_password or generate_password()
     print(f"[DEBUG] New Dean Password: {new_account_password}")
 
     try:
         new_account = Account(
             role=AccountRole.DEAN,
             email=payload.email,
-            password=hash_password(new_account_password)
+            password=password_hash or hash_password(new_account_password)
         )
         db.add(new_account)
         db.flush()
@@ -676,7 +843,10 @@ def create_dean_account(
             last_name=payload.last_name,
         )
         db.add(new_profile)
+        db.flush()
+        refresh_search_document(new_account)
         db.commit()
+        invalidate_totals("accounts", AccountRole.DEAN)
         db.refresh(new_account, attribute_names=["dean_profile"])
         db.refresh(new_profile)
 
@@ -686,12 +856,14 @@ def create_dean_account(
         return new_account
     finally:
         db.close()
-    
+
 def create_peso_staff_account(
     db: Session,
     payload: PesoStaffAccountIn,
     user: Account,
     *,
+    new_account_password: str | None=None,
+    password_hash: str | None=None,
     as_pymodel: bool=False
 ) -> Account | PesoStaffAccountOut:
     if not user.can_create_peso_staffs:
@@ -702,14 +874,14 @@ def create_peso_staff_account(
     if db_account:
         raise ACCOUNT_ALREADY_EXISTS_EXCEPTION
 
-    new_account_password = generate_password()
+    new_account_password = new_account_password or generate_password()
     print(f"[DEBUG] New PESO Staff Password: {new_account_password}")
 
     try:
         new_account = Account(
             role=AccountRole.PESO_STAFF,
             email=payload.email,
-            password=hash_password(new_account_password)
+            password=password_hash or hash_password(new_account_password)
         )
         db.add(new_account)
         db.flush()
@@ -721,7 +893,10 @@ def create_peso_staff_account(
             last_name=payload.last_name,
         )
         db.add(new_profile)
+        db.flush()
+        refresh_search_document(new_account)
         db.commit()
+        invalidate_totals("accounts", AccountRole.PESO_STAFF)
         db.refresh(new_account, attribute_names=["peso_staff_profile"])
         db.refresh(new_profile)
 
@@ -745,20 +920,21 @@ def create_company_account(
     reg_of_est_file: UploadFile | None=None,
     reg_philjobnet_file: UploadFile | None=None,
     *,
+    password_hash: str | None=None,
     as_pymodel: bool=False
 ) -> CompanyAccountOut:
     upload_manager = UploadManager()
     upload_manager.stage_uploads([
-        Upload(file=logo_file, dest_folder=DestFolder.LOGO, allowed_mimes={"image/png", "image/jpg", "image/jpeg"}),
-        Upload(file=sec_file, dest_folder=DestFolder.SEC, allowed_mimes={"application/pdf"}),
-        Upload(file=profile_file, dest_folder=DestFolder.PROFILE, allowed_mimes={"application/pdf"}),
-        Upload(file=business_permit_file, dest_folder=DestFolder.BUSINESS_PERMIT, allowed_mimes={"application/pdf"}),
-        Upload(file=list_of_vacancies_file, dest_folder=DestFolder.LIST_OF_VACANCIES, allowed_mimes={"application/pdf"}),
-        Upload(file=cert_from_dole_file, dest_folder=DestFolder.CERT_FROM_DOLE, allowed_mimes={"application/pdf"}),
-        Upload(file=cert_of_no_pending_case_file, dest_folder=DestFolder.CERT_OF_NO_PENDING_CASE, allowed_mimes={"application/pdf"}),
-        Upload(file=reg_dti_cda_file, dest_folder=DestFolder.REG_DTI_CDA, allowed_mimes={"application/pdf"}),
-        Upload(file=reg_of_est_file, dest_folder=DestFolder.REG_OF_EST, allowed_mimes={"application/pdf"}),
-        Upload(file=reg_philjobnet_file, dest_folder=DestFolder.REG_PHILJOBNET, allowed_mimes={"application/pdf"}),
+        Upload(file=logo_file, dest_folder=DestFolder.LOGO, allowed_mimes=COMPANY_LOGO_MIMES),
+        Upload(file=sec_file, dest_folder=DestFolder.SEC, allowed_mimes=COMPANY_DOCUMENT_MIMES),
+        Upload(file=profile_file, dest_folder=DestFolder.PROFILE, allowed_mimes=COMPANY_DOCUMENT_MIMES),
+        Upload(file=business_permit_file, dest_folder=DestFolder.BUSINESS_PERMIT, allowed_mimes=COMPANY_DOCUMENT_MIMES),
+        Upload(file=list_of_vacancies_file, dest_folder=DestFolder.LIST_OF_VACANCIES, allowed_mimes=COMPANY_DOCUMENT_MIMES),
+        Upload(file=cert_from_dole_file, dest_folder=DestFolder.CERT_FROM_DOLE, allowed_mimes=COMPANY_DOCUMENT_MIMES),
+        Upload(file=cert_of_no_pending_case_file, dest_folder=DestFolder.CERT_OF_NO_PENDING_CASE, allowed_mimes=COMPANY_DOCUMENT_MIMES),
+        Upload(file=reg_dti_cda_file, dest_folder=DestFolder.REG_DTI_CDA, allowed_mimes=COMPANY_DOCUMENT_MIMES),
+        Upload(file=reg_of_est_file, dest_folder=DestFolder.REG_OF_EST, allowed_mimes=COMPANY_DOCUMENT_MIMES),
+        Upload(file=reg_philjobnet_file, dest_folder=DestFolder.REG_PHILJOBNET, allowed_mimes=COMPANY_DOCUMENT_MIMES),
     ])
     
     try:
@@ -766,7 +942,7 @@ def create_company_account(
             new_account = Account(
                 role=AccountRole.COMPANY,
                 email=email,
-                password=hash_password(password)
+                password=password_hash or hash_password(password)
             )
             db.add(new_account)
             db.flush()
@@ -786,7 +962,11 @@ def create_company_account(
                 reg_philjobnet_filename=upload_manager.get_staged_file_name(DestFolder.REG_PHILJOBNET),
             )
             db.add(new_profile)
+            db.flush()
+            acquire_stored_files(db, upload_manager.get_staged_files())
+            refresh_search_document(new_account)
 
+        invalidate_totals("accounts", AccountRole.COMPANY)
         db.refresh(new_account, attribute_names=["company_profile"])
         upload_manager.commit()
 
@@ -803,3 +983,53 @@ def create_company_account(
         print(f"[DEBUG] Unable to create company's account - {e}")
         raise ACCOUNT_UNABLE_TO_CREATE_EXCEPTION
 
+def is_account_email_taken(db: Session, email: str) -> bool:
+    try:
+        return get_account_by_email(db, email=email, allow_none=True) is not None
+    finally:
+        # ends the read's transaction, the signup begins its own
+        db.rollback()
+
+async def create_company_account_async(
+    db: Session,
+    email: str, 
+    password: str,
+    name: str,
+    logo_file: UploadFile | None=None,
+    sec_file: UploadFile | None=None,
+    profile_file: UploadFile | None=None,
+    business_permit_file: UploadFile | None=None,
+    list_of_vacancies_file: UploadFile | None=None,
+    cert_from_dole_file: UploadFile | None=None,
+    cert_of_no_pending_case_file: UploadFile | None=None,
+    reg_dti_cda_file: UploadFile | None=None,
+    reg_of_est_file: UploadFile | None=None,
+    reg_philjobnet_file: UploadFile | None=None,
+    *,
+    as_pymodel: bool=False
+) -> CompanyAccountOut:
+    # a taken email is refused before paying for the hash, the insert still catches a race
+    if await run_in_threadpool(is_account_email_taken, db, email):
+        raise ACCOUNT_ALREADY_EXISTS_EXCEPTION
+
+    password_hash = await hash_password_async(password)
+
+    return await run_in_threadpool(
+        create_company_account,
+        db=db,
+        email=email,
+        password=password,
+        name=name,
+        logo_file=logo_file,
+        sec_file=sec_file,
+        profile_file=profile_file,
+        business_permit_file=business_permit_file,
+        list_of_vacancies_file=list_of_vacancies_file,
+        cert_from_dole_file=cert_from_dole_file,
+        cert_of_no_pending_case_file=cert_of_no_pending_case_file,
+        reg_dti_cda_file=reg_dti_cda_file,
+        reg_of_est_file=reg_of_est_file,
+        reg_philjobnet_file=reg_philjobnet_file,
+        password_hash=password_hash,
+        as_pymodel=as_pymodel
+    )
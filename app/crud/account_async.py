@@ -0,0 +1,126 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.exceptions import *
+from app.schemas.account import *
+from app.models.all import Account
+from app.database import run_on_async_session
+from app.crud import account
+from app.crud.school_async import get_schools, get_school_by_id
+from app.utils.password import hash_password_async, generate_password
+
+# same signatures as app.crud.account with an AsyncSession in place of the Session
+get_account_by_id = run_on_async_session(account.get_account_by_id)
+get_account_by_email = run_on_async_session(account.get_account_by_email)
+
+get_system_admin_accounts = run_on_async_session(account.get_system_admin_accounts)
+get_dean_accounts = run_on_async_session(account.get_dean_accounts)
+get_peso_staff_accounts = run_on_async_session(account.get_peso_staff_accounts)
+get_company_accounts = run_on_async_session(account.get_company_accounts)
+get_alumni_accounts = run_on_async_session(account.get_alumni_accounts)
+
+disable_system_admin_account_by_id = run_on_async_session(account.disable_system_admin_account_by_id)
+disable_dean_account_by_id = run_on_async_session(account.disable_dean_account_by_id)
+disable_peso_staff_account_by_id = run_on_async_session(account.disable_peso_staff_account_by_id)
+disable_company_account_by_id = run_on_async_session(account.disable_company_account_by_id)
+disable_alumni_account_by_id = run_on_async_session(account.disable_alumni_account_by_id)
+
+enable_system_admin_account_by_id = run_on_async_session(account.enable_system_admin_account_by_id)
+enable_dean_account_by_id = run_on_async_session(account.enable_dean_account_by_id)
+enable_peso_staff_account_by_id = run_on_async_session(account.enable_peso_staff_account_by_id)
+enable_company_account_by_id = run_on_async_session(account.enable_company_account_by_id)
+enable_alumni_account_by_id = run_on_async_session(account.enable_alumni_account_by_id)
+
+set_system_admin_accounts_disabled = run_on_async_session(account.set_system_admin_accounts_disabled)
+set_dean_accounts_disabled = run_on_async_session(account.set_dean_accounts_disabled)
+set_peso_staff_accounts_disabled = run_on_async_session(account.set_peso_staff_accounts_disabled)
+set_company_accounts_disabled = run_on_async_session(account.set_company_accounts_disabled)
+set_alumni_accounts_disabled = run_on_async_session(account.set_alumni_accounts_disabled)
+
+# company signups stage their files on disk, they stay on the threadpool (account.create_company_account_async)
+
+async def create_system_admin_account(
+    db: AsyncSession,
+    payload: SystemAdminAccountIn,
+    user: Account,
+    *,
+    as_pymodel: bool=False
+) -> Account | SystemAdminAccountOut:
+    if not user.can_create_system_admins:
+        raise UNAUTHORIZED_ACCESS_EXCEPTION
+    
+    # a taken email is refused before paying for the hash, the insert checks it again
+    if await get_account_by_email(db, email=payload.email, allow_none=True):
+        raise ACCOUNT_ALREADY_EXISTS_EXCEPTION
+
+    # hash on the password hashing pool, only once the account is going to be created
+    new_account_password = generate_password()
+    password_hash = await hash_password_async(new_account_password)
+
+    return await db.run_sync(
+        account.create_system_admin_account,
+        payload=payload,
+        user=user,
+        new_account_password=new_account_password,
+        password_hash=password_hash,
+        as_pymodel=as_pymodel
+    )
+
+async def create_dean_account(
+    db: AsyncSession,
+    payload: DeanAccountIn,
+    user: Account,
+    *,
+    as_pymodel: bool=False
+) -> Account | DeanAccountOut:
+    if not user.can_create_deans:
+        raise UNAUTHORIZED_ACCESS_EXCEPTION
+    
+    if len(await get_schools(db=db, user=user)) == 0:
+        raise SCHOOLS_CURRENTLY_EMPTY_EXCEPTION
+    
+    # block request if school is not found
+    await get_school_by_id(db=db, id=payload.school_id, allow_none=False)
+
+    # a taken email is refused before paying for the hash, the insert checks it again
+    if await get_account_by_email(db, email=payload.email, allow_none=True):
+        raise ACCOUNT_ALREADY_EXISTS_EXCEPTION
+
+    # hash on the password hashing pool, only once the account is going to be created
+    new_account_password = generate_password()
+    password_hash = await hash_password_async(new_account_password)
+
+    return await db.run_sync(
+        account.create_dean_account,
+        payload=payload,
+        user=user,
+        new_account_password=new_account_password,
+        password_hash=password_hash,
+        as_pymodel=as_pymodel
+    )
+
+async def create_peso_staff_account(
+    db: AsyncSession,
+    payload: PesoStaffAccountIn,
+    user: Account,
+    *,
+    as_pymodel: bool=False
+) -> Account | PesoStaffAccountOut:
+    if not user.can_create_peso_staffs:
+        raise UNAUTHORIZED_ACCESS_EXCEPTION
+    
+    # a taken email is refused before paying for the hash, the insert checks it again
+    if await get_account_by_email(db, email=payload.email, allow_none=True):
+        raise ACCOUNT_ALREADY_EXISTS_EXCEPTION
+
+    # hash on the password hashing pool, only once the account is going to be created
+    new_account_password = generate_password()
+    password_hash = await hash_password_async(new_account_password)
+
+    return await db.run_sync(
+        account.create_peso_staff_account,
+        payload=payload,
+        user=user,
+        new_account_password=new_account_password,
+        password_hash=password_hash,
+        as_pymodel=as_pymodel
+    )
@@ -3,7 +3,10 @@ from sqlalchemy.orm import Session, joinedload, selectinload
 
 from app.exceptions import *
 from app.models.all import School, Account
-from app.utils.model import paginate, to_pymodels
+from app.enums.all import AccountRole
+from app.utils.model import paginate, to_pymodels, get_load_options
+from app.utils.totals import invalidate_totals
+from app.utils.search import full_text_search, normalize_search, refresh_school_deans_search_documents
 from app.schemas.school import SchoolOut, SchoolIn, SchoolUpdate
 
 def get_school_by_id(
@@ -48,29 +51,40 @@ def get_schools(
     search: str | None=None,
     page: int=1,
     size: int=20,
+    cursor: str | None=None,
     as_pymodels: bool=False
 ) -> School | SchoolOut:
     if not user.can_manage_schools:
         raise UNAUTHORIZED_ACCESS_EXCEPTION
 
-    query = db.query(School)
+    query = db.query(School).options(*get_load_options(School, SchoolOut, include=(School.created_at,)))
     
     if is_archived is not None:
         query = query.filter(School.is_archived == is_archived)
 
-    if search:
-        query = (
-            query.distinct(School.id)
-            .filter(School.name.ilike(f"%{search}%"))
-        )
+    search_filter, search_rank = full_text_search(db, School.name, search)
+
+    if search_filter is not None:
+        query = query.filter(search_filter)
     
-    total, schools = paginate(query, page=page, size=size, distinct_col=School.id)
+    total, schools, page_info = paginate(
+        query,
+        page=page,
+        size=size,
+        distinct_col=School.id,
+        order_cols=(School.created_at, School.id),
+        cursor=cursor,
+        count_key=("schools", is_archived, normalize_search(search)),
+        estimate=not search,
+        rank=search_rank
+    )
 
     if as_pymodels:
         return {
-            "page": page,
+            "page": None if cursor else page,
             "size": size,
             "total": total,
+            **page_info,
             "items": to_pymodels(schools, SchoolOut)
         }
     
@@ -92,6 +106,7 @@ def create_school(
     new_school = School(name=payload.name)
     db.add(new_school)
     db.commit()
+    invalidate_totals("schools")
     db.refresh(new_school)
 
     if as_pymodel:
@@ -113,7 +128,11 @@ def update_school_by_id(
     # get school or block request if school is not found
     db_school = get_school_by_id(db=db, id=id, allow_none=False)
     db_school.name = payload.name
+    refresh_school_deans_search_documents(db, db_school.id)
     db.commit()
+    # dean listings are searchable by their school's name
+    invalidate_totals("schools")
+    invalidate_totals("accounts", AccountRole.DEAN)
     db.refresh(db_school)
 
     if as_pymodel:
@@ -139,6 +158,7 @@ def archive_school_by_id(
     
     db_school.is_archived = True
     db.commit()
+    invalidate_totals("schools")
     db.refresh(db_school)
 
     if as_pymodel:
@@ -164,6 +184,7 @@ def restore_school_by_id(
     
     db_school.is_archived = False
     db.commit()
+    invalidate_totals("schools")
     db.refresh(db_school)
 
     if as_pymodel:
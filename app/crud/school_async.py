@@ -0,0 +1,11 @@
+from app.database import run_on_async_session
+from app.crud import school
+
+# same signatures as app.crud.school with an AsyncSession in place of the Session
+get_school_by_id = run_on_async_session(school.get_school_by_id)
+get_school_by_name = run_on_async_session(school.get_school_by_name)
+get_schools = run_on_async_session(school.get_schools)
+create_school = run_on_async_session(school.create_school)
+update_school_by_id = run_on_async_session(school.update_school_by_id)
+archive_school_by_id = run_on_async_session(school.archive_school_by_id)
+restore_school_by_id = run_on_async_session(school.restore_school_by_id)
@@ -0,0 +1,28 @@
+from sqlalchemy import update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.models.all import StoredFile
+
+def acquire_stored_files(db: Session, staged_files: list[dict]) -> None:
+    """
+    Counts a reference to the blob of each staged file, in the transaction that stores the
+    references. A blob stored for the first time gets its row, one already stored only gets
+    counted (uploading it again is just this). Nothing replaces or drops a stored file yet, so
+    counts only go up and no blob is ever deleted; a path that does will have to drop its
+    references and delete a blob left without any only after its transaction commits.
+    """
+
+    for info in staged_files:
+        filename = info["filename"]
+        counted = update(StoredFile).where(StoredFile.filename == filename).values(ref_count=StoredFile.ref_count + 1)
+
+        if db.execute(counted).rowcount:
+            continue
+
+        try:
+            with db.begin_nested():
+                db.add(StoredFile(filename=filename, size=info["size"], ref_count=1))
+        except IntegrityError:
+            # a concurrent upload of the same bytes added it first
+            db.execute(counted)
@@ -1,18 +1,73 @@
+from functools import wraps
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 
 from app.utils.env import envs
+from app.utils.pool import POOL_SETTINGS, MonitoredQueuePool, MonitoredAsyncQueuePool
+from app.utils.replica import REPLICA_MAX_LAG_SECONDS, REPLICA_LAG_CHECK_SECONDS, ReplicaLagMonitor, get_session_routing
+
+# async driver used in place of the sync one in APP_DB_URL
+ASYNC_DRIVERS = {
+    "mysql": "mysql+aiomysql",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+def get_async_db_url(url: str) -> str:
+    url = make_url(url)
+    drivername = ASYNC_DRIVERS.get(url.get_backend_name(), url.drivername)
+    return url.set(drivername=drivername).render_as_string(hide_password=False)
 
 engine = create_engine(
     url=envs("APP_DB_URL"),
     echo=False,
+    poolclass=MonitoredQueuePool,
+    **POOL_SETTINGS
+)
+
+async_engine = create_async_engine(
+    url=envs("APP_ASYNC_DB_URL") or get_async_db_url(envs("APP_DB_URL")),
+    echo=False,
+    poolclass=MonitoredAsyncQueuePool,
+    **POOL_SETTINGS
 )
 
+# optional read replica, list and lookup reads go there when it's configured
+replica_url = envs("APP_DB_REPLICA_URL")
+replica_engine = None
+async_replica_engine = None
+replica_monitor = None
+
+if replica_url:
+    replica_engine = create_engine(
+        url=replica_url,
+        echo=False,
+        poolclass=MonitoredQueuePool,
+        **POOL_SETTINGS
+    )
+    async_replica_engine = create_async_engine(
+        url=envs("APP_ASYNC_DB_REPLICA_URL") or get_async_db_url(replica_url),
+        echo=False,
+        poolclass=MonitoredAsyncQueuePool,
+        **POOL_SETTINGS
+    )
+    replica_monitor = ReplicaLagMonitor(
+        replica_engine,
+        max_lag=REPLICA_MAX_LAG_SECONDS,
+        interval=REPLICA_LAG_CHECK_SECONDS
+    )
+
 SessionLocal = sessionmaker(
     autocommit=False,
     autoflush=False,
-    bind=engine
+    **get_session_routing(engine, replica_engine, replica_monitor)
+)
+
+AsyncSessionLocal = async_sessionmaker(
+    autoflush=False,
+    **get_session_routing(async_engine, async_replica_engine, replica_monitor, is_async=True)
 )
 
 Base = declarative_base()
@@ -22,4 +77,21 @@ def get_db():
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
+def run_on_async_session(fn):
+    """
+    Async version of a sync CRUD function taking the session first. The function runs as is on
+    the async session's sync facade, so its queries await the async driver instead of blocking
+    a threadpool thread, and there's a single implementation of every query.
+    """
+
+    @wraps(fn)
+    async def wrapper(db: AsyncSession, *args, **kwargs):
+        return await db.run_sync(fn, *args, **kwargs)
+
+    return wrapper
@@ -30,3 +30,9 @@ class AccountRole(str, Enum):
         
         return role_display_map[role]
 
+class AccountStatusOutcome(str, Enum):
+    UPDATED = "UPDATED"
+    NOT_FOUND = "NOT_FOUND"
+    UNAUTHORIZED = "UNAUTHORIZED"
+    ALREADY_DISABLED = "ALREADY_DISABLED"
+    ALREADY_ENABLED = "ALREADY_ENABLED"
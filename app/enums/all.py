@@ -1,4 +1,4 @@
-from app.enums.account import AccountRole
+from app.enums.account import AccountRole, AccountStatusOutcome
 from app.enums.company import CompanyApprovalStatus
 from app.enums.alumni import AlumniApprovalStatus, AlumniEmploymentStatus
 from app.enums.job_post import JobPostWorkSetup, JobPostEmploymentType
\ No newline at end of file
@@ -30,6 +30,11 @@ ACCOUNT_UNABLE_TO_CREATE_EXCEPTION = HTTPException(
     detail="Unable to create account."
 )
 
+ACCOUNTS_BULK_TARGET_REQUIRED_EXCEPTION = HTTPException(
+    status_code=status.HTTP_400_BAD_REQUEST,
+    detail="Provide the account ids or at least one filter."
+)
+
 PROFILE_NOT_FOUND_EXCEPTION = HTTPException(
     status_code=status.HTTP_404_NOT_FOUND,
     detail="Profile not found."
@@ -80,6 +85,11 @@ ROLE_INVALID_EXCEPTION = HTTPException(
     detail="Invalid role."
 )
 
+PAGINATION_INVALID_CURSOR_EXCEPTION = HTTPException(
+    status_code=status.HTTP_400_BAD_REQUEST,
+    detail="Invalid pagination cursor."
+)
+
 AUTHENTICATION_INVALID_CREDENTIALS_EXCEPTION = HTTPException(
     status_code=status.HTTP_401_UNAUTHORIZED,
     detail="Incorrect email address or password.",
@@ -97,6 +107,29 @@ UNAUTHORIZED_ACCESS_EXCEPTION = HTTPException(
     detail="You are not authorized to access this resource."
 )
 
+# a bounded executor (password hashing, CPU or I/O work) with a full queue
+SERVER_BUSY_EXCEPTION = HTTPException(
+    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+    detail="Server is busy, please try again shortly.",
+    headers={"Retry-After": "1"}
+)
+
+# sent by the admission control middleware, which sets its own Retry-After
+ADMISSION_SERVER_BUSY_EXCEPTION = HTTPException(
+    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+    detail="Server is busy, please try again shortly."
+)
+
+REQUEST_BODY_TOO_LARGE_EXCEPTION = HTTPException(
+    status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+    detail="Request body is too large."
+)
+
+MULTIPART_BODY_REQUIRED_EXCEPTION = HTTPException(
+    status_code=status.HTTP_400_BAD_REQUEST,
+    detail="Request body should be multipart/form-data."
+)
+
 def RAISE_FILE_TYPE_NOT_SUPPORTED_EXCEPTION_FOR(file_field: str) -> None:
     raise HTTPException(
         status_code=status.HTTP_400_BAD_REQUEST,
@@ -127,3 +160,8 @@ def RAISE_FILE_SIZE_TOO_BIG_EXCEPTION_FOR(file_field: str, file_size_limit: int)
         detail=f"File size for {file_field.replace('_', ' ').capitalize()} is too big. It should not exceed {file_size_limit} Mb."
     )
 
+def RAISE_FILE_PART_TOO_LARGE_EXCEPTION_FOR(file_field: str, file_size_limit: int) -> None:
+    raise HTTPException(
+        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        detail=f"File size for {file_field.replace('_', ' ').capitalize()} is too big. It should not exceed {file_size_limit} Mb."
+    )
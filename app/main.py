@@ -1,17 +1,36 @@
+from time import perf_counter
+
+# the startup report measures the import of the app from here
+IMPORT_STARTED = perf_counter()
+
 from fastapi import FastAPI
 from slowapi.errors import RateLimitExceeded
 from slowapi import _rate_limit_exceeded_handler
 
 from app.routers import system_admin
 from app.routers import authentication
+from app.routers import diagnostics
+from app.routers import health
 from app.utils.api import limiter
+from app.utils.pool import AcquireLatencyMiddleware
+from app.utils.admission import AdmissionControlMiddleware
+from app.utils.replica import ReadYourWritesMiddleware
 from app.utils.setup import app_setup
+from app.utils.startup import startup_report
 
 app = FastAPI(lifespan=app_setup)
 app.state.limiter = limiter
 
+app.add_middleware(AcquireLatencyMiddleware)
+app.add_middleware(ReadYourWritesMiddleware)
+# outermost, so shed requests cost nothing past the door
+app.add_middleware(AdmissionControlMiddleware)
+
 app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
 
 app.include_router(authentication.router)
 app.include_router(system_admin.router)
+app.include_router(diagnostics.router)
+app.include_router(health.router)
 
+startup_report.record_import(IMPORT_STARTED)
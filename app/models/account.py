@@ -1,6 +1,6 @@
 from datetime import datetime
 from sqlalchemy.orm import Mapped, relationship
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, Enum
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, Enum, Text, Index
 
 from app.enums.all import AccountRole
 from app.database import Base
@@ -9,13 +9,26 @@ from app.utils.datetime import get_utc_now
 
 DEFAULT_SYSAD_EMAIL = envs("DEFAULT_SYSAD_EMAIL")
 
+ROLE_PROFILE_RELATIONSHIPS = {
+    AccountRole.SYSTEM_ADMINISTRATOR: "system_admin_profile",
+    AccountRole.DEAN: "dean_profile",
+    AccountRole.PESO_STAFF: "peso_staff_profile",
+    AccountRole.COMPANY: "company_profile",
+    AccountRole.ALUMNI: "alumni_profile",
+}
+
 class Account(Base):
     __tablename__ = "accounts"
+    __table_args__ = (
+        Index("ix_accounts_search_document", "search_document", mysql_prefix="FULLTEXT"),
+        Index("ix_accounts_role_is_disabled", "role", "is_disabled"),
+    )
     id: Mapped[int] = Column(Integer, primary_key=True, index=True)
     role: Mapped[AccountRole] = Column(Enum(AccountRole), nullable=False, default=AccountRole.ALUMNI)
     email: Mapped[str] = Column(String(255), nullable=False, unique=True, index=True)
     password: Mapped[str] = Column(String(255), nullable=False)
     is_disabled: Mapped[bool] = Column(Boolean, nullable=False, default=False)
+    search_document: Mapped[str | None] = Column(Text, nullable=True) # see app.utils.search
     system_admin_profile: Mapped["SystemAdminProfile"] = relationship("SystemAdminProfile", back_populates="account", uselist=False, cascade="all, delete-orphan") # type: ignore
     dean_profile: Mapped["DeanProfile"] = relationship("DeanProfile", back_populates="account", uselist=False, cascade="all, delete-orphan") # type: ignore
     peso_staff_profile: Mapped["PesoStaffProfile"] = relationship("PesoStaffProfile", back_populates="account", uselist=False, cascade="all, delete-orphan") # type: ignore
@@ -27,14 +40,9 @@ class Account(Base):
 
     @property
     def profile(self):
-        role_profile_map = {
-            AccountRole.SYSTEM_ADMINISTRATOR: self.system_admin_profile,
-            AccountRole.DEAN: self.dean_profile,
-            AccountRole.PESO_STAFF: self.peso_staff_profile,
-            AccountRole.COMPANY: self.company_profile,
-            AccountRole.ALUMNI: self.alumni_profile,
-        }
-        return role_profile_map.get(self.role, None)
+        # only touch the relationship of this account's role, the others are always empty
+        relationship_name = ROLE_PROFILE_RELATIONSHIPS.get(self.role)
+        return getattr(self, relationship_name) if relationship_name else None
     
     @property
     def is_default_system_admin(self) -> bool:
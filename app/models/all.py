@@ -13,5 +13,6 @@ from app.models.occupation import Occupation
 from app.models.peso_staff import PesoStaffProfile
 from app.models.school import School
 from app.models.social import Social
+from app.models.stored_file import StoredFile
 from app.models.system_admin import SystemAdminProfile
 
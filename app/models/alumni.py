@@ -1,6 +1,6 @@
 from datetime import datetime
 from sqlalchemy.orm import Mapped, relationship
-from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Enum
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Enum, Index
 
 from app.database import Base
 from app.utils.datetime import get_utc_now
@@ -8,6 +8,9 @@ from app.enums.all import AlumniApprovalStatus, AlumniEmploymentStatus
 
 class AlumniProfile(Base):
     __tablename__ = "alumni_profiles"
+    __table_args__ = (
+        Index("ix_alumni_profiles_course_id_year_graduated", "course_id", "year_graduated"),
+    )
     id: Mapped[int] = Column(Integer, primary_key=True, index=True)
     profile_picture_filename: Mapped[str] = Column(String(255), nullable=False)
     curriculum_vitae_filename: Mapped[str | None] = Column(String(255), nullable=True, default=None)
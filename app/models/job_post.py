@@ -1,6 +1,6 @@
 from datetime import datetime
 from sqlalchemy.orm import Mapped, relationship
-from sqlalchemy import Column, Integer, String, Boolean, ForeignKey, DateTime, Text, Enum
+from sqlalchemy import Column, Integer, String, Boolean, ForeignKey, DateTime, Text, Enum, Index
 
 from app.database import Base
 from app.utils.datetime import get_utc_now
@@ -8,6 +8,9 @@ from app.enums.all import JobPostWorkSetup, JobPostEmploymentType
 
 class JobPost(Base):
     __tablename__ = "job_posts"
+    __table_args__ = (
+        Index("ix_job_posts_is_archived_is_posted_already_expires_at", "is_archived", "is_posted_already", "expires_at"),
+    )
     id: Mapped[int] = Column(Integer, primary_key=True, index=True)
     title: Mapped[str] = Column(String(255), nullable=False)
     description: Mapped[str] = Column(Text, nullable=False)
@@ -1,12 +1,16 @@
 from datetime import datetime
 from sqlalchemy.orm import Mapped, relationship
-from sqlalchemy import Column, Integer, ForeignKey, DateTime
+from sqlalchemy import Column, Integer, ForeignKey, DateTime, Index
 
 from app.database import Base
 from app.utils.datetime import get_utc_now
 
 class Like(Base):
     __tablename__ = "likes"
+    __table_args__ = (
+        # an alumni likes a job post at most once
+        Index("uq_likes_job_post_id_alumni_profile_id", "job_post_id", "alumni_profile_id", unique=True),
+    )
     id: Mapped[int] = Column(Integer, primary_key=True, index=True)
     job_post_id: Mapped[int] = Column(Integer, ForeignKey("job_posts.id"))
     job_post: Mapped["JobPost"] = relationship("JobPost", back_populates="likes", uselist=False) # type: ignore
@@ -1,12 +1,15 @@
 from datetime import datetime
 from sqlalchemy.orm import Mapped, relationship
-from sqlalchemy import Column, Integer, String, Boolean, ForeignKey, DateTime
+from sqlalchemy import Column, Integer, String, Boolean, ForeignKey, DateTime, Index
 
 from app.database import Base
 from app.utils.datetime import get_utc_now
 
 class OccupationState(Base):
     __tablename__ = "occupation_states"
+    __table_args__ = (
+        Index("ix_occupation_states_alumni_id_is_current", "alumni_id", "is_current"),
+    )
     id: Mapped[int] = Column(Integer, primary_key=True, index=True)
     location: Mapped[str] = Column(String(1025), nullable=False)
     is_current: Mapped[bool] = Column(Boolean, nullable=False, default=True)
@@ -1,12 +1,15 @@
 from datetime import datetime
 from sqlalchemy.orm import Mapped, relationship
-from sqlalchemy import Column, Integer, String, Boolean, DateTime
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, Index
 
 from app.database import Base
 from app.utils.datetime import get_utc_now
 
 class School(Base):
     __tablename__ = "schools"
+    __table_args__ = (
+        Index("ix_schools_name_fulltext", "name", mysql_prefix="FULLTEXT"),
+    )
     id: Mapped[int] = Column(Integer, primary_key=True, index=True)
     name: Mapped[str] = Column(String(255), nullable=False)
     assigned_deans: Mapped[list["DeanProfile"]] = relationship("DeanProfile", back_populates="school", uselist=False) # type: ignore
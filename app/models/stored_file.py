@@ -0,0 +1,17 @@
+from datetime import datetime
+from sqlalchemy.orm import Mapped
+from sqlalchemy import Column, Integer, String, DateTime
+
+from app.database import Base
+from app.utils.datetime import get_utc_now
+
+class StoredFile(Base):
+    """A stored blob, named after its content's digest. Profiles reference it by filename."""
+
+    __tablename__ = "stored_files"
+    id: Mapped[int] = Column(Integer, primary_key=True, index=True)
+    filename: Mapped[str] = Column(String(255), nullable=False, unique=True)
+    size: Mapped[int] = Column(Integer, nullable=False)
+    ref_count: Mapped[int] = Column(Integer, nullable=False, default=0)
+    created_at: Mapped[datetime] = Column(DateTime(timezone=True), nullable=False, default=get_utc_now)
+    updated_at: Mapped[datetime] = Column(DateTime(timezone=True), nullable=False, default=get_utc_now, onupdate=get_utc_now)
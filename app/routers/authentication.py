@@ -1,59 +1,49 @@
 from sqlalchemy.orm import Session
 from fastapi.security import OAuth2PasswordRequestForm
-from fastapi import APIRouter, Depends, Request, Form, UploadFile, File
+from fastapi import APIRouter, Depends, Request
 
 from app.database import get_db
 from app.schemas.access_token import Token
 from app.schemas.account import CompanyAccountOut
-from app.crud.account import create_company_account
+from app.crud.account import COMPANY_SIGNUP_FILES, create_company_account_async
 from app.utils.api import limiter
-from app.utils.authentication import authenticate_user
+from app.utils.intake import FilePartRule, read_multipart, get_form_fields, get_form_files, get_multipart_openapi
+from app.utils.authentication import authenticate_user_async
 
 router = APIRouter(tags=["All Roles"], prefix="/api/authentication")
 
+COMPANY_SIGNUP_FIELDS = ("email", "password", "name")
+COMPANY_SIGNUP_FILE_RULES = {
+    field: FilePartRule(dest_folder.value, allowed_mimes)
+    for field, (dest_folder, allowed_mimes) in COMPANY_SIGNUP_FILES.items()
+}
+
 @router.post("/login")
 @limiter.limit("10/minute")
-def login(
+async def login(
     request: Request,
     db: Session=Depends(get_db),
     form_data: OAuth2PasswordRequestForm = Depends(),
 ) -> Token:
-    return authenticate_user(db=db, form_data=form_data)
+    return await authenticate_user_async(db=db, form_data=form_data)
 
-@router.post("/company/signup", tags=["Tested"])
+@router.post(
+    "/company/signup",
+    tags=["Tested"],
+    openapi_extra=get_multipart_openapi(COMPANY_SIGNUP_FIELDS, COMPANY_SIGNUP_FILE_RULES)
+)
 @limiter.limit("10/minute")
-def signup_as_a_company(
-    request: Request,
-    db: Session=Depends(get_db),
-    email: str=Form(...), 
-    password: str=Form(...),
-    name: str=Form(...),
-    logo_file: UploadFile | None=File(None),
-    sec_file: UploadFile | None=File(None),
-    profile_file: UploadFile | None=File(None),
-    business_permit_file: UploadFile | None=File(None),
-    list_of_vacancies_file: UploadFile | None=File(None),
-    cert_from_dole_file: UploadFile | None=File(None),
-    cert_of_no_pending_case_file: UploadFile | None=File(None),
-    reg_dti_cda_file: UploadFile | None=File(None),
-    reg_of_est_file: UploadFile | None=File(None),
-    reg_philjobnet_file: UploadFile | None=File(None),
-) -> CompanyAccountOut:
-    return create_company_account(
-        db=db,
-        email=email,
-        password=password,
-        name=name,
-        logo_file=logo_file,
-        sec_file=sec_file,
-        profile_file=profile_file,
-        business_permit_file=business_permit_file,
-        list_of_vacancies_file=list_of_vacancies_file,
-        cert_from_dole_file=cert_from_dole_file,
-        cert_of_no_pending_case_file=cert_of_no_pending_case_file,
-        reg_dti_cda_file=reg_dti_cda_file,
-        reg_of_est_file=reg_of_est_file,
-        reg_philjobnet_file=reg_philjobnet_file,
-        as_pymodel=True
-    )
+async def signup_as_a_company(request: Request, db: Session=Depends(get_db)) -> CompanyAccountOut:
+    # the body is read here instead of through Form and File parameters, so the size and type
+    # limits hold while it arrives and an oversized or wrong file stops it early
+    form = await read_multipart(request, file_rules=COMPANY_SIGNUP_FILE_RULES)
 
+    try:
+        return await create_company_account_async(
+            db=db,
+            **get_form_fields(form, COMPANY_SIGNUP_FIELDS),
+            **get_form_files(form, COMPANY_SIGNUP_FILE_RULES),
+            as_pymodel=True
+        )
+    finally:
+        await form.close()
@@ -0,0 +1,83 @@
+from fastapi import APIRouter, Depends, Request
+
+from app.utils.api import limiter
+from app.database import engine, async_engine, replica_engine, async_replica_engine, replica_monitor
+from app.models.all import Account
+from app.enums.all import AccountRole
+from app.utils.authorization import allow_roles
+from app.utils.password import password_hasher
+from app.utils.executors import get_executor_stats
+from app.utils.principal import get_principal_cache_stats
+from app.utils.totals import totals_cache
+from app.utils.pool import request_acquire_stats
+from app.utils.admission import get_admission_stats
+from app.utils.storage import get_storage_io_stats
+
+router = APIRouter(tags=["Diagnostics"], prefix="/api/diagnostics")
+
+@router.get("/principal-cache")
+@limiter.limit("10/minute")
+def get_principal_cache(
+    request: Request,
+    user: Account=Depends(allow_roles([AccountRole.SYSTEM_ADMINISTRATOR]))
+) -> dict:
+    return get_principal_cache_stats()
+
+@router.get("/password-hashing")
+@limiter.limit("10/minute")
+def get_password_hashing(
+    request: Request,
+    user: Account=Depends(allow_roles([AccountRole.SYSTEM_ADMINISTRATOR]))
+) -> dict:
+    return password_hasher.stats()
+
+@router.get("/executors")
+@limiter.limit("10/minute")
+def get_executors(
+    request: Request,
+    user: Account=Depends(allow_roles([AccountRole.SYSTEM_ADMINISTRATOR]))
+) -> dict:
+    return get_executor_stats()
+
+@router.get("/totals-cache")
+@limiter.limit("10/minute")
+def get_totals_cache(
+    request: Request,
+    user: Account=Depends(allow_roles([AccountRole.SYSTEM_ADMINISTRATOR]))
+) -> dict:
+    return totals_cache.stats()
+
+@router.get("/db-pool")
+@limiter.limit("10/minute")
+def get_db_pool(
+    request: Request,
+    user: Account=Depends(allow_roles([AccountRole.SYSTEM_ADMINISTRATOR]))
+) -> dict:
+    pools = {
+        "sync": engine.pool.stats(),
+        "async": async_engine.pool.stats(),
+        "request_acquire": request_acquire_stats.stats(),
+    }
+
+    if replica_engine is not None:
+        pools["replica_sync"] = replica_engine.pool.stats()
+        pools["replica_async"] = async_replica_engine.pool.stats()
+        pools["replica"] = replica_monitor.stats()
+
+    return pools
+
+@router.get("/admission")
+@limiter.limit("10/minute")
+def get_admission(
+    request: Request,
+    user: Account=Depends(allow_roles([AccountRole.SYSTEM_ADMINISTRATOR]))
+) -> dict:
+    return get_admission_stats()
+
+@router.get("/storage-io")
+@limiter.limit("10/minute")
+def get_storage_io(
+    request: Request,
+    user: Account=Depends(allow_roles([AccountRole.SYSTEM_ADMINISTRATOR]))
+) -> dict:
+    return get_storage_io_stats()
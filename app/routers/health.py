@@ -0,0 +1,18 @@
+from fastapi import APIRouter
+from fastapi.responses import JSONResponse
+
+from app.utils.startup import startup_report
+
+# probes, not rate limited and async so they never wait for a threadpool thread
+router = APIRouter(tags=["Health"], prefix="/api/health")
+
+@router.get("/live")
+async def get_liveness() -> dict:
+    return {"status": "up"}
+
+@router.get("/ready")
+async def get_readiness() -> JSONResponse:
+    if not startup_report.is_ready:
+        return JSONResponse(status_code=503, content={"status": "warming", **startup_report.stats()})
+    
+    return JSONResponse(content={"status": "ready", **startup_report.stats()})
@@ -1,19 +1,19 @@
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import APIRouter, Depends, Query, Request
 
-from app.utils.api import limiter
+from app.utils.api import limiter, PageResponse
 from app.models.all import Account
 from app.enums.all import AccountRole
-from app.database import get_db
+from app.database import get_async_db
 from app.utils.authorization import allow_roles
-from app.crud.school import (
+from app.crud.school_async import (
     get_schools,
     create_school as svc_create_school,
     update_school_by_id,
     archive_school_by_id,
     restore_school_by_id
 )
-from app.crud.account import (
+from app.crud.account_async import (
     get_system_admin_accounts,
     get_dean_accounts,
     get_peso_staff_accounts,
@@ -31,7 +31,12 @@ from app.crud.account import (
     enable_dean_account_by_id,
     enable_peso_staff_account_by_id,
     enable_company_account_by_id,
-    enable_alumni_account_by_id
+    enable_alumni_account_by_id,
+    set_system_admin_accounts_disabled,
+    set_dean_accounts_disabled,
+    set_peso_staff_accounts_disabled,
+    set_company_accounts_disabled,
+    set_alumni_accounts_disabled
 )
 from app.schemas.account import *
 from app.schemas.school import SchoolIn, SchoolOut, SchoolUpdate
@@ -41,268 +46,379 @@ router = APIRouter(tags=["System Administrator"], prefix="/api/system-admin")
 
 
 # SYSTEM ADMIN
-@router.get("/", tags=["Tested"])
+@router.get("/", response_class=PageResponse, tags=["Tested"])
 @limiter.limit("10/minute")
-def get_all_system_admins(
+async def get_all_system_admins(
     request: Request,
-    db: Session=Depends(get_db),
+    db: AsyncSession=Depends(get_async_db),
     is_disabled: bool | None=Query(None),
     search: str | None=Query(None),
     page: int=Query(1, ge=1),
     size: int=Query(20, ge=20, le=100),
+    cursor: str | None=Query(None),
+    explain: bool=Query(False),
     user: Account=Depends(allow_roles([AccountRole.SYSTEM_ADMINISTRATOR]))
 ) -> dict:
-    return get_system_admin_accounts(db=db, user=user, is_disabled=is_disabled, search=search, page=page, size=size, as_pymodels=True)
+    return PageResponse(await get_system_admin_accounts(db=db, user=user, is_disabled=is_disabled, search=search, page=page, size=size, cursor=cursor, explain=explain, as_pymodels=True))
 
 @router.post("/", tags=["Tested"])
 @limiter.limit("10/minute")
-def create_system_admin(
+async def create_system_admin(
     request: Request,
     payload: SystemAdminAccountIn,
-    db: Session=Depends(get_db),
+    db: AsyncSession=Depends(get_async_db),
     user: Account=Depends(allow_roles([AccountRole.SYSTEM_ADMINISTRATOR]))
 ) -> SystemAdminAccountOut:
-    return create_system_admin_account(db=db, payload=payload, user=user, as_pymodel=True)
+    return await create_system_admin_account(db=db, payload=payload, user=user, as_pymodel=True)
 
 @router.patch("/{id}/disable", tags=["Tested"])
 @limiter.limit("10/minute")
-def disable_system_admin(
+async def disable_system_admin(
     request: Request,
     id: int,
-    db: Session=Depends(get_db),
+    db: AsyncSession=Depends(get_async_db),
     user: Account=Depends(allow_roles([AccountRole.SYSTEM_ADMINISTRATOR]))
 ) -> SystemAdminAccountOut:
-    return disable_system_admin_account_by_id(db=db, id=id, user=user, as_pymodel=True)
+    return await disable_system_admin_account_by_id(db=db, id=id, user=user, as_pymodel=True)
 
 @router.patch("/{id}/enable", tags=["Tested"])
 @limiter.limit("10/minute")
-def enable_system_admin(
+async def enable_system_admin(
     request: Request,
     id: int,
-    db: Session=Depends(get_db),
+    db: AsyncSession=Depends(get_async_db),
     user: Account=Depends(allow_roles([AccountRole.SYSTEM_ADMINISTRATOR]))
 ) -> SystemAdminAccountOut:
-    return enable_system_admin_account_by_id(db=db, id=id, user=user, as_pymodel=True)
+    return await enable_system_admin_account_by_id(db=db, id=id, user=user, as_pymodel=True)
+
+@router.patch("/bulk-disable")
+@limiter.limit("10/minute")
+async def bulk_disable_system_admins(
+    request: Request,
+    payload: AccountBulkStatusIn,
+    db: AsyncSession=Depends(get_async_db),
+    user: Account=Depends(allow_roles([AccountRole.SYSTEM_ADMINISTRATOR]))
+) -> AccountBulkStatusOut:
+    return await set_system_admin_accounts_disabled(db=db, payload=payload, user=user, is_disabled=True)
+
+@router.patch("/bulk-enable")
+@limiter.limit("10/minute")
+async def bulk_enable_system_admins(
+    request: Request,
+    payload: AccountBulkStatusIn,
+    db: AsyncSession=Depends(get_async_db),
+    user: Account=Depends(allow_roles([AccountRole.SYSTEM_ADMINISTRATOR]))
+) -> AccountBulkStatusOut:
+    return await set_system_admin_accounts_disabled(db=db, payload=payload, user=user, is_disabled=False)
 
 
 
 # DEAN
-@router.get("/dean", tags=["Tested"])
+@router.get("/dean", response_class=PageResponse, tags=["Tested"])
 @limiter.limit("10/minute")
-def get_all_deans(
+async def get_all_deans(
     request: Request,
-    db: Session=Depends(get_db),
+    db: AsyncSession=Depends(get_async_db),
     is_disabled: bool | None=Query(None),
     search: str | None=Query(None),
     page: int=Query(1, ge=1),
     size: int=Query(20, ge=20, le=100),
+    cursor: str | None=Query(None),
+    explain: bool=Query(False),
     user: Account=Depends(allow_roles([AccountRole.SYSTEM_ADMINISTRATOR]))
 ) -> dict:
-    return get_dean_accounts(db=db, user=user, is_disabled=is_disabled, search=search, page=page, size=size, as_pymodels=True)
+    return PageResponse(await get_dean_accounts(db=db, user=user, is_disabled=is_disabled, search=search, page=page, size=size, cursor=cursor, explain=explain, as_pymodels=True))
 
 @router.post("/dean", tags=["Tested"])
 @limiter.limit("10/minute")
-def create_dean(
+async def create_dean(
     request: Request,
     payload: DeanAccountIn,
-    db: Session=Depends(get_db),
+    db: AsyncSession=Depends(get_async_db),
     user: Account=Depends(allow_roles([AccountRole.SYSTEM_ADMINISTRATOR]))
 ) -> DeanAccountOut:
-    return create_dean_account(db=db, payload=payload, user=user, as_pymodel=True)
+    return await create_dean_account(db=db, payload=payload, user=user, as_pymodel=True)
 
 @router.patch("/dean/{id}/disable", tags=["Tested"])
 @limiter.limit("10/minute")
-def disable_dean(
+async def disable_dean(
     request: Request,
     id: int,
-    db: Session=Depends(get_db),
+    db: AsyncSession=Depends(get_async_db),
     user: Account=Depends(allow_roles([AccountRole.SYSTEM_ADMINISTRATOR]))
 ) -> DeanAccountOut:
-    return disable_dean_account_by_id(db=db, id=id, user=user, as_pymodel=True)
+    return await disable_dean_account_by_id(db=db, id=id, user=user, as_pymodel=True)
 
 @router.patch("/dean/{id}/enable", tags=["Tested"])
 @limiter.limit("10/minute")
-def enable_dean(
+async def enable_dean(
     request: Request,
     id: int,
-    db: Session=Depends(get_db),
+    db: AsyncSession=Depends(get_async_db),
     user: Account=Depends(allow_roles([AccountRole.SYSTEM_ADMINISTRATOR]))
 ) -> DeanAccountOut:
-    return enable_dean_account_by_id(db=db, id=id, user=user, as_pymodel=True)
+    return await enable_dean_account_by_id(db=db, id=id, user=user, as_pymodel=True)
+
+@router.patch("/dean/bulk-disable")
+@limiter.limit("10/minute")
+async def bulk_disable_deans(
+    request: Request,
+    payload: DeanBulkStatusIn,
+    db: AsyncSession=Depends(get_async_db),
+    user: Account=Depends(allow_roles([AccountRole.SYSTEM_ADMINISTRATOR]))
+) -> AccountBulkStatusOut:
+    return await set_dean_accounts_disabled(db=db, payload=payload, user=user, is_disabled=True)
+
+@router.patch("/dean/bulk-enable")
+@limiter.limit("10/minute")
+async def bulk_enable_deans(
+    request: Request,
+    payload: DeanBulkStatusIn,
+    db: AsyncSession=Depends(get_async_db),
+    user: Account=Depends(allow_roles([AccountRole.SYSTEM_ADMINISTRATOR]))
+) -> AccountBulkStatusOut:
+    return await set_dean_accounts_disabled(db=db, payload=payload, user=user, is_disabled=False)
     
 
 
 # PESO Staff
-@router.get("/peso-staff", tags=["Tested"])
+@router.get("/peso-staff", response_class=PageResponse, tags=["Tested"])
 @limiter.limit("10/minute")
-def get_all_peso_staffs(
+async def get_all_peso_staffs(
     request: Request,
-    db: Session=Depends(get_db),
+    db: AsyncSession=Depends(get_async_db),
     is_disabled: bool | None=Query(None),
     search: str | None=Query(None),
     page: int=Query(1, ge=1),
     size: int=Query(20, ge=20, le=100),
+    cursor: str | None=Query(None),
+    explain: bool=Query(False),
     user: Account=Depends(allow_roles([AccountRole.SYSTEM_ADMINISTRATOR]))
 ) -> dict:
-    return get_peso_staff_accounts(db=db, user=user, is_disabled=is_disabled, search=search, page=page, size=size, as_pymodels=True)
+    return PageResponse(await get_peso_staff_accounts(db=db, user=user, is_disabled=is_disabled, search=search, page=page, size=size, cursor=cursor, explain=explain, as_pymodels=True))
 
 @router.post("/peso-staff", tags=["Tested"])
 @limiter.limit("10/minute")
-def create_peso_staff(
+async def create_peso_staff(
     request: Request,
     payload: PesoStaffAccountIn,
-    db: Session=Depends(get_db),
+    db: AsyncSession=Depends(get_async_db),
     user: Account=Depends(allow_roles([AccountRole.SYSTEM_ADMINISTRATOR]))
 ) -> PesoStaffAccountOut:
-    return create_peso_staff_account(db=db, payload=payload, user=user, as_pymodel=True)
+    return await create_peso_staff_account(db=db, payload=payload, user=user, as_pymodel=True)
 
 @router.patch("/peso-staff/{id}/disable", tags=["Tested"])
 @limiter.limit("10/minute")
-def disable_dean(
+async def disable_dean(
     request: Request,
     id: int,
-    db: Session=Depends(get_db),
+    db: AsyncSession=Depends(get_async_db),
     user: Account=Depends(allow_roles([AccountRole.SYSTEM_ADMINISTRATOR]))
 ) -> PesoStaffAccountOut:
-    return disable_peso_staff_account_by_id(db=db, id=id, user=user, as_pymodel=True)
+    return await disable_peso_staff_account_by_id(db=db, id=id, user=user, as_pymodel=True)
 
 @router.patch("/peso-staff/{id}/enable", tags=["Tested"])
 @limiter.limit("10/minute")
-def enable_dean(
+async def enable_dean(
     request: Request,
     id: int,
-    db: Session=Depends(get_db),
+    db: AsyncSession=Depends(get_async_db),
     user: Account=Depends(allow_roles([AccountRole.SYSTEM_ADMINISTRATOR]))
 ) -> PesoStaffAccountOut:
-    return enable_peso_staff_account_by_id(db=db, id=id, user=user, as_pymodel=True)
+    return await enable_peso_staff_account_by_id(db=db, id=id, user=user, as_pymodel=True)
+
+@router.patch("/peso-staff/bulk-disable")
+@limiter.limit("10/minute")
+async def bulk_disable_peso_staffs(
+    request: Request,
+    payload: AccountBulkStatusIn,
+    db: AsyncSession=Depends(get_async_db),
+    user: Account=Depends(allow_roles([AccountRole.SYSTEM_ADMINISTRATOR]))
+) -> AccountBulkStatusOut:
+    return await set_peso_staff_accounts_disabled(db=db, payload=payload, user=user, is_disabled=True)
+
+@router.patch("/peso-staff/bulk-enable")
+@limiter.limit("10/minute")
+async def bulk_enable_peso_staffs(
+    request: Request,
+    payload: AccountBulkStatusIn,
+    db: AsyncSession=Depends(get_async_db),
+    user: Account=Depends(allow_roles([AccountRole.SYSTEM_ADMINISTRATOR]))
+) -> AccountBulkStatusOut:
+    return await set_peso_staff_accounts_disabled(db=db, payload=payload, user=user, is_disabled=False)
     
 
 
 # Company
-@router.get("/company", tags=["Tested"])
+@router.get("/company", response_class=PageResponse, tags=["Tested"])
 @limiter.limit("10/minute")
-def get_all_companies(
+async def get_all_companies(
     request: Request,
-    db: Session=Depends(get_db),
+    db: AsyncSession=Depends(get_async_db),
     is_disabled: bool | None=Query(None),
     search: str | None=Query(None),
     page: int=Query(1, ge=1),
     size: int=Query(20, ge=20, le=100),
+    cursor: str | None=Query(None),
+    explain: bool=Query(False),
     user: Account=Depends(allow_roles([AccountRole.SYSTEM_ADMINISTRATOR]))
 ) -> dict:
-    return get_company_accounts(db=db, user=user, is_disabled=is_disabled, search=search, page=page, size=size, as_pymodels=True)
+    return PageResponse(await get_company_accounts(db=db, user=user, is_disabled=is_disabled, search=search, page=page, size=size, cursor=cursor, explain=explain, as_pymodels=True))
 
 @router.patch("/company/{id}/disable", tags=["Tested"])
 @limiter.limit("10/minute")
-def disable_company(
+async def disable_company(
     request: Request,
     id: int,
-    db: Session=Depends(get_db),
+    db: AsyncSession=Depends(get_async_db),
     user: Account=Depends(allow_roles([AccountRole.SYSTEM_ADMINISTRATOR]))
 ) -> CompanyAccountOut:
-    return disable_company_account_by_id(db=db, id=id, user=user, as_pymodel=True)
+    return await disable_company_account_by_id(db=db, id=id, user=user, as_pymodel=True)
 
 @router.patch("/company/{id}/enable", tags=["Tested"])
 @limiter.limit("10/minute")
-def enable_company(
+async def enable_company(
     request: Request,
     id: int,
-    db: Session=Depends(get_db),
+    db: AsyncSession=Depends(get_async_db),
     user: Account=Depends(allow_roles([AccountRole.SYSTEM_ADMINISTRATOR]))
 ) -> CompanyAccountOut:
-    return enable_company_account_by_id(db=db, id=id, user=user, as_pymodel=True)
+    return await enable_company_account_by_id(db=db, id=id, user=user, as_pymodel=True)
+
+@router.patch("/company/bulk-disable")
+@limiter.limit("10/minute")
+async def bulk_disable_companies(
+    request: Request,
+    payload: AccountBulkStatusIn,
+    db: AsyncSession=Depends(get_async_db),
+    user: Account=Depends(allow_roles([AccountRole.SYSTEM_ADMINISTRATOR, AccountRole.PESO_STAFF]))
+) -> AccountBulkStatusOut:
+    return await set_company_accounts_disabled(db=db, payload=payload, user=user, is_disabled=True)
+
+@router.patch("/company/bulk-enable")
+@limiter.limit("10/minute")
+async def bulk_enable_companies(
+    request: Request,
+    payload: AccountBulkStatusIn,
+    db: AsyncSession=Depends(get_async_db),
+    user: Account=Depends(allow_roles([AccountRole.SYSTEM_ADMINISTRATOR, AccountRole.PESO_STAFF]))
+) -> AccountBulkStatusOut:
+    return await set_company_accounts_disabled(db=db, payload=payload, user=user, is_disabled=False)
 
 
 
 # Alumni
-@router.get("/alumni")
+@router.get("/alumni", response_class=PageResponse)
 @limiter.limit("10/minute")
-def get_all_alumni(
+async def get_all_alumni(
     request: Request,
-    db: Session=Depends(get_db),
+    db: AsyncSession=Depends(get_async_db),
     is_disabled: bool | None=Query(None),
     search: str | None=Query(None),
     page: int=Query(1, ge=1),
     size: int=Query(20, ge=20, le=100),
+    cursor: str | None=Query(None),
+    explain: bool=Query(False),
     user: Account=Depends(allow_roles([AccountRole.SYSTEM_ADMINISTRATOR]))
 ) -> dict:
-    return get_alumni_accounts(db=db, user=user, is_disabled=is_disabled, search=search, page=page, size=size, as_pymodels=True)
+    return PageResponse(await get_alumni_accounts(db=db, user=user, is_disabled=is_disabled, search=search, page=page, size=size, cursor=cursor, explain=explain, as_pymodels=True))
 
 @router.patch("/alumni/{id}/disable")
 @limiter.limit("10/minute")
-def disable_alumni(
+async def disable_alumni(
     request: Request,
     id: int,
-    db: Session=Depends(get_db),
+    db: AsyncSession=Depends(get_async_db),
     user: Account=Depends(allow_roles([AccountRole.SYSTEM_ADMINISTRATOR]))
 ) -> AlumniAccountOut:
-    return disable_alumni_account_by_id(db=db, id=id, user=user, as_pymodel=True)
+    return await disable_alumni_account_by_id(db=db, id=id, user=user, as_pymodel=True)
 
 @router.patch("/alumni/{id}/enable")
 @limiter.limit("10/minute")
-def enable_alumni(
+async def enable_alumni(
     request: Request,
     id: int,
-    db: Session=Depends(get_db),
+    db: AsyncSession=Depends(get_async_db),
     user: Account=Depends(allow_roles([AccountRole.SYSTEM_ADMINISTRATOR]))
 ) -> AlumniAccountOut:
-    return enable_alumni_account_by_id(db=db, id=id, user=user, as_pymodel=True)
+    return await enable_alumni_account_by_id(db=db, id=id, user=user, as_pymodel=True)
+
+@router.patch("/alumni/bulk-disable")
+@limiter.limit("10/minute")
+async def bulk_disable_alumni(
+    request: Request,
+    payload: AlumniBulkStatusIn,
+    db: AsyncSession=Depends(get_async_db),
+    user: Account=Depends(allow_roles([AccountRole.DEAN]))
+) -> AccountBulkStatusOut:
+    return await set_alumni_accounts_disabled(db=db, payload=payload, user=user, is_disabled=True)
+
+@router.patch("/alumni/bulk-enable")
+@limiter.limit("10/minute")
+async def bulk_enable_alumni(
+    request: Request,
+    payload: AlumniBulkStatusIn,
+    db: AsyncSession=Depends(get_async_db),
+    user: Account=Depends(allow_roles([AccountRole.DEAN]))
+) -> AccountBulkStatusOut:
+    return await set_alumni_accounts_disabled(db=db, payload=payload, user=user, is_disabled=False)
 
 
 
 # School
-@router.get("/school", tags=["Tested"])
+@router.get("/school", response_class=PageResponse, tags=["Tested"])
 @limiter.limit("10/minute")
-def get_all_schools(
+async def get_all_schools(
     request: Request,
-    db: Session=Depends(get_db),
+    db: AsyncSession=Depends(get_async_db),
     is_archived: bool | None=Query(None),
     search: str | None=Query(None),
     page: int=Query(1, ge=1),
     size: int=Query(20, ge=20, le=100),
+    cursor: str | None=Query(None),
     user: Account=Depends(allow_roles([AccountRole.SYSTEM_ADMINISTRATOR]))
 ) -> dict:
-    return get_schools(db=db, user=user, is_archived=is_archived, search=search, page=page, size=size, as_pymodels=True)
+    return PageResponse(await get_schools(db=db, user=user, is_archived=is_archived, search=search, page=page, size=size, cursor=cursor, as_pymodels=True))
 
 @router.post("/school", tags=["Tested"])
 @limiter.limit("10/minute")
-def create_school(
+async def create_school(
     request: Request,
     payload: SchoolIn,
-    db: Session=Depends(get_db),
+    db: AsyncSession=Depends(get_async_db),
     user: Account=Depends(allow_roles([AccountRole.SYSTEM_ADMINISTRATOR]))
 ) -> SchoolOut:
-    return svc_create_school(db=db, payload=payload, user=user, as_pymodel=True)
+    return await svc_create_school(db=db, payload=payload, user=user, as_pymodel=True)
 
 @router.patch("/school/{id}", tags=["Tested"])
 @limiter.limit("10/minute")
-def update_school(
+async def update_school(
     request: Request,
     id: int,
     payload: SchoolUpdate,
-    db: Session=Depends(get_db),
+    db: AsyncSession=Depends(get_async_db),
     user: Account=Depends(allow_roles([AccountRole.SYSTEM_ADMINISTRATOR]))
 ) -> SchoolOut:
-    return update_school_by_id(db=db, id=id, payload=payload, user=user, as_pymodel=True)
+    return await update_school_by_id(db=db, id=id, payload=payload, user=user, as_pymodel=True)
 
 @router.patch("/school/{id}/archive", tags=["Tested"])
 @limiter.limit("10/minute")
-def archive_school(
+async def archive_school(
     request: Request,
     id: int,
-    db: Session=Depends(get_db),
+    db: AsyncSession=Depends(get_async_db),
     user: Account=Depends(allow_roles([AccountRole.SYSTEM_ADMINISTRATOR]))
 ) -> SchoolOut:
-    return archive_school_by_id(db=db, id=id, user=user, as_pymodel=True)
+    return await archive_school_by_id(db=db, id=id, user=user, as_pymodel=True)
 
 @router.patch("/school/{id}/restore", tags=["Tested"])
 @limiter.limit("10/minute")
-def restore_school(
+async def restore_school(
     request: Request,
     id: int,
-    db: Session=Depends(get_db),
+    db: AsyncSession=Depends(get_async_db),
     user: Account=Depends(allow_roles([AccountRole.SYSTEM_ADMINISTRATOR]))
 ) -> SchoolOut:
-    return restore_school_by_id(db=db, id=id, user=user, as_pymodel=True)
+    return await restore_school_by_id(db=db, id=id, user=user, as_pymodel=True)
 
 
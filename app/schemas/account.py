@@ -1,7 +1,7 @@
 from datetime import datetime
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, EmailStr, Field
 
-from app.enums.all import AccountRole
+from app.enums.all import AccountRole, AccountStatusOutcome
 from app.schemas.dean import DeanAdminProfileOut
 from app.schemas.alumni import AlumniProfileOut
 from app.schemas.company import CompanyProfileOut
@@ -52,3 +52,20 @@ class DeanAccountIn(AdminAccountBaseIn):
 class PesoStaffAccountIn(AdminAccountBaseIn):
     pass
 
+class AccountBulkStatusIn(BaseModel):
+    ids: list[int] | None = Field(None, min_length=1, max_length=500)
+
+class DeanBulkStatusIn(AccountBulkStatusIn):
+    school_id: int | None = None
+
+class AlumniBulkStatusIn(AccountBulkStatusIn):
+    course_id: int | None = None
+    year_graduated: int | None = None
+
+class AccountStatusOutcomeOut(BaseModel):
+    id: int
+    outcome: AccountStatusOutcome
+
+class AccountBulkStatusOut(BaseModel):
+    updated: int
+    outcomes: list[AccountStatusOutcomeOut]
@@ -6,7 +6,7 @@ from app.schemas.course import CourseBase
 
 class AlumniProfileBase(BaseModel):
     id: int
-    profile_picture_filename: int
+    profile_picture_filename: str
     curriculum_vitae_filename: str | None = None
     dean_approval_status: AlumniApprovalStatus
     employment_status: AlumniEmploymentStatus
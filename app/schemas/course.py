@@ -8,4 +8,5 @@ class CourseBase(BaseModel):
     is_archived: bool
     created_at: datetime
     updated_at: datetime
+    model_config = {"from_attributes": True}
 
@@ -0,0 +1,143 @@
+import asyncio
+from math import ceil
+from time import perf_counter
+from fastapi.responses import JSONResponse
+
+from app.exceptions import *
+from app.utils.env import envi
+
+# route classes in one place: the requests that belong to each one, how many of them run at
+# once and how many more may wait for a slot. Requests outside every class are never held.
+ADMISSION_CLASSES = {
+    # multipart intake, file sniffing, image resizing and bcrypt
+    "uploads": {
+        "routes": [
+            ("POST", "/api/authentication/company/signup"),
+        ],
+        "concurrency": envi("APP_ADMISSION_UPLOADS_CONCURRENCY", 2),
+        "queue": envi("APP_ADMISSION_UPLOADS_QUEUE", 8),
+        "timeout": envi("APP_ADMISSION_UPLOADS_QUEUE_TIMEOUT_SECONDS", 10),
+    },
+    # bcrypt, once per request
+    "password": {
+        "routes": [
+            ("POST", "/api/authentication/login"),
+            ("POST", "/api/system-admin/"),
+            ("POST", "/api/system-admin/dean"),
+            ("POST", "/api/system-admin/peso-staff"),
+        ],
+        "concurrency": envi("APP_ADMISSION_PASSWORD_CONCURRENCY", 4),
+        "queue": envi("APP_ADMISSION_PASSWORD_QUEUE", 32),
+        "timeout": envi("APP_ADMISSION_PASSWORD_QUEUE_TIMEOUT_SECONDS", 5),
+    },
+}
+
+class AdmissionGate:
+    """
+    Runs at most `concurrency` requests of a route class at once and queues up to `queue` more.
+    A request that finds the queue full, or waits longer than `timeout`, is shed.
+    """
+
+    def __init__(self, name: str, *, concurrency: int, queue: int, timeout: int):
+        self.name = name
+        self.concurrency = concurrency
+        self.queue = queue
+        self.timeout = timeout
+        self.in_flight = 0
+        self.queued = 0
+        self.peak_queued = 0
+        self.admitted = 0
+        self.shed = 0
+        self.timeouts = 0
+        self.avg_duration = 0.0
+        self._slots = asyncio.Semaphore(concurrency)
+
+    async def acquire(self) -> bool:
+        if self._slots.locked() and self.queued >= self.queue:
+            self.shed += 1
+            return False
+
+        self.queued += 1
+        self.peak_queued = max(self.peak_queued, self.queued)
+
+        try:
+            await asyncio.wait_for(self._slots.acquire(), self.timeout)
+        except TimeoutError:
+            self.shed += 1
+            self.timeouts += 1
+            return False
+        finally:
+            self.queued -= 1
+
+        self.in_flight += 1
+        self.admitted += 1
+        return True
+
+    def release(self, duration: float) -> None:
+        self.in_flight -= 1
+        self._slots.release()
+        # moving average, recent requests weigh the most
+        self.avg_duration = duration if self.admitted == 1 else self.avg_duration * 0.9 + duration * 0.1
+
+    def retry_after(self) -> int:
+        # roughly how long the work ahead of a new request takes to drain
+        return max(1, ceil(self.avg_duration * (self.in_flight + self.queued + 1) / self.concurrency))
+
+    def stats(self) -> dict:
+        return {
+            "concurrency": self.concurrency,
+            "queue": self.queue,
+            "queue_timeout_seconds": self.timeout,
+            "in_flight": self.in_flight,
+            "queued": self.queued,
+            "peak_queued": self.peak_queued,
+            "admitted": self.admitted,
+            "shed": self.shed,
+            "timeouts": self.timeouts,
+            "avg_duration_ms": round(self.avg_duration * 1000, 3),
+        }
+
+admission_gates = {
+    name: AdmissionGate(name, concurrency=config["concurrency"], queue=config["queue"], timeout=config["timeout"])
+    for name, config in ADMISSION_CLASSES.items()
+}
+
+_route_gates = {
+    route: admission_gates[name]
+    for name, config in ADMISSION_CLASSES.items()
+    for route in config["routes"]
+}
+
+def get_admission_stats() -> dict:
+    return {name: gate.stats() for name, gate in admission_gates.items()}
+
+class AdmissionControlMiddleware:
+    """
+    Holds requests of a route class at the door, before their body is read, so a burst of
+    uploads can't take every worker thread from the cheap requests. Shed requests get a 503
+    with a Retry-After.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        gate = _route_gates.get((scope["method"], scope["path"])) if scope["type"] == "http" else None
+
+        if gate is None:
+            return await self.app(scope, receive, send)
+
+        if not await gate.acquire():
+            response = JSONResponse(
+                content={"detail": ADMISSION_SERVER_BUSY_EXCEPTION.detail},
+                status_code=ADMISSION_SERVER_BUSY_EXCEPTION.status_code,
+                headers={"Retry-After": str(gate.retry_after())}
+            )
+            return await response(scope, receive, send)
+
+        started = perf_counter()
+
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            gate.release(perf_counter() - started)
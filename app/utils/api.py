@@ -1,5 +1,35 @@
+import orjson
+from pydantic import BaseModel
 from slowapi import Limiter
-from slowapi.util import get_remote_address
+from fastapi.responses import ORJSONResponse
 
-limiter = Limiter(key_func=get_remote_address)
+from app.utils.env import envs
+from app.utils.storage import STORAGE_FOLDER_PATH
+from app.utils.rate_limit import get_rate_limit_key
 
+# sqlite:// is shared by the workers of one host, redis:// by every host (needs the redis package)
+# and memory:// is per worker, for local runs
+RATE_LIMIT_STORAGE_URI = envs("APP_RATE_LIMIT_STORAGE_URI") or f"sqlite:///{STORAGE_FOLDER_PATH / '.rate_limits.db'}"
+RATE_LIMIT_STRATEGY = envs("APP_RATE_LIMIT_STRATEGY", "sliding-window-counter")
+
+# if the shared storage fails, each worker keeps limiting on its own instead of failing requests
+limiter = Limiter(
+    key_func=get_rate_limit_key,
+    storage_uri=RATE_LIMIT_STORAGE_URI,
+    strategy=RATE_LIMIT_STRATEGY,
+    in_memory_fallback_enabled=True
+)
+
+def _serialize_pymodel(obj):
+    if isinstance(obj, BaseModel):
+        return obj.model_dump()
+    raise TypeError
+
+class PageResponse(ORJSONResponse):
+    """
+    Encodes already validated list responses with orjson. Routes return it directly so that
+    FastAPI skips revalidating the page against the response model and the stdlib encoder.
+    """
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content, default=_serialize_pymodel, option=orjson.OPT_NON_STR_KEYS)
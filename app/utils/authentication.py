@@ -1,12 +1,13 @@
 from jwt import encode
 from sqlalchemy.orm import Session
 from fastapi import HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import OAuth2PasswordRequestForm
 
 from app.exceptions import *
 from app.schemas.access_token import Token
 from app.crud.account import get_account_by_email
-from app.utils.password import verify_password
+from app.utils.password import verify_password, verify_password_async
 from app.utils.env import envs
 from app.utils.datetime import get_access_token_expiry
 
@@ -29,3 +30,13 @@ def authenticate_user(db: Session, form_data: OAuth2PasswordRequestForm) -> Toke
         token_type="bearer"
     )
 
+async def authenticate_user_async(db: Session, form_data: OAuth2PasswordRequestForm) -> Token:
+    db_account = await run_in_threadpool(get_account_by_email, db=db, email=form_data.username)
+
+    if not db_account or not await verify_password_async(form_data.password, db_account.password):
+        raise AUTHENTICATION_INVALID_CREDENTIALS_EXCEPTION
+    
+    return Token(
+        access_token=create_access_token(data={"sub": db_account.email}),
+        token_type="bearer"
+    )
@@ -1,5 +1,5 @@
 from typing import Annotated
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from jwt import decode
 from jwt.exceptions import InvalidTokenError
 from fastapi import Depends
@@ -7,14 +7,23 @@ from fastapi.security import OAuth2PasswordBearer
 
 from app.exceptions import *
 from app.utils.env import envs
-from app.database import get_db
+from app.database import get_async_db
 from app.models.all import Account
 from app.enums.all import AccountRole
-from app.crud.account import get_account_by_email
+from app.crud.account_async import get_account_by_email
+from app.utils.principal import cache_principal, get_cached_principal
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/authentication/login")
 
-def get_current_user(access_token: Annotated[str, Depends(oauth2_scheme)], db: Session=Depends(get_db)) -> Account:
+# async, so the lookup awaits the async driver on the event loop instead of taking a threadpool
+# thread and a connection from the sync pool on every request, sync routes included
+async def get_current_user(access_token: Annotated[str, Depends(oauth2_scheme)], db: AsyncSession=Depends(get_async_db)) -> Account:
+    # skip the decoding and the account lookup if we've already verified this token
+    cached_account = get_cached_principal(access_token)
+
+    if cached_account:
+        return cached_account
+
     secret_key = envs("APP_DB_URL")
     secret_key_algo = envs("APP_JWT_SECRET_KEY_ALGORITHM")
     
@@ -28,10 +37,13 @@ def get_current_user(access_token: Annotated[str, Depends(oauth2_scheme)], db: S
     except InvalidTokenError:
         raise TOKEN_INVALID_CREDENTIALS_EXCEPTION
     
-    user_account = get_account_by_email(
+    # from the primary, a lagging replica could still show a just disabled account as enabled
+    # and it would be cached that way
+    user_account = await get_account_by_email(
         db=db,
         email=email,
         allow_none=True,
+        use_primary=True
     )
     
     # raise if user's account is not recognized
@@ -42,10 +54,12 @@ def get_current_user(access_token: Annotated[str, Depends(oauth2_scheme)], db: S
     if user_account.is_disabled:
         raise ACCOUNT_CURRENTLY_DISABLED_EXCEPTION
 
+    cache_principal(access_token, payload, user_account)
+
     return user_account
 
 def allow_roles(allowed_roles: list[AccountRole]):
-    def wrapper(user: Account=Depends(get_current_user)):
+    async def wrapper(user: Account=Depends(get_current_user)):
         user_role = user.role
 
         if user_role not in allowed_roles:
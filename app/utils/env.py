@@ -15,13 +15,19 @@ def _require(key: str) -> str:
 def envs(key: str, default: str | None = None) -> str | None:
    return os.getenv(key, default)
 
-def envi(key: str) -> int:
+def envi(key: str, default: int | None = None) -> int:
+   if default is not None and os.getenv(key) is None:
+      return default
+
    try:
       return int(_require(key))
    except ValueError:
       raise RuntimeError(f"Invalid int value for env var: {key}")
 
-def envf(key: str) -> float:
+def envf(key: str, default: float | None = None) -> float:
+   if default is not None and os.getenv(key) is None:
+      return default
+
    try:
       return float(_require(key))
    except ValueError:
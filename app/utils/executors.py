@@ -0,0 +1,170 @@
+import os
+from asyncio import wrap_future
+from threading import Lock
+from multiprocessing import get_context
+from concurrent.futures import Executor, Future, ThreadPoolExecutor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from app.exceptions import *
+from app.utils.env import envs, envi
+
+# every executor by name, for warming up, shutting down and the diagnostics
+executors: dict[str, "BoundedExecutor"] = {}
+
+def _noop() -> None:
+    pass
+
+def _preload_image_modules() -> None:
+    from PIL import Image
+
+class BoundedExecutor:
+    """
+    A named thread or process pool with a bound on the work waiting for it, submitting past
+    the bound raises SERVER_BUSY_EXCEPTION instead of queueing without limit. Process pools use
+    all cores despite the GIL, for CPU-bound pure python or GIL-holding work. Thread pools fit
+    blocking I/O and C code that releases the GIL.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        kind: str,
+        max_workers: int,
+        max_pending: int,
+        initializer=None
+    ):
+        if kind not in {"thread", "process"}:
+            raise RuntimeError(f"Invalid {name} executor kind: {kind}")
+
+        self.name = name
+        self.kind = kind
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.initializer = initializer
+        self.pending = 0
+        self.peak_pending = 0
+        self.completed = 0
+        self.rejected = 0
+        self._executor: Executor | None = None
+        self._lock = Lock()
+        executors[name] = self
+
+    def _get_executor(self) -> Executor:
+        # created on first use, process pools can't be started at import time
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    if self.kind == "process":
+                        # spawned, forking a process that runs threads can copy a held lock into the child
+                        self._executor = ProcessPoolExecutor(
+                            max_workers=self.max_workers,
+                            mp_context=get_context("spawn"),
+                            initializer=self.initializer
+                        )
+                    else:
+                        self._executor = ThreadPoolExecutor(
+                            max_workers=self.max_workers,
+                            thread_name_prefix=self.name,
+                            initializer=self.initializer
+                        )
+        return self._executor
+
+    def _replace_broken_executor(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+
+        if executor is not None:
+            print(f"[DEBUG] Replacing the broken {self.name} executor.")
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _done(self, _future: Future) -> None:
+        with self._lock:
+            self.pending -= 1
+            self.completed += 1
+
+    def submit(self, fn, *args) -> Future:
+        with self._lock:
+            if self.pending >= self.max_pending:
+                self.rejected += 1
+                raise SERVER_BUSY_EXCEPTION
+
+            self.pending += 1
+            self.peak_pending = max(self.peak_pending, self.pending)
+
+        try:
+            try:
+                future = self._get_executor().submit(fn, *args)
+            except BrokenProcessPool:
+                # a worker died (e.g. on a hostile image), the pool is unusable until replaced
+                self._replace_broken_executor()
+                future = self._get_executor().submit(fn, *args)
+        except Exception:
+            with self._lock:
+                self.pending -= 1
+            raise
+
+        future.add_done_callback(self._done)
+        return future
+
+    def run(self, fn, *args):
+        return self.submit(fn, *args).result()
+
+    async def run_async(self, fn, *args):
+        return await wrap_future(self.submit(fn, *args))
+
+    def warm(self) -> None:
+        """Starts the workers (which runs the initializer in each), so the first requests don't pay for it."""
+
+        executor = self._get_executor()
+
+        for future in [executor.submit(_noop) for _ in range(self.max_workers)]:
+            future.result()
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "kind": self.kind,
+                "max_workers": self.max_workers,
+                "max_pending": self.max_pending,
+                "in_flight": min(self.pending, self.max_workers),
+                "queued": max(self.pending - self.max_workers, 0),
+                "peak_pending": self.peak_pending,
+                "completed": self.completed,
+                "rejected": self.rejected,
+            }
+
+def warm_executors() -> None:
+    for executor in executors.values():
+        executor.warm()
+
+def shutdown_executors() -> None:
+    for executor in executors.values():
+        executor.shutdown()
+
+def get_executor_stats() -> dict:
+    return {name: executor.stats() for name, executor in executors.items()}
+
+# image decoding and resizing, CPU-bound and mostly holding the GIL
+cpu_executor = BoundedExecutor(
+    "cpu",
+    kind=envs("APP_CPU_EXECUTOR", "process"),
+    max_workers=envi("APP_CPU_EXECUTOR_WORKERS", os.cpu_count() or 1),
+    max_pending=envi("APP_CPU_EXECUTOR_MAX_PENDING", 64),
+    initializer=_preload_image_modules
+)
+
+# blocking file I/O and MIME sniffing (libmagic releases the GIL)
+io_executor = BoundedExecutor(
+    "io",
+    kind="thread",
+    max_workers=envi("APP_IO_EXECUTOR_WORKERS", 8),
+    max_pending=envi("APP_IO_EXECUTOR_MAX_PENDING", 256)
+)
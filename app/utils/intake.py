@@ -0,0 +1,194 @@
+from tempfile import NamedTemporaryFile
+from fastapi import Request
+from fastapi.exceptions import RequestValidationError
+from starlette.datastructures import FormData, UploadFile
+from starlette.formparsers import MultiPartParser, MultiPartException
+from python_multipart.multipart import parse_options_header
+
+from app.exceptions import *
+from app.utils.storage import UPLOAD_MAX_SIZE_MB, TEMP_STORAGE_FOLDER_PATH
+
+# bytes sniffed from the start of every file part, as much as the staging check reads
+SNIFF_BYTES = 2048
+MAX_FORM_FIELD_SIZE = 64 * 1024
+# the text fields and the multipart headers, on top of the files
+MAX_FORM_OVERHEAD = 256 * 1024
+
+class FilePartRule:
+    def __init__(self, label: str, allowed_mimes: set[str], max_size: int=UPLOAD_MAX_SIZE_MB):
+        self.label = label
+        self.allowed_mimes = allowed_mimes
+        self.max_size = max_size
+
+    @property
+    def max_bytes(self) -> int:
+        return self.max_size * 1024 * 1024
+
+class StreamingMultiPartParser(MultiPartParser):
+    """
+    Starlette's multipart parser with the upload limits enforced while the body arrives:
+    the body and every file part are counted as they're received, and a file's type is
+    sniffed from its first bytes. The request fails on the first chunk over a limit or the
+    first wrong type, before the rest is read or spooled. A file part without a rule, or for a
+    field already received, is dropped as it arrives, before Starlette counts or spools it, so
+    only the first part of each allowed field counts toward max_files. Those are spooled to
+    named files in the temp folder, which staging renames instead of copying.
+
+    Hooks into the parser's private state (_current_part, _files_to_close_on_error), which is
+    why starlette is pinned in requirements.txt, check these when upgrading it.
+    """
+
+    def __init__(self, headers, stream, *, file_rules: dict[str, FilePartRule], max_body_size: int):
+        super().__init__(headers, self._count_body(stream), max_files=len(file_rules), max_part_size=MAX_FORM_FIELD_SIZE)
+        self.file_rules = file_rules
+        self.max_body_size = max_body_size
+        self.body_size = 0
+        self._received_files: set[str] = set()
+        self._dropped = False
+        self._rule: FilePartRule | None = None
+        self._part_size = 0
+        self._part_head = bytearray()
+
+    async def _count_body(self, stream):
+        async for chunk in stream:
+            self.body_size += len(chunk)
+
+            if self.body_size > self.max_body_size:
+                raise REQUEST_BODY_TOO_LARGE_EXCEPTION
+
+            yield chunk
+
+    def _check_type(self) -> None:
+        import magic # imported on first use, it's slow to import and most requests never upload
+
+        if magic.from_buffer(bytes(self._part_head), mime=True) not in self._rule.allowed_mimes:
+            RAISE_FILE_TYPE_NOT_SUPPORTED_EXCEPTION_FOR(self._rule.label)
+
+    def on_headers_finished(self) -> None:
+        part = self._current_part
+        self._part_size = 0
+        self._part_head.clear()
+        _disposition, options = parse_options_header(part.content_disposition)
+        # rule names are ascii, a name that doesn't decode to one has no rule either way
+        name = options.get(b"name", b"").decode("latin-1")
+        self._rule = None if name in self._received_files else self.file_rules.get(name)
+        self._dropped = b"filename" in options and self._rule is None
+
+        if self._dropped:
+            return
+
+        super().on_headers_finished()
+
+        if part.file is not None:
+            # the first part of a field is the one kept, even an empty one
+            self._received_files.add(part.field_name)
+            # replaces the in-memory spool, nothing was written to it yet
+            self._files_to_close_on_error.pop().close()
+            spool = NamedTemporaryFile(dir=TEMP_STORAGE_FOLDER_PATH, prefix=".upload-", suffix=".part")
+            self._files_to_close_on_error.append(spool)
+            part.file.file = spool
+
+    def on_part_data(self, data: bytes, start: int, end: int) -> None:
+        if self._dropped:
+            return
+
+        if self._current_part.file is None:
+            return super().on_part_data(data, start, end)
+
+        self._part_size += end - start
+
+        if self._part_size > self._rule.max_bytes:
+            RAISE_FILE_PART_TOO_LARGE_EXCEPTION_FOR(self._rule.label, self._rule.max_size)
+
+        if len(self._part_head) < SNIFF_BYTES:
+            self._part_head.extend(data[start:min(end, start + SNIFF_BYTES - len(self._part_head))])
+
+            if len(self._part_head) >= SNIFF_BYTES:
+                self._check_type()
+
+        super().on_part_data(data, start, end)
+
+    def on_part_end(self) -> None:
+        if self._dropped:
+            return
+
+        part = self._current_part
+
+        if part.file is not None:
+            # browsers send an empty, nameless part for a file input left empty
+            if self._part_size == 0 and not part.file.filename:
+                part.file.file.close()
+                return
+
+            if len(self._part_head) < SNIFF_BYTES:
+                self._check_type()
+
+        super().on_part_end()
+
+    async def parse(self) -> FormData:
+        try:
+            return await super().parse()
+        except MultiPartException as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
+        except BaseException:
+            for file in self._files_to_close_on_error:
+                file.close()
+            raise
+
+async def read_multipart(request: Request, *, file_rules: dict[str, FilePartRule]) -> FormData:
+    """
+    Reads a multipart body with limits from the file rules, a body declaring a bigger
+    Content-Length than they allow is refused before any of it is read. Close the form once
+    done with it, its files aren't closed along with the request.
+    """
+
+    content_type, _params = parse_options_header(request.headers.get("content-type", ""))
+
+    if content_type != b"multipart/form-data":
+        raise MULTIPART_BODY_REQUIRED_EXCEPTION
+
+    max_body_size = sum(rule.max_bytes for rule in file_rules.values()) + MAX_FORM_OVERHEAD
+    content_length = request.headers.get("content-length", "")
+
+    if content_length.isdigit() and int(content_length) > max_body_size:
+        raise REQUEST_BODY_TOO_LARGE_EXCEPTION
+
+    parser = StreamingMultiPartParser(request.headers, request.stream(), file_rules=file_rules, max_body_size=max_body_size)
+    return await parser.parse()
+
+def get_form_fields(form: FormData, names: tuple[str, ...]) -> dict[str, str]:
+    """The required text fields, missing ones fail like a missing Form(...) parameter."""
+
+    fields = {name: form.get(name) for name in names}
+    errors = [
+        {"type": "missing", "loc": ("body", name), "msg": "Field required", "input": None}
+        for name, value in fields.items()
+        if value is None or isinstance(value, UploadFile)
+    ]
+
+    if errors:
+        raise RequestValidationError(errors)
+
+    return fields
+
+def get_form_files(form: FormData, names) -> dict[str, UploadFile | None]:
+    """The optional file fields, a text value sent in a file field counts as no file."""
+
+    return {name: value if isinstance(value := form.get(name), UploadFile) else None for name in names}
+
+def get_multipart_openapi(fields: tuple[str, ...], file_rules: dict[str, FilePartRule]) -> dict:
+    """Documents a body read with read_multipart, which FastAPI can't see."""
+
+    properties = {name: {"type": "string"} for name in fields}
+    properties.update({name: {"type": "string", "format": "binary"} for name in file_rules})
+
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {
+                "multipart/form-data": {
+                    "schema": {"type": "object", "properties": properties, "required": list(fields)},
+                },
+            },
+        },
+    }
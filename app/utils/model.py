@@ -1,13 +1,201 @@
-from sqlalchemy import func
+import json
+from datetime import datetime
+from functools import lru_cache
+from typing import get_args
+from base64 import urlsafe_b64encode, urlsafe_b64decode
+from pydantic import BaseModel, TypeAdapter
+from sqlalchemy import or_, and_, inspect
+from sqlalchemy.orm import load_only, selectinload, joinedload
+from sqlalchemy.orm.interfaces import MANYTOONE
 
-def paginate(query, *, page: int, size: int, distinct_col) -> tuple:
-    total = (
-        query.order_by(None)
-        .with_entities(func.count(func.distinct(distinct_col)))
-        .scalar()
-    )
-    items = query.offset((page - 1) * size).limit(size).all()
-    return total, items
+from app.exceptions import *
+from app.utils.totals import count_exact, get_total
+
+def encode_cursor(values: tuple, direction: str) -> str:
+    payload = {
+        "d": direction,
+        "v": [{"dt": value.isoformat()} if isinstance(value, datetime) else value for value in values],
+    }
+    return urlsafe_b64encode(json.dumps(payload, separators=(",", ":")).encode()).decode().rstrip("=")
+
+def decode_cursor(cursor: str) -> tuple[list, str]:
+    try:
+        payload = json.loads(urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        direction = payload["d"]
+        values = [datetime.fromisoformat(value["dt"]) if isinstance(value, dict) else value for value in payload["v"]]
+    except Exception:
+        raise PAGINATION_INVALID_CURSOR_EXCEPTION
+
+    if direction not in {"next", "prev"}:
+        raise PAGINATION_INVALID_CURSOR_EXCEPTION
+
+    return values, direction
+
+def _keyset_filter(keys: tuple, values: list, direction: str):
+    """
+    (a, b) > (x, y) expanded into a > x OR (a = x AND b > y), which every backend can use an
+    index for. keys are (column, descending) pairs, a descending key compares the other way.
+    """
+
+    if len(values) != len(keys):
+        raise PAGINATION_INVALID_CURSOR_EXCEPTION
+
+    clauses = []
+
+    for i, (col, descending) in enumerate(keys):
+        equalities = [keys[j][0] == values[j] for j in range(i)]
+        comparison = col > values[i] if (direction == "next") != descending else col < values[i]
+        clauses.append(and_(*equalities, comparison))
+
+    return or_(*clauses)
+
+def _keyset_ordering(keys: tuple, *, reverse: bool=False) -> list:
+    return [col.desc() if descending != reverse else col.asc() for col, descending in keys]
+
+def _row_key(row, order_cols: tuple) -> tuple:
+    return tuple(getattr(row, col.key) for col in order_cols)
+
+def _split_rows(rows, order_cols: tuple, ranked: bool) -> tuple[list, list]:
+    """The items and the keyset key of each, a ranked row comes with its rank as (item, rank)."""
+
+    if not ranked:
+        return rows, [_row_key(row, order_cols) for row in rows]
+
+    return [row[0] for row in rows], [(row[1], *_row_key(row[0], order_cols)) for row in rows]
+
+def paginate(
+    query,
+    *,
+    page: int,
+    size: int,
+    distinct_col,
+    order_cols: tuple=(),
+    cursor: str | None=None,
+    count_key: tuple | None=None,
+    estimate: bool=False,
+    rank=None
+) -> tuple:
+    """
+    Returns (total, items, page info). When a cursor is given, the page is seeked with a keyset
+    filter on order_cols instead of an OFFSET, page is ignored in that case. When a count key
+    is given, the total goes through the totals cache and may be an estimate. A rank (search
+    relevance) orders the results ahead of order_cols, in both modes: it's fetched along with
+    each row and its cursors carry it, so they only fit the same search.
+    """
+
+    if count_key is None:
+        total, total_is_exact = count_exact(query, distinct_col=distinct_col), True
+    else:
+        total, total_is_exact = get_total(query, distinct_col=distinct_col, count_key=count_key, estimate=estimate)
+
+    if not order_cols:
+        items = query.offset((page - 1) * size).limit(size).all()
+        return total, items, {"total_is_exact": total_is_exact, "next_cursor": None, "prev_cursor": None}
+
+    keys = tuple((col, False) for col in order_cols)
+
+    if rank is not None:
+        query = query.add_columns(rank)
+        keys = ((rank, True), *keys)
+
+    # one extra row tells us if there's a next page without trusting a possibly estimated total
+    if not cursor:
+        rows = query.order_by(*_keyset_ordering(keys)).offset((page - 1) * size).limit(size + 1).all()
+        has_next = len(rows) > size
+        rows = rows[:size]
+        has_prev = page > 1
+    else:
+        values, direction = decode_cursor(cursor)
+        query = query.filter(_keyset_filter(keys, values, direction))
+
+        if direction == "next":
+            rows = query.order_by(*_keyset_ordering(keys)).limit(size + 1).all()
+            has_next = len(rows) > size
+            rows = rows[:size]
+            has_prev = True
+        else:
+            rows = query.order_by(*_keyset_ordering(keys, reverse=True)).limit(size + 1).all()
+            has_prev = len(rows) > size
+            rows = list(reversed(rows[:size]))
+            has_next = True
+
+    items, row_keys = _split_rows(rows, order_cols, rank is not None)
+    page_info = {
+        "total_is_exact": total_is_exact,
+        "next_cursor": encode_cursor(row_keys[-1], "next") if items and has_next else None,
+        "prev_cursor": encode_cursor(row_keys[0], "prev") if items and has_prev else None,
+    }
+    return total, items, page_info
+
+@lru_cache(maxsize=None)
+def get_list_adapter(pymodel) -> TypeAdapter:
+    return TypeAdapter(list[pymodel])
 
 def to_pymodels(models, pymodel):
-    return [pymodel.model_validate(model) for model in models]
\ No newline at end of file
+    # one validation pass over the whole page instead of one call per row
+    return get_list_adapter(pymodel).validate_python(models, from_attributes=True)
+
+def _get_nested_pymodel(annotation) -> type[BaseModel] | None:
+    """The pydantic model inside an annotation such as X, X | None or list[X], if any."""
+
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation
+
+    for arg in get_args(annotation):
+        pymodel = _get_nested_pymodel(arg)
+
+        if pymodel:
+            return pymodel
+
+    return None
+
+def _build_load_options(entity, pymodel, aliases: dict, include: tuple) -> tuple:
+    mapper = inspect(entity)
+    columns = list(include)
+    loaders = []
+
+    for name, field in pymodel.model_fields.items():
+        attribute = aliases.get(name)
+        key = attribute.key if attribute is not None else name
+
+        if key in mapper.column_attrs:
+            columns.append(getattr(entity, key))
+            continue
+
+        if key not in mapper.relationships:
+            continue
+
+        nested_pymodel = _get_nested_pymodel(field.annotation)
+
+        if nested_pymodel is None:
+            continue
+
+        relationship = mapper.relationships[key]
+        target = relationship.mapper
+
+        # the target has to keep the columns the relationship is joined on
+        nested_include = tuple(
+            getattr(target.class_, target.get_property_by_column(column).key)
+            for column in relationship.remote_side
+            if column in target.columns.values()
+        )
+        nested_options = _build_load_options(target.class_, nested_pymodel, {}, nested_include)
+
+        if relationship.direction is MANYTOONE:
+            columns.extend(getattr(entity, mapper.get_property_by_column(column).key) for column in relationship.local_columns)
+            loaders.append(joinedload(getattr(entity, key)).options(*nested_options))
+        else:
+            loaders.append(selectinload(getattr(entity, key)).options(*nested_options))
+
+    return (load_only(*dict.fromkeys(columns)), *loaders)
+
+@lru_cache(maxsize=None)
+def get_load_options(entity, pymodel, *, aliases: tuple=(), include: tuple=()) -> tuple:
+    """
+    Loader options that fetch exactly what a response model reads: load_only for its columns,
+    joinedload for many-to-one and selectinload for the other relationships it nests. Aliases
+    map fields that are python properties to the relationship they read, e.g. the account's
+    profile, so serializing the loaded rows never goes back to the database.
+    """
+
+    return _build_load_options(entity, pymodel, dict(aliases), include)
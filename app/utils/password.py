@@ -1,21 +1,53 @@
+import os
+from functools import lru_cache
 from secrets import choice
 from string import ascii_letters, digits
-from passlib.context import CryptContext
 
-from app.utils.env import envs
+from app.exceptions import *
+from app.utils.env import envs, envi
+from app.utils.executors import BoundedExecutor
 
 algorithm = envs("APP_ALGORITHM")
 secret_key = envs("APP_SECRET_KEY")
 
 safe_symbols = "!@#$%^&*-_=+?"
 
-crypt_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+@lru_cache(maxsize=None)
+def get_crypt_context():
+    # passlib and bcrypt are imported by the first hash or verify (in the hashing worker)
+    from passlib.context import CryptContext
+
+    return CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+def _hash(plain_password: str) -> str:
+    return get_crypt_context().hash(plain_password)
+
+def _verify(plain_password: str, hashed_password: str) -> bool:
+    return get_crypt_context().verify(plain_password, hashed_password)
+
+def _load_crypt_context() -> None:
+    get_crypt_context()
+
+# bcrypt releases the GIL, so threads already hash in parallel, a process pool also works
+password_hasher = BoundedExecutor(
+    "password",
+    kind=envs("APP_PASSWORD_HASHING_EXECUTOR", "thread"),
+    max_workers=envi("APP_PASSWORD_HASHING_WORKERS", min(4, os.cpu_count() or 1)),
+    max_pending=envi("APP_PASSWORD_HASHING_MAX_PENDING", 64),
+    initializer=_load_crypt_context
+)
 
 def hash_password(plain_password: str):
-    return crypt_context.hash(plain_password)
+    return password_hasher.run(_hash, plain_password)
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return crypt_context.verify(plain_password, hashed_password)
+    return password_hasher.run(_verify, plain_password, hashed_password)
+
+async def hash_password_async(plain_password: str) -> str:
+    return await password_hasher.run_async(_hash, plain_password)
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    return await password_hasher.run_async(_verify, plain_password, hashed_password)
 
 def generate_password(length: int=8) -> str:
-    return "".join(choice(ascii_letters + safe_symbols + digits) for _ in range(length))
\ No newline at end of file
+    return "".join(choice(ascii_letters + safe_symbols + digits) for _ in range(length))
@@ -0,0 +1,147 @@
+from time import perf_counter
+from threading import Lock
+from contextvars import ContextVar
+from starlette.datastructures import MutableHeaders
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import QueuePool, AsyncAdaptedQueuePool
+
+from app.utils.env import envi, envb
+
+# shared by the sync and async engines, each one gets its own pool
+POOL_SETTINGS = {
+    "pool_size": envi("APP_DB_POOL_SIZE", 5),
+    "max_overflow": envi("APP_DB_MAX_OVERFLOW", 10),
+    "pool_timeout": envi("APP_DB_POOL_TIMEOUT_SECONDS", 30),
+    # below MySQL's wait_timeout, so idle connections are replaced before the server drops them
+    "pool_recycle": envi("APP_DB_POOL_RECYCLE_SECONDS", 1800),
+    "pool_pre_ping": envb("APP_DB_POOL_PRE_PING", True),
+}
+
+POOL_WARM_CONNECTIONS = envi("APP_DB_POOL_WARM_CONNECTIONS", 2)
+
+class WaitStats:
+    """Count, total and max of a wait time (seconds), reported in milliseconds."""
+
+    def __init__(self):
+        self.count = 0
+        self.timeouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self._lock = Lock()
+
+    def record(self, wait: float, *, timed_out: bool=False) -> None:
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+                return
+
+            self.count += 1
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "count": self.count,
+                "timeouts": self.timeouts,
+                "avg_wait_ms": round(self.total_wait / self.count * 1000, 3) if self.count else 0.0,
+                "max_wait_ms": round(self.max_wait * 1000, 3),
+            }
+
+# connection acquire time of the current request: [total seconds, connections]
+_request_acquire: ContextVar[list | None] = ContextVar("request_acquire", default=None)
+
+request_acquire_stats = WaitStats()
+
+class _MonitoredPool:
+    """Times every connection checkout, including the wait for a free connection and the pre-ping."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.wait_stats = WaitStats()
+
+    def connect(self):
+        started = perf_counter()
+
+        try:
+            connection = super().connect()
+        except PoolTimeoutError:
+            self.wait_stats.record(perf_counter() - started, timed_out=True)
+            raise
+
+        wait = perf_counter() - started
+        self.wait_stats.record(wait)
+        request_acquire = _request_acquire.get()
+
+        if request_acquire is not None:
+            request_acquire[0] += wait
+            request_acquire[1] += 1
+
+        return connection
+
+    def recreate(self):
+        # dispose() and invalidation swap the pool, the counters carry over
+        pool = super().recreate()
+        pool.wait_stats = self.wait_stats
+        return pool
+
+    def stats(self) -> dict:
+        return {
+            "size": self.size(),
+            "checked_out": self.checkedout(),
+            "checked_in": self.checkedin(),
+            "overflow": max(self.overflow(), 0),
+            "max_overflow": self._max_overflow,
+            "acquire": self.wait_stats.stats(),
+        }
+
+class MonitoredQueuePool(_MonitoredPool, QueuePool):
+    pass
+
+class MonitoredAsyncQueuePool(_MonitoredPool, AsyncAdaptedQueuePool):
+    pass
+
+def warm_pool(engine, connections: int=POOL_WARM_CONNECTIONS) -> int:
+    """Opens connections up front so the first requests don't pay for the handshakes."""
+
+    opened = [engine.connect() for _ in range(min(connections, POOL_SETTINGS["pool_size"]))]
+
+    for connection in opened:
+        connection.close()
+
+    return len(opened)
+
+async def warm_async_pool(engine, connections: int=POOL_WARM_CONNECTIONS) -> int:
+    opened = [await engine.connect() for _ in range(min(connections, POOL_SETTINGS["pool_size"]))]
+
+    for connection in opened:
+        await connection.close()
+
+    return len(opened)
+
+class AcquireLatencyMiddleware:
+    """Records how long each request waited for database connections, also sent as a Server-Timing header."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        request_acquire = [0.0, 0]
+        token = _request_acquire.set(request_acquire)
+
+        async def send_with_timing(message):
+            if message["type"] == "http.response.start" and request_acquire[1]:
+                headers = MutableHeaders(scope=message)
+                headers.append("Server-Timing", f"db-acquire;dur={request_acquire[0] * 1000:.3f}")
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _request_acquire.reset(token)
+
+            if request_acquire[1]:
+                request_acquire_stats.record(request_acquire[0])
@@ -0,0 +1,59 @@
+from time import time
+
+from app.models.account import Account
+from app.utils.cache import TTLCache
+from app.utils.env import envi
+
+# verified token claims + a detached snapshot of the account, keyed by access token. Every
+# worker has its own, the TTL is how long the other workers may still let a disabled account in.
+principal_cache = TTLCache(
+    max_size=envi("APP_PRINCIPAL_CACHE_MAX_SIZE", 1024),
+    ttl=envi("APP_PRINCIPAL_CACHE_TTL_SECONDS", 5),
+)
+
+def cache_principal(access_token: str, claims: dict, account: Account) -> None:
+    snapshot = {
+        "id": account.id,
+        "role": account.role,
+        "email": account.email,
+        "is_disabled": account.is_disabled,
+    }
+    # never keep a principal around longer than its token is valid
+    ttl = claims.get("exp", time() + principal_cache.ttl) - time()
+    principal_cache.set(access_token, (claims, snapshot), ttl=ttl)
+
+def _get_cached_entry(access_token: str) -> tuple[dict, dict] | None:
+    entry = principal_cache.get(access_token)
+
+    if entry is None:
+        return None
+
+    claims, _snapshot = entry
+
+    if "exp" in claims and claims["exp"] <= time():
+        principal_cache.discard(access_token)
+        return None
+
+    return entry
+
+def get_cached_claims(access_token: str) -> dict | None:
+    entry = _get_cached_entry(access_token)
+    return entry[0] if entry else None
+
+def get_cached_principal(access_token: str) -> Account | None:
+    """Returns a transient (session-less) account built from the cached snapshot."""
+
+    entry = _get_cached_entry(access_token)
+    return Account(**entry[1]) if entry else None
+
+def invalidate_principal(*account_ids: int) -> None:
+    """
+    Locks the accounts out of this worker at once. Other workers only drop them when their
+    entries expire, at most APP_PRINCIPAL_CACHE_TTL_SECONDS later.
+    """
+
+    account_ids = set(account_ids)
+    principal_cache.discard_where(lambda entry: entry[1]["id"] in account_ids)
+
+def get_principal_cache_stats() -> dict:
+    return principal_cache.stats()
@@ -0,0 +1,170 @@
+import os
+import sqlite3
+from math import floor
+from time import time
+from threading import local
+from contextlib import contextmanager
+from jwt import decode
+from jwt.exceptions import InvalidTokenError
+from fastapi import Request
+from slowapi.util import get_remote_address
+from limits.storage.base import Storage, SlidingWindowCounterSupport, TimestampedSlidingWindow
+
+from app.utils.env import envs
+from app.utils.principal import get_cached_claims
+
+# expired counters are swept at most this often, per process
+SQLITE_SWEEP_SECONDS = 60
+
+class SQLiteStorage(Storage, SlidingWindowCounterSupport, TimestampedSlidingWindow):
+    """
+    Rate limit counters in a SQLite database in WAL mode, shared by every worker on the host.
+    Checking and counting a hit is one short write transaction, so concurrent workers can't
+    both take the last slot of a window. Use it as sqlite:///relative.db or sqlite:////absolute.db.
+    """
+
+    STORAGE_SCHEME = ["sqlite"]
+
+    def __init__(self, uri: str, wrap_exceptions: bool=False, **options):
+        self.path = uri.removeprefix("sqlite:///")
+        self.timeout = float(options.get("timeout", 5))
+        self.swept_at = 0.0
+        self._local = local()
+        super().__init__(uri, wrap_exceptions=wrap_exceptions, **options)
+
+    @property
+    def base_exceptions(self) -> type[Exception]:
+        return sqlite3.Error
+
+    def _get_connection(self) -> sqlite3.Connection:
+        # one connection per thread, and none inherited from the process we were forked from
+        if getattr(self._local, "pid", None) != os.getpid():
+            connection = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute("CREATE TABLE IF NOT EXISTS rate_limits (key TEXT PRIMARY KEY, count INTEGER NOT NULL, expires_at REAL NOT NULL)")
+            self._local.connection = connection
+            self._local.pid = os.getpid()
+
+        return self._local.connection
+
+    @contextmanager
+    def _transaction(self):
+        connection = self._get_connection()
+        connection.execute("BEGIN IMMEDIATE")
+
+        try:
+            yield connection
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+
+        connection.execute("COMMIT")
+
+    def _sweep(self, connection: sqlite3.Connection, now: float) -> None:
+        if now - self.swept_at >= SQLITE_SWEEP_SECONDS:
+            self.swept_at = now
+            connection.execute("DELETE FROM rate_limits WHERE expires_at <= ?", (now,))
+
+    def _get(self, connection: sqlite3.Connection, key: str, now: float) -> int:
+        row = connection.execute("SELECT count FROM rate_limits WHERE key = ? AND expires_at > ?", (key, now)).fetchone()
+        return row[0] if row else 0
+
+    def _incr(self, connection: sqlite3.Connection, key: str, expiry: float, amount: int, now: float) -> int:
+        # an expired counter starts over with a new expiry
+        connection.execute(
+            """
+            INSERT INTO rate_limits (key, count, expires_at) VALUES (?, ?, ?)
+            ON CONFLICT (key) DO UPDATE SET
+                count = CASE WHEN expires_at <= ? THEN excluded.count ELSE count + excluded.count END,
+                expires_at = CASE WHEN expires_at <= ? THEN excluded.expires_at ELSE expires_at END
+            """,
+            (key, amount, now + expiry, now, now)
+        )
+        return self._get(connection, key, now)
+
+    def incr(self, key: str, expiry: float, amount: int=1) -> int:
+        now = time()
+
+        with self._transaction() as connection:
+            self._sweep(connection, now)
+            return self._incr(connection, key, expiry, amount, now)
+
+    def get(self, key: str) -> int:
+        return self._get(self._get_connection(), key, time())
+
+    def get_expiry(self, key: str) -> float:
+        now = time()
+        row = self._get_connection().execute("SELECT expires_at FROM rate_limits WHERE key = ? AND expires_at > ?", (key, now)).fetchone()
+        return row[0] if row else now
+
+    def check(self) -> bool:
+        try:
+            self._get_connection().execute("SELECT 1")
+        except sqlite3.Error:
+            return False
+
+        return True
+
+    def reset(self) -> int | None:
+        with self._transaction() as connection:
+            return connection.execute("DELETE FROM rate_limits").rowcount
+
+    def clear(self, key: str) -> None:
+        self._get_connection().execute("DELETE FROM rate_limits WHERE key = ?", (key,))
+
+    def _get_sliding_window_info(self, connection: sqlite3.Connection, key: str, expiry: int, now: float) -> tuple[int, float, int, float]:
+        previous_key, current_key = self.sliding_window_keys(key, expiry, now)
+        previous_count = self._get(connection, previous_key, now)
+        current_count = self._get(connection, current_key, now)
+        # how much of the previous window still overlaps the sliding one
+        previous_ttl = (1 - (((now - expiry) / expiry) % 1)) * expiry if previous_count else 0.0
+        current_ttl = (1 - ((now / expiry) % 1)) * expiry + expiry
+        return previous_count, previous_ttl, current_count, current_ttl
+
+    def acquire_sliding_window_entry(self, key: str, limit: int, expiry: int, amount: int=1) -> bool:
+        if amount > limit:
+            return False
+
+        now = time()
+
+        with self._transaction() as connection:
+            self._sweep(connection, now)
+            previous_count, previous_ttl, current_count, _ = self._get_sliding_window_info(connection, key, expiry, now)
+
+            if floor(previous_count * previous_ttl / expiry + current_count) + amount > limit:
+                return False
+
+            # the current window's counter is still weighed in during the next one
+            self._incr(connection, self.sliding_window_keys(key, expiry, now)[1], 2 * expiry, amount, now)
+            return True
+
+    def get_sliding_window(self, key: str, expiry: int) -> tuple[int, float, int, float]:
+        return self._get_sliding_window_info(self._get_connection(), key, expiry, time())
+
+    def clear_sliding_window(self, key: str, expiry: int) -> None:
+        for window_key in self.sliding_window_keys(key, expiry, time()):
+            self.clear(window_key)
+
+def get_rate_limit_key(request: Request) -> str:
+    """
+    Signed in requests are limited per account (the token's subject), so users behind the same
+    NAT don't share a bucket, anonymous ones and invalid tokens per address. The subject comes
+    from the principal cache or from verifying the token, never from the database.
+    """
+
+    scheme, _, token = request.headers.get("authorization", "").partition(" ")
+
+    if scheme.lower() == "bearer" and token:
+        payload = get_cached_claims(token)
+
+        if payload is None:
+            try:
+                payload = decode(token, envs("APP_DB_URL"), algorithms=[envs("APP_JWT_SECRET_KEY_ALGORITHM")])
+            except InvalidTokenError:
+                payload = {}
+
+        if payload.get("sub"):
+            return f"sub:{payload['sub']}"
+
+    return f"ip:{get_remote_address(request)}"
@@ -0,0 +1,168 @@
+from time import time
+from threading import Event, Lock, Thread
+from contextvars import ContextVar
+from sqlalchemy import Select, event
+from sqlalchemy.orm import Session
+
+from app.utils.cache import TTLCache
+from app.utils.env import envi
+
+REPLICA_MAX_LAG_SECONDS = envi("APP_DB_REPLICA_MAX_LAG_SECONDS", 5)
+REPLICA_LAG_CHECK_SECONDS = envi("APP_DB_REPLICA_LAG_CHECK_SECONDS", 2)
+
+# access tokens that wrote recently, their reads stay on the primary until the window passes
+recent_writers = TTLCache(
+    max_size=envi("APP_DB_READ_YOUR_WRITES_MAX_SIZE", 4096),
+    ttl=envi("APP_DB_READ_YOUR_WRITES_SECONDS", 10),
+)
+
+_request_principal: ContextVar[str | None] = ContextVar("request_principal", default=None)
+
+class ReplicaLagMonitor:
+    """Polls the replica's lag in the background, reads fall back to the primary while it's too far behind."""
+
+    def __init__(self, engine, *, max_lag: int, interval: int):
+        self.engine = engine
+        self.max_lag = max_lag
+        self.interval = interval
+        self.lag: int | None = None
+        self.healthy = False
+        self.checked_at: float | None = None
+        self.fallbacks = 0
+        self._fallbacks_lock = Lock()
+        self._stop = Event()
+        self._thread: Thread | None = None
+
+    def _read_lag(self) -> int | None:
+        if self.engine.dialect.name != "mysql":
+            return 0
+
+        with self.engine.connect() as connection:
+            try:
+                status = connection.exec_driver_sql("SHOW REPLICA STATUS").mappings().first()
+            except Exception:
+                # before MySQL 8.0.22
+                status = connection.exec_driver_sql("SHOW SLAVE STATUS").mappings().first()
+
+        if status is None:
+            return None
+
+        # NULL while replication is stopped
+        return status.get("Seconds_Behind_Source", status.get("Seconds_Behind_Master"))
+
+    def check(self) -> None:
+        try:
+            lag = self._read_lag()
+        except Exception as e:
+            print(f"[DEBUG] Unable to read the replica's lag - {e}")
+            lag = None
+
+        self.lag = lag
+        self.healthy = lag is not None and lag <= self.max_lag
+        self.checked_at = time()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.check()
+
+    def start(self) -> None:
+        self.check()
+        self._stop.clear()
+        self._thread = Thread(target=self._run, name="replica-lag-monitor", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def count_fallback(self) -> None:
+        # sessions run on threadpool threads
+        with self._fallbacks_lock:
+            self.fallbacks += 1
+
+    def stats(self) -> dict:
+        return {
+            "healthy": self.healthy,
+            "lag_seconds": self.lag,
+            "max_lag_seconds": self.max_lag,
+            "checked_at": self.checked_at,
+            "fallbacks": self.fallbacks,
+            "recent_writers": recent_writers.stats()["size"],
+        }
+
+class RoutingSession(Session):
+    """
+    Sends plain SELECTs to the replica and everything else to the primary. Once the session
+    writes (or locks rows), it stays on the primary so it reads its own writes, and so does the
+    principal that wrote for the read-your-writes window. A SELECT with the use_primary
+    execution option always reads from the primary.
+    """
+
+    def __init__(self, *, primary, replica, monitor: ReplicaLagMonitor, **kwargs):
+        super().__init__(**kwargs)
+        self.primary = primary
+        self.replica = replica
+        self.monitor = monitor
+        self.wrote = False
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        if self._flushing or not isinstance(clause, Select) or clause._for_update_arg is not None:
+            # a bare connection() (clause is None) may be used for anything
+            self.wrote = self.wrote or clause is not None or self._flushing
+            return self.primary
+
+        if self.wrote or clause._execution_options.get("use_primary"):
+            return self.primary
+
+        principal = _request_principal.get()
+
+        if principal is not None and recent_writers.get(principal) is not None:
+            return self.primary
+
+        if not self.monitor.healthy:
+            self.monitor.count_fallback()
+            return self.primary
+
+        return self.replica
+
+@event.listens_for(RoutingSession, "after_commit")
+def _remember_writer(session: RoutingSession) -> None:
+    principal = _request_principal.get()
+
+    if session.wrote and principal is not None:
+        recent_writers.set(principal, True)
+
+def get_session_routing(primary, replica, monitor: ReplicaLagMonitor | None, *, is_async: bool=False) -> dict:
+    """Session factory arguments: a plain bind without a replica, the routing session with one."""
+
+    if replica is None:
+        return {"bind": primary}
+
+    routing = {
+        "primary": primary.sync_engine if is_async else primary,
+        "replica": replica.sync_engine if is_async else replica,
+        "monitor": monitor,
+    }
+    return {"sync_session_class" if is_async else "class_": RoutingSession, **routing}
+
+class ReadYourWritesMiddleware:
+    """Tags the request with its access token, which keys the read-your-writes window."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        authorization = dict(scope["headers"]).get(b"authorization", b"").decode("latin-1")
+        scheme, _, token = authorization.partition(" ")
+        context_token = _request_principal.set(token if scheme.lower() == "bearer" and token else None)
+
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _request_principal.reset(context_token)
@@ -0,0 +1,194 @@
+import re
+from enum import Enum
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import Session
+
+from app.enums.all import AccountRole
+from app.models.all import Account, DeanProfile, CompanyProfile, AlumniProfile
+
+TOKEN_PATTERN = re.compile(r"\w+")
+
+def tokenize(text: str | None) -> list[str]:
+    return TOKEN_PATTERN.findall(text.lower()) if text else []
+
+def normalize_search(search: str | None) -> str | None:
+    """Canonical form of a search term, so equivalent searches share cache entries."""
+
+    return " ".join(tokenize(search)) or None
+
+def build_search_document(*values) -> str:
+    return " ".join(
+        str(value.value if isinstance(value, Enum) else value).lower()
+        for value in values
+        if value is not None and value != ""
+    )
+
+def get_account_search_values(account: Account) -> tuple:
+    profile = account.profile
+
+    if profile is None:
+        return (account.email,)
+
+    if account.role == AccountRole.COMPANY:
+        return (account.email, profile.name, profile.sysad_approval_status, profile.peso_staff_approval_status)
+
+    names = (profile.first_name, profile.middle_name, profile.last_name)
+
+    if account.role == AccountRole.DEAN:
+        return (account.email, *names, profile.school.name if profile.school else None)
+
+    if account.role == AccountRole.ALUMNI:
+        return (
+            account.email,
+            profile.prefix,
+            *names,
+            profile.address,
+            profile.phone_number,
+            profile.year_graduated,
+            profile.employment_status,
+            profile.dean_approval_status,
+            profile.course.name if profile.course else None,
+        )
+
+    return (account.email, *names)
+
+def refresh_search_document(account: Account) -> None:
+    """Rebuilds the account's search document, call it after flushing any change to the account or its profile."""
+
+    account.search_document = build_search_document(*get_account_search_values(account))
+
+def refresh_school_deans_search_documents(db: Session, school_id: int) -> None:
+    deans = db.query(DeanProfile).filter(DeanProfile.school_id == school_id).all()
+
+    for dean in deans:
+        refresh_search_document(dean.account)
+
+def backfill_search_documents(db: Session, *, batch_size: int=500) -> int:
+    """Builds the missing search documents in batches, returns how many were built."""
+
+    built = 0
+
+    while True:
+        accounts = (
+            db.query(Account)
+            .filter(Account.search_document.is_(None))
+            .order_by(Account.id)
+            .limit(batch_size)
+            .all()
+        )
+
+        if not accounts:
+            return built
+
+        for account in accounts:
+            refresh_search_document(account)
+
+        db.commit()
+        built += len(accounts)
+
+def full_text_search(db: Session, column, search: str | None) -> tuple:
+    """
+    Returns (filter, rank) for a search over a FULLTEXT indexed column. Every term is required
+    and prefix matched, rank is the relevance. Backends without full-text search fall back to
+    a LIKE per term and have no rank.
+    """
+
+    terms = tokenize(search)
+
+    if not terms:
+        return None, None
+
+    if db.get_bind().dialect.name == "mysql":
+        match = column.match(" ".join(f"+{term}*" for term in terms))
+        return match, match
+
+    return and_(*(column.ilike(f"%{term}%") for term in terms)), None
+
+YEAR_PATTERN = re.compile(r"\d{4}")
+
+# profile searched per role: (profile model, year column, enum columns)
+ROLE_SEARCH_PROFILES = {
+    AccountRole.COMPANY: (CompanyProfile, None, (CompanyProfile.sysad_approval_status, CompanyProfile.peso_staff_approval_status)),
+    AccountRole.ALUMNI: (AlumniProfile, AlumniProfile.year_graduated, (AlumniProfile.employment_status, AlumniProfile.dean_approval_status)),
+}
+
+class SearchPlan:
+    """Joins, predicates and relevance rank chosen for a search, with a readable explanation."""
+
+    def __init__(self):
+        self.joins = []
+        self.filters = []
+        self.rank = None
+        self.steps = []
+
+    def apply(self, query):
+        for entity, onclause in self.joins:
+            query = query.join(entity, onclause)
+
+        return query.filter(*self.filters) if self.filters else query
+
+    def explain(self) -> list[str]:
+        return list(self.steps)
+
+    def cache_key(self) -> tuple | None:
+        """
+        The predicates the plan runs, in a canonical order, for keying cached totals. Raw word
+        tokens can't key them: "ann@x.com" and "ann x com" have the same words but different plans.
+        """
+
+        return tuple(sorted(self.steps)) or None
+
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+def plan_search(db: Session, role: AccountRole, search: str | None) -> SearchPlan:
+    """
+    Classifies each search token so it can hit an index: four digit numbers filter the
+    graduation year, enum words filter the matching status columns, email-looking tokens
+    become an email prefix match and whatever is left goes to the full-text search.
+    """
+
+    plan = SearchPlan()
+
+    if not search:
+        return plan
+
+    profile_model, year_col, enum_cols = ROLE_SEARCH_PROFILES.get(role, (None, None, ()))
+    years, emails, enum_tokens, text_tokens = [], [], [], []
+
+    for token in search.split():
+        enum_matches = [col for col in enum_cols if token.upper() in col.type.enum_class.__members__]
+
+        if year_col is not None and YEAR_PATTERN.fullmatch(token):
+            years.append(int(token))
+        elif "@" in token:
+            emails.append(token.lower())
+        elif enum_matches:
+            enum_tokens.append((token.upper(), enum_matches))
+        else:
+            text_tokens.append(token)
+
+    if years:
+        plan.filters.append(year_col.in_(years))
+        plan.steps.append(f"{year_col.key} IN {sorted(years)}")
+
+    # a status word may belong to more than one column (e.g. both company approvals)
+    for value, cols in enum_tokens:
+        plan.filters.append(or_(*(col == col.type.enum_class[value] for col in cols)))
+        plan.steps.append(" OR ".join(f"{col.key} = {value}" for col in cols))
+
+    for email in emails:
+        plan.filters.append(Account.email.like(f"{_escape_like(email)}%", escape="\\"))
+        plan.steps.append(f"email LIKE '{email}%'")
+
+    if (years or enum_tokens) and profile_model is not None:
+        plan.joins.append((profile_model, profile_model.account_id == Account.id))
+        plan.steps.insert(0, f"JOIN {profile_model.__tablename__}")
+
+    text_filter, plan.rank = full_text_search(db, Account.search_document, " ".join(text_tokens))
+
+    if text_filter is not None:
+        plan.filters.append(text_filter)
+        plan.steps.append(f"{'MATCH' if plan.rank is not None else 'LIKE'} search_document {tokenize(' '.join(text_tokens))}")
+
+    return plan
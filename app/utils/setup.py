@@ -1,19 +1,45 @@
+import asyncio
+from pathlib import Path
+from time import perf_counter, sleep
 from fastapi import FastAPI
 from contextlib import asynccontextmanager
 from sqlalchemy.orm import Session
+from sqlalchemy.exc import IntegrityError
+from starlette.concurrency import run_in_threadpool
 
 from app.models.all import *
 from app.utils.env import envs
 from app.database import get_db
-from app.database import Base, engine
+from app.database import engine, async_engine, replica_engine, async_replica_engine, replica_monitor
 from app.enums.all import AccountRole
 from app.utils.password import hash_password
-from app.utils.storage import initialize_storage
+from app.utils.executors import warm_executors, shutdown_executors
+from app.utils.storage import STORAGE_FOLDER_PATH, initialize_storage, preload_storage_modules
+from app.utils.startup import STARTUP_ROLE, STARTUP_LOCK_NAME, STARTUP_LOCK_TIMEOUT_SECONDS, StartupLock, startup_report
+from app.utils.pool import warm_pool, warm_async_pool
+from app.utils.search import refresh_search_document, backfill_search_documents
 from app.crud.account import get_account_by_email
 from app.crud.system_admin import get_system_admin_profile_by_account_email
 
-def bootstrap_default_system_admin() -> None:
-    
+ALEMBIC_CONFIG_PATH = Path(__file__).resolve().parents[2] / "alembic.ini"
+STARTUP_LOCK_PATH = STORAGE_FOLDER_PATH / ".startup.lock"
+
+def check_schema_revision() -> None:
+    # the schema is only changed by migrations (alembic upgrade head), never at startup
+    # alembic is only needed here, importing it with the app costs ~200ms
+    from alembic.config import Config
+    from alembic.script import ScriptDirectory
+    from alembic.runtime.migration import MigrationContext
+
+    head = ScriptDirectory.from_config(Config(ALEMBIC_CONFIG_PATH)).get_current_head()
+
+    with engine.connect() as connection:
+        current = MigrationContext.configure(connection).get_current_revision()
+
+    if current != head:
+        raise RuntimeError(f"Database schema is at revision {current}, expected {head}, run `alembic upgrade head` first.")
+
+def get_default_system_admin_settings() -> tuple[str, str, str, str]:
     DEFAULT_SYSAD_EMAIL = envs("DEFAULT_SYSAD_EMAIL")
     DEFAULT_SYSAD_PASSWORD = envs("DEFAULT_SYSAD_PASSWORD")
     DEFAULT_SYSAD_FIRST_NAME = envs("DEFAULT_SYSAD_FIRST_NAME")
@@ -21,40 +47,181 @@ def bootstrap_default_system_admin() -> None:
     
     if not all((DEFAULT_SYSAD_EMAIL, DEFAULT_SYSAD_PASSWORD, DEFAULT_SYSAD_FIRST_NAME, DEFAULT_SYSAD_LAST_NAME)):
         raise RuntimeError("[SETUP] Default System Administrator's credentials must be set within the environment variables.")
-    
-    db: Session = next(get_db())
 
-    try:
-        account = get_account_by_email(db, email=DEFAULT_SYSAD_EMAIL, allow_none=True)
-        profile = get_system_admin_profile_by_account_email(db, account_email=DEFAULT_SYSAD_EMAIL, allow_none=True)
-        
-        if account and profile:
-            print("[SETUP] Default System Administrator's account and profile already exists.")
-            return
-        
+    return DEFAULT_SYSAD_EMAIL, DEFAULT_SYSAD_PASSWORD, DEFAULT_SYSAD_FIRST_NAME, DEFAULT_SYSAD_LAST_NAME
+
+def upsert_default_system_admin(db: Session, email: str, password: str, first_name: str, last_name: str) -> bool:
+    """Creates whichever of the account and profile is missing, returns whether anything was created."""
+
+    account = get_account_by_email(db, email=email, allow_none=True)
+
+    if account and account.role != AccountRole.SYSTEM_ADMINISTRATOR:
+        raise RuntimeError(f"[SETUP] The default System Administrator's email belongs to a {account.role.value} account.")
+
+    profile = get_system_admin_profile_by_account_email(db, account_email=email, allow_none=True) if account else None
+
+    if account and profile:
+        return False
+
+    if not account:
         account = Account(
             role=AccountRole.SYSTEM_ADMINISTRATOR,
-            email=DEFAULT_SYSAD_EMAIL,
-            password=hash_password(DEFAULT_SYSAD_PASSWORD),
+            email=email,
+            password=hash_password(password),
         )
         db.add(account)
         db.flush()
 
-        profile = SystemAdminProfile(
-            first_name=DEFAULT_SYSAD_FIRST_NAME,
-            last_name=DEFAULT_SYSAD_LAST_NAME,
-            account_id=account.id
-        )
-        db.add(profile)
-        db.commit()
-        print("[SETUP] Default System Administrator's account and profile has been created.")
+    # an account left without its profile (e.g. by a crash between the two inserts) gets one
+    profile = SystemAdminProfile(
+        first_name=first_name,
+        last_name=last_name,
+        account=account
+    )
+    db.add(profile)
+    db.flush()
+    refresh_search_document(account)
+    db.commit()
+    return True
+
+def bootstrap_default_system_admin() -> None:
+    settings = get_default_system_admin_settings()
+    db: Session = next(get_db())
+
+    try:
+        try:
+            created = upsert_default_system_admin(db, *settings)
+        except IntegrityError:
+            # another process inserted it between the lookup and the insert, use theirs
+            db.rollback()
+            created = upsert_default_system_admin(db, *settings)
+
+        if created:
+            print("[SETUP] Default System Administrator's account and profile has been created.")
+        else:
+            print("[SETUP] Default System Administrator's account and profile already exists.")
+    finally:
+        db.close()
+
+def is_default_system_admin_ready() -> bool:
+    email = get_default_system_admin_settings()[0]
+    db: Session = next(get_db())
+
+    try:
+        return get_system_admin_profile_by_account_email(db, account_email=email, allow_none=True) is not None
+    finally:
+        db.close()
+
+def wait_for_setup() -> None:
+    """Follower startup, waits until the schema is migrated and the default admin exists."""
+
+    deadline = perf_counter() + STARTUP_LOCK_TIMEOUT_SECONDS
+
+    while True:
+        try:
+            check_schema_revision()
+
+            if is_default_system_admin_ready():
+                return
+
+            reason = "the default System Administrator doesn't exist yet"
+        except RuntimeError as e:
+            reason = str(e)
+
+        if perf_counter() >= deadline:
+            raise RuntimeError(f"[SETUP] Gave up waiting for the setup after {STARTUP_LOCK_TIMEOUT_SECONDS}s, {reason}")
+
+        sleep(1)
+
+def bootstrap_search_documents() -> None:
+    db: Session = next(get_db())
+
+    try:
+        built = backfill_search_documents(db)
+
+        if built:
+            print(f"[SETUP] Built {built} missing account search documents.")
     finally:
         db.close()
 
+def run_setup() -> None:
+    """
+    Runs the setup in one worker at a time. The first worker to take the startup lock leads,
+    the others wait for it to finish and then only find everything in place, every step is
+    idempotent so a worker taking over from a crashed leader just completes its work.
+    """
+
+    with startup_report.phase("storage"):
+        # the file lock lives in the storage folder, mkdir is safe to race
+        initialize_storage()
+
+    if STARTUP_ROLE == "follower":
+        with startup_report.phase("waiting for setup"):
+            wait_for_setup()
+        return
+
+    lock = StartupLock(engine, STARTUP_LOCK_PATH, name=STARTUP_LOCK_NAME, timeout=STARTUP_LOCK_TIMEOUT_SECONDS)
+
+    with startup_report.phase("startup lock"):
+        is_leader = lock.acquire(blocking=False)
+
+        if not is_leader:
+            print("[SETUP] Another worker is running the setup, waiting for it.")
+
+            if not lock.acquire():
+                raise RuntimeError(f"[SETUP] Gave up waiting for the startup lock after {STARTUP_LOCK_TIMEOUT_SECONDS}s.")
+
+    try:
+        with startup_report.phase("schema check"):
+            check_schema_revision()
+
+        with startup_report.phase("default system admin"):
+            bootstrap_default_system_admin()
+
+        # under the lock, so only the leader scans and rewrites them, the others find none missing
+        with startup_report.phase("search documents"):
+            bootstrap_search_documents()
+    finally:
+        lock.release()
+
+async def warm_up() -> None:
+    """Everything the app can serve without but is slower without, the app is ready once it's done."""
+
+    try:
+        with startup_report.phase("connection pools"):
+            warmed = await run_in_threadpool(warm_pool, engine) + await warm_async_pool(async_engine)
+
+            if replica_engine is not None:
+                warmed += await run_in_threadpool(warm_pool, replica_engine) + await warm_async_pool(async_replica_engine)
+                await run_in_threadpool(replica_monitor.start)
+                print(f"[SETUP] Reading from the replica, lag: {replica_monitor.lag}s.")
+
+        with startup_report.phase("executors"):
+            await run_in_threadpool(warm_executors)
+
+        with startup_report.phase("upload modules"):
+            await run_in_threadpool(preload_storage_modules)
+    except Exception as e:
+        # stays up but never ready, the readiness probe reports the error
+        startup_report.error = str(e)
+        print(f"[SETUP] Warming up failed - {e}")
+        return
+
+    startup_report.is_ready = True
+    print(f"[SETUP] Warmed {warmed} database connections, ready: {startup_report.summary()}.")
+
 @asynccontextmanager
 async def app_setup(app: FastAPI):
-    initialize_storage()
-    Base.metadata.create_all(bind=engine)
-    bootstrap_default_system_admin()
+    await run_in_threadpool(run_setup)
+    startup_report.is_up = True
+    print(f"[SETUP] Up: {startup_report.summary()}.")
+    warm_up_task = asyncio.create_task(warm_up())
     yield
+    warm_up_task.cancel()
+    await asyncio.gather(warm_up_task, return_exceptions=True)
+    shutdown_executors()
+    await async_engine.dispose()
 
+    if replica_engine is not None:
+        replica_monitor.stop()
+        await async_replica_engine.dispose()
@@ -0,0 +1,149 @@
+import os
+from pathlib import Path
+from time import perf_counter, sleep
+from contextlib import contextmanager
+from sqlalchemy import text
+
+from app.utils.env import envs, envi
+
+# importing app.main (measured from its first line) should stay under this, only reported
+# here and enforced by tests/test_import_time.py, a slow host never takes a worker out
+IMPORT_TIME_BUDGET_MS = envi("APP_IMPORT_TIME_BUDGET_MS", 2000)
+
+# auto: the first worker to take the startup lock runs the setup, the others wait for it
+# follower: never runs the setup, waits until another process (e.g. a release job) has
+STARTUP_ROLE = envs("APP_STARTUP_ROLE", "auto")
+STARTUP_LOCK_NAME = envs("APP_STARTUP_LOCK_NAME", "etrace_startup")
+STARTUP_LOCK_TIMEOUT_SECONDS = envi("APP_STARTUP_LOCK_TIMEOUT_SECONDS", 120)
+
+if STARTUP_ROLE not in {"auto", "follower"}:
+    raise RuntimeError(f"Invalid startup role: {STARTUP_ROLE}")
+
+class StartupReport:
+    """
+    Time spent importing the app and in each startup phase. The app is up once it can serve
+    requests and ready once its dependencies are warm (pools, caches, lazily imported modules).
+    """
+
+    def __init__(self):
+        self.import_ms: float | None = None
+        self.phases: dict[str, float] = {}
+        self.is_up = False
+        self.is_ready = False
+        self.error: str | None = None
+
+    def record_import(self, started: float) -> None:
+        self.import_ms = round((perf_counter() - started) * 1000, 1)
+
+        if self.import_ms > IMPORT_TIME_BUDGET_MS:
+            print(f"[SETUP] Importing the app took {self.import_ms}ms, over the {IMPORT_TIME_BUDGET_MS}ms budget.")
+
+    @contextmanager
+    def phase(self, name: str):
+        started = perf_counter()
+
+        try:
+            yield
+        finally:
+            self.phases[name] = round((perf_counter() - started) * 1000, 1)
+
+    def summary(self) -> str:
+        return ", ".join(f"{name} {ms}ms" for name, ms in self.phases.items())
+
+    def stats(self) -> dict:
+        return {
+            "is_up": self.is_up,
+            "is_ready": self.is_ready,
+            "error": self.error,
+            "import_ms": self.import_ms,
+            "import_budget_ms": IMPORT_TIME_BUDGET_MS,
+            "phases_ms": dict(self.phases),
+        }
+
+startup_report = StartupReport()
+
+def _try_lock_file(fd: int) -> bool:
+    try:
+        if os.name == "nt":
+            import msvcrt
+            msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+        else:
+            import fcntl
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        return False
+
+    return True
+
+def _unlock_file(fd: int) -> None:
+    if os.name == "nt":
+        import msvcrt
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+    else:
+        import fcntl
+        fcntl.flock(fd, fcntl.LOCK_UN)
+
+class StartupLock:
+    """
+    Serializes the setup between workers. On MySQL it's a named lock (GET_LOCK), which covers
+    every host sharing the database, elsewhere it's a file lock, which covers one host. Both
+    are released by the server or the OS if the holder dies, so a crashed worker can't wedge
+    the others.
+    """
+
+    def __init__(self, engine, path: Path, *, name: str, timeout: int):
+        self.engine = engine
+        self.path = path
+        self.name = name
+        self.timeout = timeout
+        self._connection = None
+        self._fd: int | None = None
+
+    def _acquire_named(self, timeout: int) -> bool:
+        connection = self.engine.connect()
+        acquired = connection.execute(text("SELECT GET_LOCK(:name, :timeout)"), {"name": self.name, "timeout": timeout}).scalar()
+
+        if acquired != 1:
+            connection.close()
+            return False
+
+        self._connection = connection
+        return True
+
+    def _acquire_file(self, timeout: int) -> bool:
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT)
+        deadline = perf_counter() + timeout
+
+        while not _try_lock_file(fd):
+            if perf_counter() >= deadline:
+                os.close(fd)
+                return False
+            sleep(0.1)
+
+        self._fd = fd
+        return True
+
+    def acquire(self, *, blocking: bool=True) -> bool:
+        timeout = self.timeout if blocking else 0
+
+        if self.engine.dialect.name == "mysql":
+            return self._acquire_named(timeout)
+
+        return self._acquire_file(timeout)
+
+    def release(self) -> None:
+        if self._connection is not None:
+            connection, self._connection = self._connection, None
+
+            try:
+                connection.execute(text("SELECT RELEASE_LOCK(:name)"), {"name": self.name})
+            finally:
+                connection.close()
+
+        if self._fd is not None:
+            fd, self._fd = self._fd, None
+
+            try:
+                _unlock_file(fd)
+            finally:
+                os.close(fd)
@@ -1,14 +1,22 @@
 import os
-import magic
+import re
+import hashlib
 from enum import Enum
-from PIL import Image
 from uuid import uuid4
 from pathlib import Path
-from slugify import slugify
 from fastapi import UploadFile
 from shutil import copyfileobj
+from threading import Event, Lock
+from concurrent.futures import Future, FIRST_COMPLETED, wait
 
 from app.exceptions import *
+from app.utils.env import envi
+from app.utils.executors import cpu_executor, io_executor
+
+# files of one request staged at once, one by one unless measured faster on the host: on a
+# single core the copies don't overlap and 4 at once was slower (788ms vs 763ms a signup)
+UPLOAD_STAGING_WORKERS = envi("APP_UPLOAD_STAGING_WORKERS", 1)
+UPLOAD_MAX_SIZE_MB = 5
 
 MIME_EXT = {
     # images
@@ -67,6 +75,7 @@ ALUMNI_PROFILE_PICTURE_FOLDER_PATH = ALUMNI_FOLDER_PATH / "profile_picture"
 ALUMNI_CURRICULUM_VITAE_PATH = ALUMNI_FOLDER_PATH / "curriculum_vitae"
 DEAN_FOLDER_PATH = STORAGE_FOLDER_PATH / "dean"
 DEAN_RECORD_FOLDER_PATH = DEAN_FOLDER_PATH / "record" # graduate records
+BLOB_FOLDER_PATH = STORAGE_FOLDER_PATH / "blobs" # uploads stored once, named after their content
 
 paths = {
     "storage": STORAGE_FOLDER_PATH,
@@ -86,8 +95,28 @@ paths = {
     "profile_picture": ALUMNI_PROFILE_PICTURE_FOLDER_PATH,
     "curriculum_vitae": ALUMNI_CURRICULUM_VITAE_PATH,
     "dean": DEAN_FOLDER_PATH,
-    "record": DEAN_RECORD_FOLDER_PATH
+    "record": DEAN_RECORD_FOLDER_PATH,
+    "blobs": BLOB_FOLDER_PATH
+}
+
+BLOB_FILENAME_PATTERN = re.compile(r"[0-9a-f]{64}\.[a-z0-9]+")
+
+# files are fanned out over two levels of two hex characters, e.g. sec/3f/a0/<filename>, so no
+# folder grows past a few files however many there are
+SHARD_LEVELS = 2
+SHARD_WIDTH = 2
+
+# bytes moved by each way of staging an upload, since the process started
+io_stats = {
+    "renamed_bytes": 0,
+    "kernel_copied_bytes": 0,
+    "user_copied_bytes": 0,
+    "image_read_bytes": 0,
+    "image_written_bytes": 0,
+    "hashed_bytes": 0,
+    "deduplicated_bytes": 0,
 }
+_io_stats_lock = Lock()
 
 class DestFolder(str, Enum):
     LOGO = "logo"
@@ -105,12 +134,19 @@ class DestFolder(str, Enum):
     RECORD = "record"
 
 def initialize_storage() -> None:
-    for folder_name, fodler_path in paths.items():
-        if not fodler_path.exists():
-            fodler_path.mkdir(parents=True, exist_ok=True)
-            print(f"[SETUP] {folder_name.replace("_", " ").title()} folder created.")
-        else:
-            print(f"[SETUP] {folder_name.replace("_", " ").title()} folder exists.")
+    created = [folder_name for folder_name, folder_path in paths.items() if not folder_path.exists()]
+
+    for folder_name in created:
+        paths[folder_name].mkdir(parents=True, exist_ok=True)
+
+    if created:
+        print(f"[SETUP] Storage folders created: {", ".join(folder_name.replace("_", " ").title() for folder_name in created)}.")
+
+def preload_storage_modules() -> None:
+    """Imports what handling an upload needs, done while warming up so the first upload doesn't pay for it."""
+
+    import magic
+    from PIL import Image
 
 class Upload:
     def __init__(
@@ -119,7 +155,7 @@ class Upload:
         dest_folder: DestFolder,
         allowed_mimes: set[str],
         required: bool=True,
-        max_size: int=5,
+        max_size: int=UPLOAD_MAX_SIZE_MB,
         max_filename_length: int=50
     ):
         self.file: UploadFile = file
@@ -130,17 +166,130 @@ class Upload:
         self.max_filename_length = max_filename_length
 
 def get_magic_mime_type(file: Upload) -> str:
+    import magic # imported on first use, it's slow to import and most requests never upload
+
     content = file.file.read(2048)
     mime = magic.from_buffer(content, mime=True)
     file.file.seek(0)
     return mime
 
+def count_io(counter: str, amount: int) -> None:
+    with _io_stats_lock:
+        io_stats[counter] += amount
+
+def get_storage_io_stats() -> dict:
+    with _io_stats_lock:
+        return dict(io_stats)
+
+def _copy_file_in_kernel(source_fd: int, dest_fd: int) -> int:
+    copied = 0
+
+    while True:
+        if hasattr(os, "copy_file_range"):
+            count = os.copy_file_range(source_fd, dest_fd, 1024 * 1024)
+        else:
+            count = os.sendfile(dest_fd, source_fd, None, 1024 * 1024)
+
+        if not count:
+            return copied
+
+        copied += count
+
+def write_temp_file(source, temp_file_path: Path) -> None:
+    """
+    Puts an upload at temp_file_path with as little copying as its spool allows: one spooled
+    to a named file (see app/utils/intake.py) is renamed, one in an anonymous file is copied by
+    the kernel, and only one still held in memory goes through user space.
+    """
+
+    try:
+        name = getattr(source, "name", None)
+
+        if isinstance(name, str):
+            source.flush()
+
+            try:
+                # same filesystem, the spool's own close then finds nothing left to delete
+                os.rename(name, temp_file_path)
+                count_io("renamed_bytes", os.stat(temp_file_path).st_size)
+                return
+            except OSError:
+                pass # e.g. windows, where an open file can't be renamed
+
+        with temp_file_path.open("wb") as buffer:
+            if getattr(source, "_rolled", True) and hasattr(os, "sendfile"):
+                source.flush()
+                source.seek(0)
+                count_io("kernel_copied_bytes", _copy_file_in_kernel(source.fileno(), buffer.fileno()))
+            else:
+                copyfileobj(source, buffer)
+                count_io("user_copied_bytes", buffer.tell())
+    except Exception:
+        temp_file_path.unlink(missing_ok=True)
+        raise
+    finally:
+        source.close()
+
+def resize_image(source_path: str, dest_path: str, size: tuple[float, float]) -> None:
+    """
+    Runs in the CPU executor's worker processes, so it only takes picklable arguments. The image
+    is decoded once, straight from the spooled upload, and only the thumbnail is written.
+    """
+
+    from PIL import Image
+
+    with Image.open(source_path) as img:
+        # no load() first, thumbnail() lets a JPEG decode at a reduced scale
+        img.thumbnail(size=size)
+        img.save(dest_path)
+
+def get_file_digest(path: Path) -> str:
+    with path.open("rb") as file:
+        digest = hashlib.file_digest(file, "sha256").hexdigest()
+        count_io("hashed_bytes", file.tell())
+
+    return digest
+
+def is_blob_filename(filename: str | None) -> bool:
+    return bool(filename) and BLOB_FILENAME_PATTERN.fullmatch(filename) is not None
+
+def get_shard(filename: str) -> list[str]:
+    # blobs are named after a hash already, other files are spread by a hash of their name
+    key = filename if is_blob_filename(filename) else hashlib.sha256(filename.encode()).hexdigest()
+    return [key[level * SHARD_WIDTH:(level + 1) * SHARD_WIDTH] for level in range(SHARD_LEVELS)]
+
+def get_sharded_path(folder: Path, filename: str) -> Path:
+    """Where a file goes, new files are always written here."""
+
+    return folder.joinpath(*get_shard(filename), filename)
+
+def resolve_file_path(folder: Path, filename: str) -> Path:
+    """
+    Where a file is: in its shard, or still in the flat folder until the layout migration
+    (app/utils/storage_layout.py) moves it. A move is a rename, so the file is always at one
+    of the two, and checking the shard again last can't miss one that moved in between.
+    """
+
+    sharded_path = get_sharded_path(folder, filename)
+
+    if sharded_path.exists():
+        return sharded_path
+
+    flat_path = folder / filename
+    return flat_path if flat_path.exists() else sharded_path
+
+def get_blob_path(filename: str) -> Path:
+    return get_sharded_path(BLOB_FOLDER_PATH, filename)
+
 def get_file_size(file: Upload) -> int:
     file.file.seek(0, os.SEEK_END)
     size = file.file.tell()
     file.file.seek(0)
     return size
 
+class StagingCancelled(Exception):
+    """Raised by a file being staged when another file of the same batch failed."""
+
 class UploadManager:
     def __init__(self, *, image_resize_size: tuple[float, float]=(400, 400)):
         self.staged_files_info = {}
@@ -162,97 +311,173 @@ class UploadManager:
         
         self.staged_files_info.clear()
     
-    def stage_upload(self, upload: Upload) -> None:
-        """Stages an upload. If fails the checks and resizing, rollback."""
-        
-        # STEP 1: Checks
+    def check_upload(self, upload: Upload) -> bool:
+        """The cheap checks, returns whether there's a file to stage."""
         
         # PHASE 1: file requiredness check
         if not upload.file:
             if upload.required:
-                self.rollback()
                 RAISE_FILE_NOT_PROVIDED_EXCEPTION_FOR(upload.dest_folder.value)
             
             self.staged_files_info[upload.dest_folder.value] = None
-            return
+            return False
         
         # PHASE 2: NAME LENGTH check
         # we need extra space for uuid characters, therefore we need to prevent them from sending long-named files
         if len(upload.file.filename) > upload.max_filename_length:
-            self.rollback()
             RAISE_FILE_NAME_LENGTH_TOO_LONG_EXCEPTION_FOR(upload.dest_folder.value, upload.max_filename_length)
         
         # PHASE 3: FILE SIZE check
         if get_file_size(upload.file) > upload.max_size * 1024 * 1024:
-            self.rollback()
             RAISE_FILE_SIZE_TOO_BIG_EXCEPTION_FOR(upload.dest_folder.value, upload.max_size)
+
+        return True
+
+    def stage_file(self, upload: Upload, cancelled: Event | None=None) -> dict:
+        """
+        Sniffs, places and resizes a checked upload into the temp folder and names it after its
+        digest, returns its staged info. Runs on an I/O thread, a failure or a cancellation
+        removes its own temp file.
+        """
         
         # PHASE 4: FILE VALIDITY check by mime type
         magic_mime = get_magic_mime_type(upload.file)
         
         if magic_mime not in upload.allowed_mimes:
-            self.rollback()
             RAISE_FILE_TYPE_NOT_SUPPORTED_EXCEPTION_FOR(upload.dest_folder.value)
         
         # STEP 2: Transformation
 
-        # PHASE 1: NAME NORMALIZATION
-        stem = Path(upload.file.filename).stem
+        # PHASE 1: EXTENSION
         fallback_ext = Path(upload.file.filename).suffix.replace(".", "").lower()
         ext = MIME_EXT.get(magic_mime, fallback_ext)
-        new_filename = slugify(stem)
-        new_filename = f"{new_filename}-{str(uuid4())[:13]}.{ext}"
 
-        # PHASE 2.0: TEMP PATH ASSIGNMENT
-        # (Path) storage folder
+        # PHASE 2: TEMP PATH ASSIGNMENT
+        # (Path) storage folder, the file is named after its digest once it's in its final form
         temp_path = paths.get("temp")
         temp_path.mkdir(parents=True, exist_ok=True)
-        temp_file_path = temp_path / new_filename
-        
-        # PHASE 2.1: REAL PATH ASSIGNMENT
-        # (Path) final folder
-        real_path = paths.get(upload.dest_folder.value)
-        real_path.mkdir(parents=True, exist_ok=True)
-        real_file_path = real_path / new_filename
-        
+        temp_file_path = temp_path / f"{uuid4()}.{ext}"
+
+        if cancelled is not None and cancelled.is_set():
+            raise StagingCancelled()
+
+        source = upload.file.file
+        source_path = getattr(source, "name", None)
+
         try:
-            with temp_file_path.open("wb") as buffer:
-                copyfileobj(upload.file.file, buffer)
-        finally:
-            upload.file.file.close()
-        
-        # PHASE 3: IMAGE RESIZING (for images only)
-        # would also help us determine if the image file is a real image, (disguised ones can't be resized XD)
-        if magic_mime.startswith("image/"):
-            try:
-                path = str(temp_file_path)
-                
-                with Image.open(path) as img:
-                    img.load()
-                    img.thumbnail(size=self.image_resize_size)
-                    img.save(temp_file_path)
-            except Exception as e:
-                print(f"[DEBUG] Cannot resize image - {repr(e)}")
-                self.rollback()
-                raise RAISE_IMAGE_FILE_CANNOT_BE_READ_EXCEPTION_FOR(upload.dest_folder.value)
-        
-        self.staged_files_info[upload.dest_folder.value] = {
-            "filename": new_filename,
+            # PHASE 3: IMAGE RESIZING (for images only)
+            # would also help us determine if the image file is a real image, (disguised ones can't be resized XD)
+            if magic_mime.startswith("image/"):
+                if isinstance(source_path, str):
+                    # decoded from the spool, the original is never copied
+                    source.flush()
+                else:
+                    write_temp_file(source, temp_file_path)
+                    source_path = str(temp_file_path)
+
+                if cancelled is not None and cancelled.is_set():
+                    raise StagingCancelled()
+
+                try:
+                    cpu_executor.run(resize_image, source_path, str(temp_file_path), self.image_resize_size)
+                except HTTPException:
+                    raise
+                except Exception as e:
+                    print(f"[DEBUG] Cannot resize image - {repr(e)}")
+                    raise RAISE_IMAGE_FILE_CANNOT_BE_READ_EXCEPTION_FOR(upload.dest_folder.value)
+
+                count_io("image_read_bytes", upload.file.size or 0)
+                count_io("image_written_bytes", os.stat(temp_file_path).st_size)
+                source.close()
+            else:
+                write_temp_file(source, temp_file_path)
+
+            # PHASE 4: CONTENT ADDRESSING
+            # the same bytes always get the same name, and are stored once (see commit)
+            filename = f"{get_file_digest(temp_file_path)}.{ext}"
+        except BaseException:
+            temp_file_path.unlink(missing_ok=True)
+            source.close()
+            raise
+
+        return {
+            "filename": filename,
+            "size": os.stat(temp_file_path).st_size,
             "temp_file_path": temp_file_path,
-            "real_file_path": real_file_path
+            "real_file_path": get_blob_path(filename)
         }
+
+    def stage_upload(self, upload: Upload) -> None:
+        """Stages an upload. If fails the checks and resizing, rollback."""
+
+        try:
+            if self.check_upload(upload):
+                self.staged_files_info[upload.dest_folder.value] = io_executor.run(self.stage_file, upload)
+        except Exception:
+            self.rollback()
+            raise
     
-    def stage_uploads(self, uploads: list[Upload]) -> None:
-        """Stage a list of uploads."""
-        for upload in uploads:
-            self.stage_upload(upload)
+    def stage_uploads(self, uploads: list[Upload], *, max_workers: int=UPLOAD_STAGING_WORKERS) -> None:
+        """
+        Stages a list of uploads, up to max_workers files at once on the I/O executor. All or
+        nothing: once one fails, the ones not started are skipped, the running ones stop at their
+        next step, every staged file is deleted and the earliest failing upload's error is raised.
+        """
+
+        cancelled = Event()
+        running: dict[Future, tuple[int, Upload]] = {}
+        failures: list[tuple[int, Exception]] = []
+
+        def settle(futures) -> None:
+            # only this thread touches staged_files_info
+            for future in futures:
+                index, upload = running.pop(future)
+
+                try:
+                    self.staged_files_info[upload.dest_folder.value] = future.result()
+                except StagingCancelled:
+                    pass
+                except Exception as e:
+                    failures.append((index, e))
+                    cancelled.set()
+
+        try:
+            # the cheap checks go first and in order, so they blame the same upload as staging one by one
+            checked = [upload for upload in uploads if self.check_upload(upload)]
+
+            for index, upload in enumerate(checked):
+                if len(running) >= max_workers:
+                    settle(wait(running, return_when=FIRST_COMPLETED).done)
+
+                if cancelled.is_set():
+                    break
+
+                running[io_executor.submit(self.stage_file, upload, cancelled)] = (index, upload)
+
+            settle(wait(running).done)
+        except Exception:
+            # e.g. a busy executor, the files already being staged still have to land before the rollback
+            cancelled.set()
+            settle(wait(running).done)
+            self.rollback()
+            raise
+
+        if failures:
+            self.rollback()
+            raise min(failures, key=lambda failure: failure[0])[1]
     
+    def get_staged_files(self) -> list[dict]:
+        return [info for info in self.staged_files_info.values() if info]
+
     def get_staged_file_name(self, dest_folder: DestFolder) -> str | None:
         info = self.staged_files_info.get(dest_folder.value)
         return info.get("filename") if info else None
     
     def commit(self) -> None:
-        """Move the staged files from temp folder to their actuald designated folders."""
+        """
+        Move the staged files from temp folder to the blobs (a rename, nothing is copied). A blob
+        that's already stored is kept and the staged copy is dropped.
+        """
         
         for _dest_folder, info in self.staged_files_info.items():
             if not info:
@@ -261,7 +486,13 @@ class UploadManager:
             temp_file_path = info.get("temp_file_path")
             real_file_path = info.get("real_file_path")
 
-            if temp_file_path.exists():
+            if not temp_file_path.exists():
+                continue
+
+            # stored already, possibly still in the flat folder
+            if resolve_file_path(BLOB_FOLDER_PATH, info.get("filename")).exists():
+                temp_file_path.unlink(missing_ok=True)
+                count_io("deduplicated_bytes", info.get("size"))
+            else:
+                real_file_path.parent.mkdir(parents=True, exist_ok=True)
                 os.replace(temp_file_path, real_file_path)
-    
-    
\ No newline at end of file
@@ -0,0 +1,92 @@
+"""
+Moves the files of the flat storage folders into their shards (see SHARD_LEVELS in
+app/utils/storage.py), while the app keeps running: the app finds a file in either place,
+every move is a single rename, and a file that's moved already isn't listed again. It can be
+stopped at any point, running it again picks up the files left.
+
+    python -m app.utils.storage_layout [--batch-size 500] [--pause 0.1] [--dry-run]
+"""
+
+import os
+import argparse
+from time import sleep
+from pathlib import Path
+
+from app.utils.storage import STORAGE_FOLDER_PATH, BLOB_FOLDER_PATH, DestFolder, paths, get_sharded_path, is_blob_filename
+
+def get_layout_folders() -> list[Path]:
+    return [paths.get(dest_folder.value) for dest_folder in DestFolder] + [BLOB_FOLDER_PATH]
+
+def iter_flat_filenames(folder: Path):
+    with os.scandir(folder) as entries:
+        for entry in entries:
+            # the shards are folders, hidden files are no uploads
+            if entry.is_file(follow_symlinks=False) and not entry.name.startswith("."):
+                yield entry.name
+
+def move_to_shard(folder: Path, filename: str, *, dry_run: bool=False) -> str:
+    """Moves one file into its shard, returns what happened to it."""
+
+    flat_path = folder / filename
+    sharded_path = get_sharded_path(folder, filename)
+
+    if sharded_path.exists():
+        if not is_blob_filename(filename):
+            # two different files with one name, left for someone to look at
+            return "conflicts"
+
+        # the same bytes were uploaded again since, straight into the shard
+        if not dry_run:
+            flat_path.unlink(missing_ok=True)
+
+        return "duplicates"
+
+    if dry_run:
+        return "moved"
+
+    sharded_path.parent.mkdir(parents=True, exist_ok=True)
+
+    try:
+        os.rename(flat_path, sharded_path)
+    except FileNotFoundError:
+        # deleted, or moved by another run, since it was listed
+        return "gone"
+
+    return "moved"
+
+def migrate_storage_layout(*, batch_size: int=500, pause: float=0.1, dry_run: bool=False) -> dict[str, int]:
+    """Moves every flat file into its shard, pausing between batches to leave the disk to the app."""
+
+    counts = {"moved": 0, "duplicates": 0, "conflicts": 0, "gone": 0}
+
+    for folder in get_layout_folders():
+        if not folder.exists():
+            continue
+
+        done = 0
+
+        for filename in iter_flat_filenames(folder):
+            counts[move_to_shard(folder, filename, dry_run=dry_run)] += 1
+            done += 1
+
+            if done % batch_size == 0:
+                print(f"[STORAGE] {folder.relative_to(STORAGE_FOLDER_PATH)}: {done} files")
+                sleep(pause)
+
+        if done:
+            print(f"[STORAGE] {folder.relative_to(STORAGE_FOLDER_PATH)}: {done} files, done.")
+
+    return counts
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Move the stored files into the sharded layout.")
+    parser.add_argument("--batch-size", type=int, default=500, help="files moved between pauses")
+    parser.add_argument("--pause", type=float, default=0.1, help="seconds to pause between batches")
+    parser.add_argument("--dry-run", action="store_true", help="count the files to move without moving them")
+    args = parser.parse_args()
+
+    counts = migrate_storage_layout(batch_size=args.batch_size, pause=args.pause, dry_run=args.dry_run)
+    print(f"[STORAGE] {", ".join(f"{name}: {count}" for name, count in counts.items())}.")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+from sqlalchemy import func
+
+from app.utils.cache import TTLCache
+from app.utils.env import envi
+
+# (count key, total, is exact) keyed by the count key of the listing, e.g. ("accounts", role, is_disabled, search)
+totals_cache = TTLCache(
+    max_size=envi("APP_TOTALS_CACHE_MAX_SIZE", 512),
+    ttl=envi("APP_TOTALS_CACHE_TTL_SECONDS", 30),
+)
+
+# below this many estimated rows an exact count is cheap enough to always run
+ESTIMATE_THRESHOLD = envi("APP_TOTALS_ESTIMATE_THRESHOLD", 10000)
+
+def count_exact(query, *, distinct_col) -> int:
+    return (
+        query.order_by(None)
+        .with_entities(func.count(func.distinct(distinct_col)))
+        .scalar()
+    )
+
+def estimate_count(query) -> int | None:
+    """Row estimate from the optimizer (EXPLAIN), None when the backend can't give one."""
+
+    # routed like the query itself, so a replica answers it when there is one
+    statement = query.order_by(None).statement
+    bind = query.session.get_bind(clause=statement)
+
+    if bind.dialect.name != "mysql":
+        return None
+
+    compiled = statement.compile(
+        dialect=bind.dialect,
+        compile_kwargs={"literal_binds": True}
+    )
+
+    try:
+        connection = query.session.connection(bind_arguments={"clause": statement})
+        plan = connection.exec_driver_sql(f"EXPLAIN {compiled}").mappings().all()
+    except Exception as e:
+        print(f"[DEBUG] Unable to estimate count - {e}")
+        return None
+
+    if len(plan) != 1 or plan[0].get("rows") is None:
+        return None
+
+    return int(plan[0]["rows"] * float(plan[0].get("filtered") or 100) / 100)
+
+def get_total(query, *, distinct_col, count_key: tuple, estimate: bool=False) -> tuple[int, bool]:
+    """
+    Returns (total, is exact) for a listing, served from the cache when possible. Broad
+    listings (estimate=True) over big tables get the optimizer's estimate instead of a count.
+    """
+
+    cached = totals_cache.get(count_key)
+
+    if cached is not None:
+        _key, total, is_exact = cached
+        return total, is_exact
+
+    total, is_exact = None, True
+
+    if estimate:
+        estimated = estimate_count(query)
+
+        if estimated is not None and estimated >= ESTIMATE_THRESHOLD:
+            total, is_exact = estimated, False
+
+    if total is None:
+        total = count_exact(query, distinct_col=distinct_col)
+
+    totals_cache.set(count_key, (count_key, total, is_exact))
+    return total, is_exact
+
+def invalidate_totals(*scope) -> None:
+    """Drops every cached total whose count key starts with the given scope, e.g. ("accounts", AccountRole.DEAN)."""
+
+    totals_cache.discard_where(lambda entry: entry[0][:len(scope)] == scope)
@@ -0,0 +1,54 @@
+"""account and school search
+
+Search documents for the accounts and the FULLTEXT indexes behind the account and school
+searches (see app.utils.search). The documents are built at startup by the backfill.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18 08:50:02.114512
+
+"""
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0002'
+down_revision: Union[str, Sequence[str], None] = '0001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def has_column(table: str, column: str) -> bool:
+    # some databases got the column by hand before migrations existed
+    if context.is_offline_mode():
+        return False
+
+    return column in {c["name"] for c in sa.inspect(op.get_bind()).get_columns(table)}
+
+
+def create_fulltext_index(name: str, table: str, column: str) -> None:
+    if op.get_context().dialect.name != "mysql":
+        op.create_index(name, table, [column], unique=False)
+        return
+
+    # built in place, writes wait until it's done (FULLTEXT can't be added with LOCK=NONE)
+    op.execute(f"ALTER TABLE {table} ADD FULLTEXT INDEX {name} ({column}), ALGORITHM=INPLACE, LOCK=SHARED")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if not has_column('accounts', 'search_document'):
+        op.add_column('accounts', sa.Column('search_document', sa.Text(), nullable=True))
+
+    create_fulltext_index('ix_accounts_search_document', 'accounts', 'search_document')
+    create_fulltext_index('ix_schools_name_fulltext', 'schools', 'name')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_schools_name_fulltext', table_name='schools')
+    op.drop_index('ix_accounts_search_document', table_name='accounts')
+    op.drop_column('accounts', 'search_document')
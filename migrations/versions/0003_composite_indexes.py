@@ -0,0 +1,73 @@
+"""composite indexes
+
+Composite indexes for the filters the listings actually run, and a unique constraint so an
+alumni can only like a job post once. On MySQL every index is built online (INPLACE, no lock).
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18 09:02:41.570231
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0003'
+down_revision: Union[str, Sequence[str], None] = '0002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (name, table, columns, unique)
+INDEXES = [
+    ('ix_accounts_role_is_disabled', 'accounts', ['role', 'is_disabled'], False),
+    ('ix_alumni_profiles_course_id_year_graduated', 'alumni_profiles', ['course_id', 'year_graduated'], False),
+    ('uq_likes_job_post_id_alumni_profile_id', 'likes', ['job_post_id', 'alumni_profile_id'], True),
+    ('ix_occupation_states_alumni_id_is_current', 'occupation_states', ['alumni_id', 'is_current'], False),
+    ('ix_job_posts_is_archived_is_posted_already_expires_at', 'job_posts', ['is_archived', 'is_posted_already', 'expires_at'], False),
+]
+
+# MySQL drops the index it made for a foreign key once a composite index leads with the same
+# column, so a downgrade has to give the foreign key its own index back first
+FOREIGN_KEY_INDEXES = {
+    'ix_alumni_profiles_course_id_year_graduated': ('ix_alumni_profiles_course_id', 'alumni_profiles', ['course_id']),
+    'uq_likes_job_post_id_alumni_profile_id': ('ix_likes_job_post_id', 'likes', ['job_post_id']),
+    'ix_occupation_states_alumni_id_is_current': ('ix_occupation_states_alumni_id', 'occupation_states', ['alumni_id']),
+}
+
+
+def is_mysql() -> bool:
+    return op.get_context().dialect.name == "mysql"
+
+
+def create_index_online(name: str, table: str, columns: list[str], *, unique: bool=False) -> None:
+    if not is_mysql():
+        op.create_index(name, table, columns, unique=unique)
+        return
+
+    kind = "UNIQUE INDEX" if unique else "INDEX"
+    op.execute(f"ALTER TABLE {table} ADD {kind} {name} ({', '.join(columns)}), ALGORITHM=INPLACE, LOCK=NONE")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # keep the oldest like of every duplicate so the unique index can be built
+    op.execute(
+        "DELETE FROM likes WHERE id NOT IN ("
+        "SELECT id FROM (SELECT MIN(id) AS id FROM likes GROUP BY job_post_id, alumni_profile_id) AS kept"
+        ")"
+    )
+
+    for name, table, columns, unique in INDEXES:
+        create_index_online(name, table, columns, unique=unique)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name, table, columns, unique in reversed(INDEXES):
+        if is_mysql() and name in FOREIGN_KEY_INDEXES:
+            create_index_online(*FOREIGN_KEY_INDEXES[name])
+
+        op.drop_index(name, table_name=table)
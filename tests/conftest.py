@@ -0,0 +1,125 @@
+import os
+import tempfile
+from pathlib import Path
+
+# the app reads its settings on import, so they're set before anything from app is imported
+TEST_DB_PATH = Path(tempfile.mkdtemp(prefix="etrace-tests-")) / "etrace.db"
+
+os.environ.update(
+    APP_DB_URL=f"sqlite:///{TEST_DB_PATH}",
+    APP_JWT_SECRET_KEY_ALGORITHM="HS256",
+    APP_ACCESS_TOKEN_EXPIRY_MINUTES="60",
+    APP_RATE_LIMIT_STORAGE_URI="memory://",
+    APP_CPU_EXECUTOR="thread",
+    # long enough that a test never sees its token's principal expire between two requests
+    APP_PRINCIPAL_CACHE_TTL_SECONDS="300",
+    DEFAULT_SYSAD_EMAIL="system_admin@example.com",
+    DEFAULT_SYSAD_PASSWORD="system_admin_pass",
+    DEFAULT_SYSAD_FIRST_NAME="System",
+    DEFAULT_SYSAD_LAST_NAME="Administrator",
+)
+
+import time
+import pytest
+from alembic import command
+from alembic.config import Config
+from fastapi.testclient import TestClient
+
+ROOT_PATH = Path(__file__).parent.parent
+COMPANY_FILENAME_FIELDS = (
+    "logo_filename", "sec_filename", "profile_filename", "business_permit_filename", "list_of_vacancies_filename",
+    "cert_from_dole_filename", "cert_of_no_pending_case_filename", "reg_dti_cda_filename", "reg_of_est_filename",
+    "reg_philjobnet_filename",
+)
+
+def migrate() -> None:
+    config = Config(str(ROOT_PATH / "alembic.ini"))
+    config.attributes["configure_logger"] = False
+    command.upgrade(config, "head")
+
+@pytest.fixture(scope="session")
+def client():
+    migrate()
+
+    from app.main import app
+    from app.utils.api import limiter
+    from app.utils.startup import startup_report
+
+    # every test calls the same routes many times, the limits have nothing to say about it here
+    limiter.enabled = False
+
+    with TestClient(app) as client:
+        deadline = time.monotonic() + 30
+
+        while not startup_report.is_ready and time.monotonic() < deadline:
+            time.sleep(0.05)
+
+        yield client
+
+def login(client: TestClient, email: str, password: str) -> dict:
+    response = client.post("/api/authentication/login", data={"username": email, "password": password})
+    assert response.status_code == 200, response.text
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+@pytest.fixture(scope="session")
+def admin_headers(client) -> dict:
+    return login(client, os.environ["DEFAULT_SYSAD_EMAIL"], os.environ["DEFAULT_SYSAD_PASSWORD"])
+
+@pytest.fixture(scope="session")
+def db_session(client):
+    from app.database import SessionLocal
+
+    with SessionLocal() as db:
+        yield db
+
+def create_accounts(db, role, count: int, *, prefix: str, password: str="x") -> list[int]:
+    """Creates accounts of a role with their profiles and search documents, returns their ids."""
+
+    from app.enums.all import AccountRole
+    from app.models.all import Account, School, Course, SystemAdminProfile, DeanProfile, PesoStaffProfile, CompanyProfile, AlumniProfile
+    from app.utils.search import refresh_search_document
+
+    ids = []
+
+    for i in range(count):
+        # a school or course of its own, so a lazy load per row would show up as a query per row
+        if role == AccountRole.DEAN:
+            school = School(name=f"{prefix} school {i}")
+            db.add(school)
+        elif role == AccountRole.ALUMNI:
+            course = Course(name=f"{prefix} course {i}")
+            db.add(course)
+
+        account = Account(role=role, email=f"{prefix}{i:04d}@mail.com", password=password)
+        db.add(account)
+        db.flush()
+        names = {"account_id": account.id, "first_name": f"{prefix} first", "last_name": f"last {i}"}
+
+        if role == AccountRole.SYSTEM_ADMINISTRATOR:
+            db.add(SystemAdminProfile(**names))
+        elif role == AccountRole.DEAN:
+            db.add(DeanProfile(school_id=school.id, **names))
+        elif role == AccountRole.PESO_STAFF:
+            db.add(PesoStaffProfile(**names))
+        elif role == AccountRole.COMPANY:
+            db.add(CompanyProfile(account_id=account.id, name=f"{prefix} company {i}", **{field: "f.pdf" for field in COMPANY_FILENAME_FIELDS}))
+        elif role == AccountRole.ALUMNI:
+            db.add(AlumniProfile(
+                course_id=course.id,
+                year_graduated=2000 + i % 20,
+                address="Manila",
+                phone_number="0917",
+                profile_picture_filename="p.png",
+                **names
+            ))
+
+        db.flush()
+        refresh_search_document(account)
+        ids.append(account.id)
+
+    db.commit()
+    return ids
+
+@pytest.fixture(scope="session")
+def make_accounts(db_session):
+    return lambda role, count, **kwargs: create_accounts(db_session, role, count, **kwargs)
@@ -0,0 +1,59 @@
+import pytest
+from itertools import count
+
+from app.enums.all import AccountRole
+from app.utils.password import hash_password
+
+from conftest import login
+
+PASSWORD = "caller_pass"
+target_batches = count()
+
+# the callers each bulk route lets through, following the can_enable_or_disable_* checks
+BULK_ROUTES = {
+    "/api/system-admin": (AccountRole.SYSTEM_ADMINISTRATOR, {"default system admin"}),
+    "/api/system-admin/dean": (AccountRole.DEAN, {"default system admin", "system admin"}),
+    "/api/system-admin/peso-staff": (AccountRole.PESO_STAFF, {"default system admin", "system admin"}),
+    "/api/system-admin/company": (AccountRole.COMPANY, {"default system admin", "system admin", "peso staff"}),
+    "/api/system-admin/alumni": (AccountRole.ALUMNI, {"dean"}),
+}
+
+CALLER_ROLES = {
+    "system admin": AccountRole.SYSTEM_ADMINISTRATOR,
+    "dean": AccountRole.DEAN,
+    "peso staff": AccountRole.PESO_STAFF,
+    "company": AccountRole.COMPANY,
+    "alumni": AccountRole.ALUMNI,
+}
+
+@pytest.fixture(scope="session")
+def callers(client, admin_headers, make_accounts) -> dict[str, dict]:
+    password_hash = hash_password(PASSWORD)
+    callers = {"default system admin": admin_headers}
+
+    for name, role in CALLER_ROLES.items():
+        prefix = f"bulkcaller{role.value.lower()}"
+        make_accounts(role, 1, prefix=prefix, password=password_hash)
+        callers[name] = login(client, f"{prefix}0000@mail.com", PASSWORD)
+
+    return callers
+
+@pytest.mark.parametrize("caller", ["default system admin", *CALLER_ROLES])
+@pytest.mark.parametrize("path", BULK_ROUTES)
+def test_bulk_routes_let_through_who_may_change_the_role(client, callers, make_accounts, path, caller):
+    role, allowed_callers = BULK_ROUTES[path]
+    ids = make_accounts(role, 2, prefix=f"bulktarget{next(target_batches)}x")
+    headers = callers[caller]
+
+    response = client.patch(f"{path}/bulk-disable", json={"ids": ids}, headers=headers)
+
+    if caller not in allowed_callers:
+        assert response.status_code == 401, response.text
+        return
+
+    assert response.status_code == 200, response.text
+    assert response.json()["updated"] == 2
+
+    response = client.patch(f"{path}/bulk-enable", json={"ids": ids}, headers=headers)
+    assert response.status_code == 200, response.text
+    assert response.json()["updated"] == 2
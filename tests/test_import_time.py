@@ -0,0 +1,27 @@
+import os
+import sys
+import subprocess
+from pathlib import Path
+
+from app.utils.startup import IMPORT_TIME_BUDGET_MS
+
+# a fresh interpreter, so nothing the other tests imported is already loaded
+IMPORT_APP = "from time import perf_counter; started = perf_counter(); import app.main; print((perf_counter() - started) * 1000)"
+
+def time_app_import() -> float:
+    result = subprocess.run(
+        [sys.executable, "-c", IMPORT_APP],
+        cwd=Path(__file__).parent.parent,
+        env=os.environ.copy(),
+        capture_output=True,
+        text=True,
+        timeout=120
+    )
+    assert result.returncode == 0, result.stderr
+    return float(result.stdout.strip().splitlines()[-1])
+
+def test_app_imports_within_budget():
+    # the first run may still be writing the bytecode caches, the best of a few is the import itself
+    import_ms = min(time_app_import() for _ in range(3))
+
+    assert import_ms <= IMPORT_TIME_BUDGET_MS, f"importing app.main took {import_ms:.0f}ms, over the {IMPORT_TIME_BUDGET_MS}ms budget"
@@ -0,0 +1,96 @@
+import pytest
+from fastapi import HTTPException
+
+from app.enums.all import AccountRole
+from app.models.all import Account
+from app.utils.model import paginate
+
+SIZE = 7
+
+def walk_pages(fetch) -> list[list[int]]:
+    pages, page = [], 1
+
+    while True:
+        items, page_info = fetch(page=page)
+        pages.append(items)
+
+        if not page_info["next_cursor"]:
+            return pages
+
+        page += 1
+
+def walk_cursors(fetch, cursor: str | None=None, *, key: str="next_cursor") -> tuple[list[list[int]], dict]:
+    """Follows the key's cursors to the end, returns the pages and the last page's info."""
+
+    pages = []
+
+    while True:
+        items, page_info = fetch(cursor=cursor)
+        pages.append(items)
+        cursor = page_info[key]
+
+        if not cursor:
+            return pages, page_info
+
+def test_ranked_cursors_follow_page_order(db_session, make_accounts):
+    make_accounts(AccountRole.PESO_STAFF, 40, prefix="ranked")
+    query = db_session.query(Account).filter(Account.email.like("ranked%"))
+    # stands in for the full-text relevance, which needs MySQL: few distinct values, many ties
+    rank = (Account.id * 7) % 5
+
+    def fetch(page: int=1, cursor: str | None=None):
+        _total, items, page_info = paginate(
+            query,
+            page=page,
+            size=SIZE,
+            distinct_col=Account.id,
+            order_cols=(Account.created_at, Account.id),
+            cursor=cursor,
+            rank=rank
+        )
+        return [item.id for item in items], page_info
+
+    by_page = walk_pages(fetch)
+    by_cursor, last_page_info = walk_cursors(fetch)
+    ids = sum(by_page, [])
+
+    assert by_cursor == by_page
+    assert ids == sorted(ids, key=lambda id: (-(id * 7 % 5), id))
+    assert len(set(ids)) == 40
+
+    # and back from the last page
+    backwards, _page_info = walk_cursors(fetch, last_page_info["prev_cursor"], key="prev_cursor")
+    assert list(reversed(backwards)) == by_page[:-1]
+
+def test_search_cursors_follow_page_order(client, admin_headers, make_accounts):
+    make_accounts(AccountRole.PESO_STAFF, 65, prefix="walker")
+
+    def fetch(page: int=1, cursor: str | None=None):
+        params = {"search": "walker", "size": 20, **({"cursor": cursor} if cursor else {"page": page})}
+        response = client.get("/api/system-admin/peso-staff", params=params, headers=admin_headers)
+        assert response.status_code == 200, response.text
+        body = response.json()
+        return [item["id"] for item in body["items"]], body
+
+    by_page = walk_pages(fetch)
+
+    assert walk_cursors(fetch)[0] == by_page
+    assert len(sum(by_page, [])) == 65
+
+def test_cursor_of_another_ordering_is_refused(db_session):
+    query = db_session.query(Account)
+    _total, _items, page_info = paginate(query, page=1, size=1, distinct_col=Account.id, order_cols=(Account.created_at, Account.id))
+
+    # an unranked cursor used on a ranked search has a value missing
+    with pytest.raises(HTTPException) as error:
+        paginate(
+            query,
+            page=1,
+            size=1,
+            distinct_col=Account.id,
+            order_cols=(Account.created_at, Account.id),
+            cursor=page_info["next_cursor"],
+            rank=Account.id % 3
+        )
+
+    assert error.value.status_code == 400
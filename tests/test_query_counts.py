@@ -0,0 +1,76 @@
+import pytest
+from sqlalchemy import event
+
+from app.enums.all import AccountRole
+from app.models.all import School
+from app.database import engine, async_engine
+
+SMALL, LARGE = 30, 100
+
+LIST_ROUTES = {
+    "/api/system-admin/": AccountRole.SYSTEM_ADMINISTRATOR,
+    "/api/system-admin/dean": AccountRole.DEAN,
+    "/api/system-admin/peso-staff": AccountRole.PESO_STAFF,
+    "/api/system-admin/company": AccountRole.COMPANY,
+    "/api/system-admin/alumni": AccountRole.ALUMNI,
+    "/api/system-admin/school": None,
+}
+
+class StatementCounter:
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, *args, **kwargs) -> None:
+        self.count += 1
+
+@pytest.fixture
+def statements():
+    counter = StatementCounter()
+    engines = (engine, async_engine.sync_engine)
+
+    for counted_engine in engines:
+        event.listen(counted_engine, "before_cursor_execute", counter)
+
+    yield counter
+
+    for counted_engine in engines:
+        event.remove(counted_engine, "before_cursor_execute", counter)
+
+def seed(db_session, make_accounts, role: AccountRole | None, count: int, prefix: str) -> None:
+    if role is not None:
+        make_accounts(role, count, prefix=prefix)
+        return
+
+    db_session.add_all(School(name=f"{prefix} school {i}") for i in range(count))
+    db_session.commit()
+
+def count_statements(client, headers, statements, path: str, **params) -> tuple[int, dict]:
+    statements.count = 0
+    response = client.get(path, params=params, headers=headers)
+    assert response.status_code == 200, response.text
+    return statements.count, response.json()
+
+@pytest.mark.parametrize("path", LIST_ROUTES)
+def test_list_queries_dont_grow_with_rows(client, admin_headers, db_session, make_accounts, statements, path):
+    role = LIST_ROUTES[path]
+    # searched by a prefix of their own, so the rows other tests made don't count
+    name = path.rstrip("/").rsplit("/", 1)[-1].replace("-", "")
+    small, large = f"qsmall{name}", f"qlarge{name}"
+    seed(db_session, make_accounts, role, SMALL, small)
+    seed(db_session, make_accounts, role, LARGE, large)
+
+    # the first request of a token looks its principal up, a one-off that isn't the listing's
+    client.get(path, params={"size": 20}, headers=admin_headers)
+    counts = {}
+
+    for prefix, rows in ((small, SMALL), (large, LARGE)):
+        page_count, body = count_statements(client, admin_headers, statements, path, search=prefix, size=100)
+        assert len(body["items"]) == rows
+
+        first_page = client.get(path, params={"search": prefix, "size": 20}, headers=admin_headers).json()
+        cursor_count, body = count_statements(client, admin_headers, statements, path, search=prefix, size=100, cursor=first_page["next_cursor"])
+        assert len(body["items"]) == rows - 20
+
+        counts[rows] = (page_count, cursor_count)
+
+    assert counts[SMALL] == counts[LARGE]
@@ -0,0 +1,17 @@
+from app.enums.all import AccountRole
+
+def get_page(client, headers, search: str) -> dict:
+    response = client.get("/api/system-admin/peso-staff", params={"search": search, "size": 20}, headers=headers)
+    assert response.status_code == 200, response.text
+    return response.json()
+
+def test_searches_with_the_same_words_keep_their_own_totals(client, admin_headers, make_accounts):
+    make_accounts(AccountRole.PESO_STAFF, 12, prefix="totals")
+
+    # an email prefix match: no email starts with it
+    by_email = get_page(client, admin_headers, "totals000@mail.com")
+    # the same words as text: totals0000@mail.com to totals0009@mail.com contain them
+    by_words = get_page(client, admin_headers, "totals000 mail com")
+
+    assert (by_email["total"], len(by_email["items"])) == (0, 0)
+    assert (by_words["total"], len(by_words["items"])) == (10, 10)